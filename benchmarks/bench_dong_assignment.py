@@ -0,0 +1,78 @@
+"""
+공간조인 결과 반영 방식 벤치마크
+- 기존: 병원마다 joined[joined["id"] == hospital.id] 전체 스캔 (O(N²))
+- 개선: 조인 결과를 병원 ID로 한 번 인덱싱 후 일괄 반영 (O(N))
+
+실행: python -m benchmarks.bench_dong_assignment
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.domain.entity import VetHospital
+from src.usecase.dong_assignment import assign_dong_info
+
+SIZES = [1_000, 10_000, 100_000]
+# 기존 방식은 너무 느리므로 최대 이 개수만 실측하고 전체 시간은 선형 외삽
+LEGACY_SAMPLE = 1_000
+
+
+def make_synthetic_data(n, seed=0):
+    """합성 병원 목록과 공간조인 결과 생성"""
+    rng = np.random.default_rng(seed)
+    ids = [str(10_000_000 + i) for i in range(n)]
+    dong_codes = rng.integers(2611010100, 2671025000, size=n).astype(str)
+    hospitals = [
+        VetHospital(
+            id=hospital_id,
+            name=f"동물병원{i}",
+            address="부산광역시",
+            latitude=35.1,
+            longitude=129.0
+        )
+        for i, hospital_id in enumerate(ids)
+    ]
+    joined = pd.DataFrame({
+        "id": ids,
+        "ADM_CD": dong_codes,
+        "ADM_NM": [f"동{code[-4:]}" for code in dong_codes]
+    })
+    return hospitals, joined
+
+
+def legacy_assign(hospitals, joined):
+    """기존 방식: 병원마다 조인 결과 전체 boolean mask 스캔"""
+    for hospital in hospitals:
+        hospital_joined = joined[joined["id"] == hospital.id]
+        if not hospital_joined.empty:
+            hospital.dong_code = hospital_joined.iloc[0].get("ADM_CD")
+            hospital.dong_name = hospital_joined.iloc[0].get("ADM_NM")
+
+
+def main():
+    print(f"{'병원 수':>10} | {'기존(초)':>12} | {'개선(초)':>10} | {'속도 향상':>10}")
+    print("-" * 52)
+    for n in SIZES:
+        hospitals, joined = make_synthetic_data(n)
+
+        sample = hospitals[:min(n, LEGACY_SAMPLE)]
+        start = time.perf_counter()
+        legacy_assign(sample, joined)
+        legacy_seconds = (time.perf_counter() - start) * (n / len(sample))
+
+        start = time.perf_counter()
+        assign_dong_info(hospitals, joined)
+        indexed_seconds = time.perf_counter() - start
+
+        # 두 방식의 결과가 같은지 확인
+        assert all(h.dong_code == joined["ADM_CD"].iloc[i] for i, h in enumerate(sample))
+
+        estimated = "*" if len(sample) < n else " "
+        print(f"{n:>10,} | {legacy_seconds:>11.3f}{estimated} | {indexed_seconds:>10.3f} | "
+              f"{legacy_seconds / indexed_seconds:>9.0f}x")
+    print(f"\n* 기존 방식은 {LEGACY_SAMPLE:,}건만 실측 후 선형 외삽한 값")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+시설 데이터 표현 방식 벤치마크
+- 기존: 시설마다 dict를 만들고 필요할 때마다 DataFrame/GeoDataFrame으로 변환
+- 개선: 열 단위 FacilityTable (NumPy 배열)에서 GeoDataFrame으로 변환
+
+실행: python -m benchmarks.bench_facility_table
+"""
+import time
+import tracemalloc
+
+import geopandas as gpd
+import numpy as np
+from shapely.geometry import Point
+
+from src.domain.facility_table import FacilityTable
+
+SIZES = [10_000, 100_000, 300_000]
+
+
+def make_documents(n, seed=0):
+    """합성 카카오 장소 검색 결과 생성"""
+    rng = np.random.default_rng(seed)
+    xs = rng.uniform(128.8, 129.3, size=n)
+    ys = rng.uniform(34.9, 35.4, size=n)
+    return [
+        {"id": str(i), "place_name": f"장소{i}", "x": f"{x:.7f}", "y": f"{y:.7f}"}
+        for i, (x, y) in enumerate(zip(xs, ys))
+    ]
+
+
+def legacy_convert(documents):
+    """기존 방식: dict 목록 생성 후 행 단위 Point로 GeoDataFrame 생성"""
+    facilities = [
+        {"name": doc.get("place_name", ""), "x": float(doc.get("x", 0)), "y": float(doc.get("y", 0)), "type": "공원"}
+        for doc in documents
+    ]
+    return facilities, gpd.GeoDataFrame(
+        facilities, geometry=[Point(f["x"], f["y"]) for f in facilities], crs="EPSG:4326"
+    )
+
+
+def columnar_convert(documents):
+    """개선 방식: 열 배열 생성 후 GeoDataFrame 변환"""
+    table = FacilityTable.from_kakao_documents(documents, "공원")
+    return table, table.to_geodataframe()
+
+
+def measure(func, documents):
+    """실행 시간(초)과 최대 추가 메모리(MB) 측정 (tracemalloc 부하가 시간에 섞이지 않도록 따로 실행)"""
+    start = time.perf_counter()
+    func(documents)
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    func(documents)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak / 1024 / 1024
+
+
+def main():
+    print(f"{'시설 수':>10} | {'기존(초)':>9} | {'개선(초)':>9} | {'기존(MB)':>9} | {'개선(MB)':>9}")
+    print("-" * 60)
+    for n in SIZES:
+        documents = make_documents(n)
+        legacy_seconds, legacy_mb = measure(legacy_convert, documents)
+        columnar_seconds, columnar_mb = measure(columnar_convert, documents)
+        print(f"{n:>10,} | {legacy_seconds:>9.3f} | {columnar_seconds:>9.3f} | "
+              f"{legacy_mb:>9.1f} | {columnar_mb:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
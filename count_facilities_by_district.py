@@ -1,143 +1,308 @@
+import argparse
 import json
 import csv
 import os
+import numpy as np
 import pandas as pd
+import shapely
+from shapely import STRtree
 from shapely.geometry import Point, shape
-from pyproj import Transformer
+
+from src.domain.facility_table import FacilityTable
+from src.infrastructure.coordinates import normalize_coordinate_columns
+from src.infrastructure.geometry_cache import get_geometry_cache
+from src.infrastructure.place_snapshot import PlaceDiff, apply_diff_to_counts
+
+FACILITY_TYPES = ['동물병원', '애견카페', '공원']
 
 def load_geojson(file_path):
     """행정동 GeoJSON 파일 로드"""
     with open(file_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
-def count_facilities_by_district(geojson_data, facilities, district_name_field='ADM_NM'):
+def _prepare_districts(geojson_data, district_name_field='ADM_NM', district_code_field='ADM_CD',
+                       geometry_source=None):
+    """
+    행정동 이름/코드, prepared 폴리곤 배열, STRtree 준비 (폴리곤 내용 기준으로 캐시 재사용)
+    
+    코드 필드가 없는 행정동은 이름 대신 GeoJSON 순서 인덱스를 코드로 사용하므로
+    이름이 같은 서로 다른 행정동(예: 해운대구/강서구 송정동)도 구분됩니다.
+    
+    Returns:
+        (이름 배열, 코드 배열, prepared 폴리곤 배열, STRtree)
+    """
+    geometry_cache = get_geometry_cache(geometry_source or "default")
+    names, codes = [], []
+    for i, feature in enumerate(geojson_data['features']):
+        properties = feature['properties']
+        names.append(properties.get(district_name_field, '알 수 없음'))
+        code = properties.get(district_code_field) if district_code_field else None
+        codes.append(code if code is not None else i)
+    geometries = geometry_cache.prepare_many(shape(feature['geometry']) for feature in geojson_data['features'])
+    return np.array(names, dtype=object), np.array(codes, dtype=object), geometries, STRtree(geometries)
+
+def locate_districts(geojson_data, facilities, district_name_field='ADM_NM',
+                     geometry_source=None, district_code_field='ADM_CD'):
+    """
+    시설 테이블의 모든 좌표가 속한 행정동을 한 번에 찾기
+    
+    Args:
+        geojson_data: 행정동 경계 GeoJSON 데이터
+        facilities: 시설 테이블 (FacilityTable)
+        district_name_field: GeoJSON에서 행정동 이름이 저장된 필드명
+        geometry_source: prepared 폴리곤 캐시를 공유할 경계 데이터 출처 (없으면 기본 캐시)
+        district_code_field: 행정동별 고유 코드 필드명 (없는 행정동은 GeoJSON 순서 인덱스 사용)
+    
+    Returns:
+        FacilityTable: 행정동 코드/이름 열이 채워진 시설 테이블 (경계 밖이면 None)
+    """
+    names, codes, geometries, tree = _prepare_districts(geojson_data, district_name_field,
+                                                        district_code_field, geometry_source)
+    return _with_districts(facilities, _district_indices(geometries, tree, facilities), names, codes)
+
+def _district_indices(geometries, tree, facilities):
+    """
+    시설별로 포함하는 행정동의 GeoJSON 순서 인덱스 (경계 밖이면 -1)
+    
+    bbox 후보를 STRtree로 한 번에 구한 뒤 prepared 폴리곤으로 포함 여부를 일괄 확인하며,
+    여러 행정동에 걸치는 경우 GeoJSON 순서상 첫 행정동을 선택합니다.
+    """
+    district_of = np.full(len(facilities), -1, dtype=np.int64)
+    if len(facilities) == 0:
+        return district_of
+    
+    points = facilities.points()
+    point_idx, district_idx = tree.query(points)
+    hit = shapely.contains(geometries[district_idx], points[point_idx])
+    point_idx, district_idx = point_idx[hit], district_idx[hit]
+    
+    order = np.lexsort((district_idx, point_idx))
+    point_idx, district_idx = point_idx[order], district_idx[order]
+    first = np.unique(point_idx, return_index=True)[1]
+    district_of[point_idx[first]] = district_idx[first]
+    return district_of
+
+def _with_districts(facilities, district_of, names, codes):
+    """행정동 인덱스 배열로 행정동 코드/이름 열을 채운 시설 테이블"""
+    inside = district_of >= 0
+    dong_codes = np.full(len(facilities), None, dtype=object)
+    dong_names = np.full(len(facilities), None, dtype=object)
+    dong_codes[inside] = codes[district_of[inside]]
+    dong_names[inside] = names[district_of[inside]]
+    return facilities.with_dongs(dong_codes, dong_names)
+
+def count_all_facilities_by_district(geojson_data, facilities, facility_types=FACILITY_TYPES,
+                                     district_name_field='ADM_NM',
+                                     geometry_source=None):
+    """
+    모든 시설 유형의 행정동별 개수를 한 번에 계산
+    
+    행정동 인덱스(STRtree + prepared 폴리곤)를 한 번만 만들고, 모든 유형의 시설을 이어 붙여
+    한 번의 일괄 조회로 소속 행정동을 찾은 뒤 (행정동 x 시설 유형) 개수 행렬을 만듭니다.
+    
+    Args:
+        geojson_data: 행정동 경계 GeoJSON 데이터
+        facilities: 시설 테이블 (FacilityTable) 또는 시설 테이블 목록 (types 열로 유형 구분)
+        facility_types: 개수 행렬의 열 순서 (이 목록에 없는 유형은 집계하지 않음)
+        district_name_field: GeoJSON에서 행정동 이름이 저장된 필드명
+        geometry_source: prepared 폴리곤 캐시를 공유할 경계 데이터 출처 (없으면 기본 캐시)
+    
+    Returns:
+        (행정동 이름을 인덱스로 한 유형별 개수 DataFrame (GeoJSON 순서, 같은 이름은 합산),
+         행정동이 채워진 전체 시설 테이블 (입력 순서))
+    """
+    table = facilities if isinstance(facilities, FacilityTable) else FacilityTable.concat(list(facilities))
+    names, codes, geometries, tree = _prepare_districts(geojson_data, district_name_field,
+                                                        geometry_source=geometry_source)
+    district_of = _district_indices(geometries, tree, table)
+    
+    # 유형을 열 번호로 바꿔 (행정동, 유형) 쌍별 개수를 한 번에 누적
+    type_of = pd.Categorical(table.types, categories=list(facility_types)).codes
+    counted = (district_of >= 0) & (type_of >= 0)
+    matrix = np.zeros((len(names), len(facility_types)), dtype=np.int64)
+    np.add.at(matrix, (district_of[counted], type_of[counted]), 1)
+    
+    counts = pd.DataFrame(matrix, index=pd.Index(names, name='행정동'), columns=list(facility_types))
+    counts = counts.groupby(level=0, sort=False).sum()
+    return counts, _with_districts(table, district_of, names, codes)
+
+def count_facilities_by_district(geojson_data, facilities, district_name_field='ADM_NM',
+                                 geometry_source=None):
     """
     각 행정동별 시설 개수 계산
     
     Args:
         geojson_data: 행정동 경계 GeoJSON 데이터
-        facilities: 시설 목록 (각 항목은 name, x, y 필드를 포함한 dict)
+        facilities: 시설 테이블 (FacilityTable) 또는 시설 목록 (각 항목은 name, x, y 필드를 포함한 dict)
         district_name_field: GeoJSON에서 행정동 이름이 저장된 필드명
+        geometry_source: prepared 폴리곤 캐시를 공유할 경계 데이터 출처 (없으면 기본 캐시)
         
     Returns:
-        dict: 행정동별 시설 개수
+        (행정동별 시설 개수 dict, 행정동이 채워진 시설 테이블)
+        시설 목록을 넘긴 경우 두 번째 값은 'district' 필드가 추가된 dict 목록
     """
-    district_count = {}
-    
-    # 각 행정동의 폴리곤 객체와 이름 준비
-    districts = []
-    for feature in geojson_data['features']:
-        district_name = feature['properties'].get(district_name_field, '알 수 없음')
-        district_geom = shape(feature['geometry'])
-        districts.append((district_name, district_geom))
-        
-        # 결과 딕셔너리 초기화
-        if district_name not in district_count:
-            district_count[district_name] = 0
-    
-    # 각 시설이 어느 행정동에 속하는지 확인
-    facilities_with_district = []
-    for facility in facilities:
-        x, y = float(facility.get('x', 0)), float(facility.get('y', 0))
-        point = Point(x, y)
-        
-        district_found = False
-        for district_name, district_geom in districts:
-            if district_geom.contains(point):
-                district_count[district_name] += 1
-                facilities_with_district.append({
-                    **facility,
-                    'district': district_name
-                })
-                district_found = True
-                break
-        
-        # 어떤 행정동에도 속하지 않는 경우
-        if not district_found:
-            facilities_with_district.append({
-                **facility,
-                'district': '경계 외'
-            })
+    table = facilities
+    if not isinstance(facilities, FacilityTable):
+        table = FacilityTable.from_records(facilities)
+    
+    located = locate_districts(geojson_data, table, district_name_field, geometry_source)
+    district_count = {name: 0 for name in _district_names(geojson_data, district_name_field)}
+    district_count.update(located.count_by('dong_name'))
+    
+    if isinstance(facilities, FacilityTable):
+        return district_count, located
     
+    facilities_with_district = [
+        {**facility, 'district': district if district is not None else '경계 외'}
+        for facility, district in zip(facilities, located.dong_names)
+    ]
     return district_count, facilities_with_district
 
-def main():
-    # 행정동 경계 데이터 로드
-    busan_geojson = load_geojson('data/busan_emd_wgs84.geojson')
+def _district_names(geojson_data, district_name_field='ADM_NM'):
+    """GeoJSON 순서대로 행정동 이름 목록"""
+    return [feature['properties'].get(district_name_field, '알 수 없음') for feature in geojson_data['features']]
+
+def build_district_locator(geojson_data, district_name_field='ADM_NM',
+                           geometry_source=None):
+    """
+    좌표 -> 행정동 이름 조회 함수 생성 (STRtree + prepared 폴리곤)
     
-    # 동물병원 데이터 로드 및 좌표 변환
-    vet_hospitals = []
-    df = pd.read_csv('data/vet_hospitals_busan.csv')
+    Args:
+        geojson_data: 행정동 경계 GeoJSON 데이터
+        district_name_field: GeoJSON에서 행정동 이름이 저장된 필드명
+        geometry_source: prepared 폴리곤 캐시를 공유할 경계 데이터 출처 (없으면 기본 캐시)
     
-    # 좌표 결측치 및 이상치 제거
-    x_col = '좌표정보x(epsg5174)'
-    y_col = '좌표정보y(epsg5174)'
-    df = df[df[x_col].notnull() & df[y_col].notnull()]
-    df = df[(df[x_col] != '') & (df[y_col] != '')]
+    Returns:
+        (경도, 위도) -> 행정동 이름 (경계 밖이면 None)
+    """
+    names, _, geometries, tree = _prepare_districts(geojson_data, district_name_field,
+                                                    geometry_source=geometry_source)
     
-    # 좌표를 float로 변환
-    df[x_col] = df[x_col].astype(float)
-    df[y_col] = df[y_col].astype(float)
+    def locate(x, y):
+        point = Point(float(x), float(y))
+        for idx in sorted(tree.query(point)):
+            if geometries[idx].contains(point):
+                return names[idx]
+        return None
     
-    # UTM-K(EPSG:5174) → WGS84(경위도) 변환
-    transformer = Transformer.from_crs("epsg:5174", "epsg:4326", always_xy=True)
+    return locate
+
+def load_place_diff(diff_file):
+    """<출력 파일>_diff.json으로 저장된 장소 변경 내역 로드"""
+    with open(diff_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return PlaceDiff(
+        added=data.get('added', []),
+        removed=data.get('removed', []),
+        moved=[(item['before'], item['after']) for item in data.get('moved', [])]
+    )
+
+def write_district_data_js(district_data, js_file='output/district_data.js',
+                           comment='행정동별 시설 데이터 (필터링된 데이터 기준)'):
+    """행정동별 시설 데이터를 generate_district_data.py와 같은 JavaScript 배열 형식으로 저장"""
+    js_array = []
+    for row in district_data:
+        js_array.append(f"    {{ district: '{row['district']}', hospital: {row['동물병원']}, cafe: {row['애견카페']}, park: {row['공원']} }}")
     
-    for _, row in df.iterrows():
-        lng, lat = transformer.transform(row[x_col], row[y_col])
-        vet_hospitals.append({
-            'name': row.get('사업장명', ''),
-            'x': lng,  # 경도
-            'y': lat,  # 위도
-            'type': '동물병원'
-        })
+    with open(js_file, 'w', encoding='utf-8') as f:
+        f.write(f"// {comment}\n")
+        f.write("const districtData = [\n")
+        f.write(",\n".join(js_array))
+        f.write("\n];")
+
+def apply_place_diff(diff, facility_type, locate,
+                     counts_csv='output/district_facility_counts_all.csv',
+                     district_json='output/district_data.json',
+                     district_js='output/district_data.js'):
+    """
+    장소 변경 내역을 행정동별 집계 결과에 증분 반영 (변경된 장소가 속한 행정동만 갱신)
+    
+    Args:
+        diff: 장소 변경 내역 (PlaceDiff)
+        facility_type: 시설 유형 ('동물병원', '애견카페', '공원')
+        locate: (경도, 위도) -> 행정동 이름 함수 (build_district_locator 결과)
+        counts_csv: 행정동별 시설 개수 CSV (없으면 건너뜀)
+        district_json: 행정동별 시설 데이터 JSON (없으면 건너뜀)
+        district_js: 행정동별 시설 데이터 JavaScript (JSON을 갱신한 경우 함께 갱신)
+    
+    Returns:
+        dict: 영향을 받은 행정동별 개수 변화량
+    """
+    if facility_type not in FACILITY_TYPES:
+        raise ValueError(f"지원하지 않는 시설 유형입니다: {facility_type}")
+    
+    deltas = apply_diff_to_counts({}, diff, locate)
+    if not deltas:
+        print("변경된 행정동이 없습니다.")
+        return deltas
+    
+    if os.path.exists(counts_csv):
+        with open(counts_csv, 'r', encoding='utf-8', newline='') as f:
+            rows = {row['행정동']: row for row in csv.DictReader(f)}
+        for district, delta in deltas.items():
+            row = rows.setdefault(district, {'행정동': district, **{t: 0 for t in FACILITY_TYPES}})
+            row[facility_type] = max(0, int(row[facility_type]) + delta)
+            row['총합'] = sum(int(row[t]) for t in FACILITY_TYPES)
+        results = sorted(rows.values(), key=lambda x: int(x['총합']), reverse=True)
+        with open(counts_csv, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=['행정동'] + FACILITY_TYPES + ['총합'])
+            writer.writeheader()
+            writer.writerows(results)
+    
+    if os.path.exists(district_json):
+        with open(district_json, 'r', encoding='utf-8') as f:
+            district_data = json.load(f)
+        records = {row['district']: row for row in district_data}
+        for district, delta in deltas.items():
+            row = records.get(district)
+            if row is None:
+                row = {'district': district, **{t: 0 for t in FACILITY_TYPES}}
+                district_data.append(row)
+                records[district] = row
+            row[facility_type] = max(0, row[facility_type] + delta)
+        district_data.sort(key=lambda x: sum(x[t] for t in FACILITY_TYPES), reverse=True)
+        with open(district_json, 'w', encoding='utf-8') as f:
+            json.dump(district_data, f, ensure_ascii=False, indent=2)
+        write_district_data_js(district_data, district_js)
+    
+    print(f"{facility_type} 변경 내역({diff.summary()}) 반영: {len(deltas)}개 행정동 갱신")
+    return deltas
+
+def main():
+    # 행정동 경계 데이터 로드
+    busan_geojson = load_geojson('data/busan_emd_wgs84.geojson')
+    
+    # 동물병원 데이터 로드 및 좌표 변환 (UTM-K(EPSG:5174) → WGS84(경위도), 열 단위 일괄 변환)
+    df = normalize_coordinate_columns(pd.read_csv('data/vet_hospitals_busan.csv'))
+    vet_hospitals = FacilityTable.from_dataframe(df, '동물병원')
     
     # 애견카페 데이터 로드
-    dog_cafes = []
+    dog_cafes = FacilityTable.empty()
     try:
         with open('data/busan_dog_cafes_all.json', 'r', encoding='utf-8') as f:
-            dog_cafes_data = json.load(f)
-            for cafe in dog_cafes_data:
-                dog_cafes.append({
-                    'name': cafe.get('place_name', ''),
-                    'x': float(cafe.get('x', 0)),
-                    'y': float(cafe.get('y', 0)),
-                    'type': '애견카페'
-                })
+            dog_cafes = FacilityTable.from_kakao_documents(json.load(f), '애견카페')
     except Exception as e:
         print(f"애견카페 데이터 로드 중 오류: {e}")
     
     # 공원 데이터 로드
-    parks = []
+    parks = FacilityTable.empty()
     try:
         with open('data/busan_parks_all.json', 'r', encoding='utf-8') as f:
-            parks_data = json.load(f)
-            for park in parks_data:
-                parks.append({
-                    'name': park.get('place_name', ''),
-                    'x': float(park.get('x', 0)),
-                    'y': float(park.get('y', 0)),
-                    'type': '공원'
-                })
+            parks = FacilityTable.from_kakao_documents(json.load(f), '공원')
     except Exception as e:
         print(f"공원 데이터 로드 중 오류: {e}")
     
-    # 각 시설 유형별 행정동 카운트
-    hospital_counts, hospitals_with_district = count_facilities_by_district(busan_geojson, vet_hospitals)
-    cafe_counts, cafes_with_district = count_facilities_by_district(busan_geojson, dog_cafes)
-    park_counts, parks_with_district = count_facilities_by_district(busan_geojson, parks)
-    
-    # 결과를 병합하여 모든 행정동과 시설 유형별 개수 생성
-    all_districts = set(hospital_counts.keys()) | set(cafe_counts.keys()) | set(park_counts.keys())
+    # 모든 시설 유형의 행정동을 한 번에 찾고 (행정동 x 유형) 개수 행렬 생성
+    counts, facilities_with_district = count_all_facilities_by_district(
+        busan_geojson, [vet_hospitals, dog_cafes, parks]
+    )
+    counts = counts.sort_index()
+    counts['총합'] = counts[FACILITY_TYPES].sum(axis=1)
     
-    results = []
-    for district in sorted(all_districts):
-        results.append({
-            '행정동': district,
-            '동물병원': hospital_counts.get(district, 0),
-            '애견카페': cafe_counts.get(district, 0),
-            '공원': park_counts.get(district, 0),
-            '총합': hospital_counts.get(district, 0) + cafe_counts.get(district, 0) + park_counts.get(district, 0)
-        })
+    results = [
+        {'행정동': district, **{column: int(value) for column, value in row.items()}}
+        for district, row in zip(counts.index, counts.to_dict('records'))
+    ]
     
     # 시설 수 합계를 기준으로 내림차순 정렬
     results.sort(key=lambda x: x['총합'], reverse=True)
@@ -150,7 +315,7 @@ def main():
         writer.writerows(results)
     
     # 시설별 소속 행정동 정보도 저장
-    all_facilities = hospitals_with_district + cafes_with_district + parks_with_district
+    all_facilities = facilities_with_district.to_records()
     with open('output/facilities_with_district.csv', 'w', encoding='utf-8', newline='') as f:
         if all_facilities:
             writer = csv.DictWriter(f, fieldnames=['name', 'x', 'y', 'type', 'district'])
@@ -163,4 +328,15 @@ def main():
     return results
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="행정동별 시설 개수 분석")
+    parser.add_argument("--apply-diff", metavar="DIFF_JSON",
+                        help="전체 재계산 대신 장소 변경 내역(_diff.json)을 변경된 행정동에만 반영")
+    parser.add_argument("--type", choices=FACILITY_TYPES, help="변경 내역의 시설 유형")
+    args = parser.parse_args()
+    if args.apply_diff:
+        if not args.type:
+            parser.error("--apply-diff에는 --type이 필요합니다.")
+        locate = build_district_locator(load_geojson('data/busan_emd_wgs84.geojson'))
+        apply_place_diff(load_place_diff(args.apply_diff), args.type, locate)
+    else:
+        main()
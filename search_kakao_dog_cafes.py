@@ -2,18 +2,25 @@
 카카오맵 API를 사용하여 "부산 애견카페" 키워드로 검색하고 결과를 JSON으로 저장
 - 출력: data/busan_dog_cafes.json
 """
+import argparse
 import os
 import json
 import requests
 from dotenv import load_dotenv
 
-def search_kakao_places(query, api_key=None):
+from src.infrastructure.place_snapshot import PlaceSnapshot, diff_places
+
+SNAPSHOT_PATH = os.path.join('data', 'cache', 'snapshots', 'busan_dog_cafes.snapshot.json')
+
+def search_kakao_places(query, api_key=None, snapshot=None):
     """
     카카오맵 API로 장소 검색
     
     Args:
         query: 검색어 (예: "부산 애견카페")
         api_key: 카카오 REST API 키 (없으면 환경변수에서 가져옴)
+        snapshot: 이전 갱신 스냅샷 (PlaceSnapshot), 첫 페이지의 total_count가 이전과 같으면
+            나머지 페이지를 조회하지 않고 이전 결과를 재사용하며 검색 후 스냅샷을 갱신
     
     Returns:
         검색 결과 목록
@@ -33,6 +40,8 @@ def search_kakao_places(query, api_key=None):
     
     # 검색 결과를 담을 리스트
     all_places = []
+    total_count = None
+    known = snapshot.known_tiles().get(query) if snapshot is not None else None
     
     # 페이지 반복 요청 (최대 3페이지, 총 45개 결과)
     for page in range(1, 4):
@@ -58,19 +67,34 @@ def search_kakao_places(query, api_key=None):
             
             # 마지막 페이지인 경우
             meta = data.get('meta', {})
+            if page == 1:
+                total_count = meta.get('total_count')
             if page >= meta.get('pageable_count', 0) / 15:
                 break
+            
+            # 이전 갱신과 결과 수가 같으면 나머지 페이지는 이전 결과 재사용
+            if page == 1:
+                if known is not None and known[0] == total_count:
+                    print(f"'{query}' 결과 수({total_count})가 이전과 같아 나머지 페이지를 재사용합니다.")
+                    all_places = list(known[1])
+                    break
                 
         except Exception as e:
             print(f"API 요청 오류: {e}")
             break
     
+    if snapshot is not None and all_places:
+        tiles = {key: value for key, value in snapshot.known_tiles().items() if key != query}
+        tiles[query] = (total_count if total_count is not None else len(all_places), all_places)
+        snapshot.update([p for _, docs in tiles.values() for p in docs], tiles)
+    
     return all_places
 
-def main():
+def main(incremental=False):
     # 검색 실행
     print("카카오맵 API로 '부산 애견카페' 검색 중...")
-    places = search_kakao_places("부산 애견카페")
+    snapshot = PlaceSnapshot.load(SNAPSHOT_PATH) if incremental else None
+    places = search_kakao_places("부산 애견카페", snapshot=snapshot)
     
     if not places:
         print("검색 결과가 없거나 API 키가 설정되지 않았습니다.")
@@ -83,6 +107,17 @@ def main():
     
     # 결과를 JSON 파일로 저장
     output_file = 'data/busan_dog_cafes.json'
+    if snapshot is not None:
+        snapshot.save(SNAPSHOT_PATH)
+        previous = {}
+        if os.path.exists(output_file):
+            with open(output_file, 'r', encoding='utf-8') as f:
+                previous = {p['id']: p for p in json.load(f) if p.get('id')}
+        diff = diff_places(previous, {p['id']: p for p in places if p.get('id')})
+        with open('data/busan_dog_cafes_diff.json', 'w', encoding='utf-8') as f:
+            json.dump(diff.to_dict(), f, ensure_ascii=False, indent=2)
+        print(f"변경 내역({diff.summary()})이 data/busan_dog_cafes_diff.json에 저장되었습니다.")
+    
     with open(output_file, 'w', encoding='utf-8') as f:
         json.dump(places, f, ensure_ascii=False, indent=2)
     
@@ -96,4 +131,7 @@ def main():
         print(f"...외 {len(places) - 5}개")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="카카오맵 '부산 애견카페' 검색")
+    parser.add_argument("--incremental", action="store_true",
+                        help="이전 결과와 수가 같으면 나머지 페이지를 재사용하고 변경 내역 저장")
+    main(incremental=parser.parse_args().incremental)
@@ -3,14 +3,89 @@
 - rect 파라미터를 활용한 영역 분할 검색
 - 재귀적으로 영역을 4등분하여 모든 결과 수집
 """
+import argparse
 import os
 import json
-import requests
 import time
 import sys
 import re
 
-def search_kakao_places_by_rect(keyword, start_x, start_y, end_x, end_y, api_key):
+from shapely.geometry import shape
+from shapely.ops import unary_union
+
+from src.infrastructure.http_client import PooledHttpClient
+from src.infrastructure.place_snapshot import PlaceSnapshot, diff_places
+from src.infrastructure.rate_limiter import TokenBucketRateLimiter
+from src.infrastructure.rect_planner import QuadtreeRectPlanner
+from src.infrastructure.response_cache import ResponseCache
+
+KAKAO_KEYWORD_URL = "https://dapi.kakao.com/v2/local/search/keyword.json"
+
+# 영역 검색 응답 캐시와 HTTP 클라이언트 (처음 사용할 때 생성)
+_default_cache = None
+_default_http_client = None
+
+def get_default_cache():
+    """영역 검색에 기본으로 사용하는 응답 캐시 반환"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ResponseCache()
+    return _default_cache
+
+def get_default_http_client():
+    """영역 검색에 기본으로 사용하는 HTTP 클라이언트 반환 (커넥션 풀 재사용, 타임아웃, 429/5xx 재시도)"""
+    global _default_http_client
+    if _default_http_client is None:
+        _default_http_client = PooledHttpClient()
+    return _default_http_client
+
+def fetch_rect_page(keyword, rect, page_num, api_key, cache=None, use_cache=True, rate_limiter=None,
+                    http_client=None):
+    """
+    영역 검색 한 페이지 조회 (캐시에 있으면 API를 호출하지 않음)
+    
+    Args:
+        keyword: 검색어
+        rect: 검색 영역 (start_x, start_y, end_x, end_y)
+        page_num: 페이지 번호
+        api_key: 카카오 REST API 키
+        cache: 응답 캐시 (없으면 기본 캐시)
+        use_cache: False이면 캐시를 사용하지 않고 항상 API 호출
+        rate_limiter: 실제 API 호출(재시도 포함) 전에 토큰을 얻을 속도 제한기 (캐시 응답에는 적용 안 함)
+        http_client: 사용할 HTTP 클라이언트 (없으면 기본 클라이언트)
+    
+    Returns:
+        (API 응답 딕셔너리, 네트워크 호출 여부)
+    
+    Raises:
+        requests.RequestException: 재시도 후에도 실패한 경우 (HTTP 오류, 연결 오류, 타임아웃)
+    """
+    if use_cache and cache is None:
+        cache = get_default_cache()
+    
+    cache_key = ResponseCache.make_key(keyword, rect, page_num) if use_cache else None
+    if cache_key is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached, False
+    
+    start_x, start_y, end_x, end_y = rect
+    params = {
+        'query': keyword,
+        'page': page_num,
+        'rect': f'{start_x},{start_y},{end_x},{end_y}'
+    }
+    headers = {"Authorization": f"KakaoAK {api_key}"}
+    http_client = http_client or get_default_http_client()
+    response = http_client.get(KAKAO_KEYWORD_URL, headers=headers, params=params, rate_limiter=rate_limiter)
+    response.raise_for_status()
+    result = response.json()
+    
+    if cache_key is not None:
+        cache.set(cache_key, result)
+    return result, True
+
+def search_kakao_places_by_rect(keyword, start_x, start_y, end_x, end_y, api_key, cache=None, use_cache=True):
     """
     카카오맵 API 사각형 영역 검색 - 45개 제한 우회 버전
     
@@ -21,32 +96,22 @@ def search_kakao_places_by_rect(keyword, start_x, start_y, end_x, end_y, api_key
         end_x: 끝 경도(우상단)
         end_y: 끝 위도(우상단)
         api_key: 카카오 REST API 키
+        cache: 응답 캐시 (없으면 data/cache의 기본 캐시)
+        use_cache: False이면 캐시를 사용하지 않고 항상 API 호출
     
     Returns:
         검색 결과 목록
     """
-    # API 요청 URL 및 헤더 설정
-    url = "https://dapi.kakao.com/v2/local/search/keyword.json"
-    headers = {"Authorization": f"KakaoAK {api_key}"}
-    
     # 검색 결과를 담을 리스트와 페이지 번호 초기화
     all_data_list = []
     page_num = 1
+    rect = (start_x, start_y, end_x, end_y)
     
     while True:
-        # API 요청 파라미터 설정
-        params = {
-            'query': keyword,
-            'page': page_num,
-            'rect': f'{start_x},{start_y},{end_x},{end_y}'
-        }
-        
         try:
-            # API 요청 실행
-            response = requests.get(url, headers=headers, params=params)
-            response.raise_for_status()
+            # API 요청 실행 (캐시된 응답이 있으면 재사용)
+            result, from_network = fetch_rect_page(keyword, rect, page_num, api_key, cache, use_cache)
             
-            result = response.json()
             documents = result.get('documents', [])
             meta = result.get('meta', {})
             
@@ -63,13 +128,13 @@ def search_kakao_places_by_rect(keyword, start_x, start_y, end_x, end_y, api_key
                 
                 # 4등분 영역 각각 재귀적으로 검색
                 # 좌하단
-                all_data_list.extend(search_kakao_places_by_rect(keyword, start_x, start_y, mid_x, mid_y, api_key))
+                all_data_list.extend(search_kakao_places_by_rect(keyword, start_x, start_y, mid_x, mid_y, api_key, cache, use_cache))
                 # 우하단
-                all_data_list.extend(search_kakao_places_by_rect(keyword, mid_x, start_y, end_x, mid_y, api_key))
+                all_data_list.extend(search_kakao_places_by_rect(keyword, mid_x, start_y, end_x, mid_y, api_key, cache, use_cache))
                 # 좌상단
-                all_data_list.extend(search_kakao_places_by_rect(keyword, start_x, mid_y, mid_x, end_y, api_key))
+                all_data_list.extend(search_kakao_places_by_rect(keyword, start_x, mid_y, mid_x, end_y, api_key, cache, use_cache))
                 # 우상단
-                all_data_list.extend(search_kakao_places_by_rect(keyword, mid_x, mid_y, end_x, end_y, api_key))
+                all_data_list.extend(search_kakao_places_by_rect(keyword, mid_x, mid_y, end_x, end_y, api_key, cache, use_cache))
                 
                 return all_data_list
             else:
@@ -84,13 +149,90 @@ def search_kakao_places_by_rect(keyword, start_x, start_y, end_x, end_y, api_key
                 page_num += 1
                 print(f"→ 다음 페이지 ({page_num}) 조회 중")
                 
-                # API 호출 제한 방지를 위한 짧은 대기
-                time.sleep(0.2)
+                # API 호출 제한 방지를 위한 짧은 대기 (캐시 응답은 대기 불필요)
+                if from_network:
+                    time.sleep(0.2)
                 
         except Exception as e:
             print(f"API 요청 오류: {e}")
             return all_data_list
 
+def load_busan_boundary(geojson_path='data/busan_emd_wgs84.geojson'):
+    """
+    부산 행정동 경계 union 로드 (파일이 없으면 None)
+    
+    Args:
+        geojson_path: WGS84 행정동 경계 GeoJSON 경로
+    
+    Returns:
+        행정동 폴리곤 union 또는 None
+    """
+    if not os.path.exists(geojson_path):
+        return None
+    with open(geojson_path, 'r', encoding='utf-8') as f:
+        features = json.load(f)['features']
+    return unary_union([shape(feature['geometry']) for feature in features])
+
+def search_kakao_places_by_quadtree(keyword, start_x, start_y, end_x, end_y, api_key,
+                                    boundary=None, max_workers=4, requests_per_second=10.0,
+                                    cache=None, use_cache=True, snapshot=None):
+    """
+    쿼드트리 계획기를 사용한 영역 검색
+    - 이전 갱신에서 찾은 최종 분할 영역부터 바로 조회
+    - 형제 영역은 동시에 조회
+    - 경계(boundary) 밖에 완전히 있는 영역은 조회하지 않음
+    
+    Args:
+        keyword: 검색어
+        start_x, start_y, end_x, end_y: 전체 검색 영역
+        api_key: 카카오 REST API 키
+        boundary: 검색 대상 경계 폴리곤 (없으면 영역 전체 검색)
+        max_workers: 동시 조회 스레드 수
+        requests_per_second: 실제 API 호출 초당 한도
+        cache: 응답 캐시 (없으면 기본 캐시)
+        use_cache: False이면 캐시를 사용하지 않고 항상 API 호출
+        snapshot: 이전 갱신 스냅샷 (PlaceSnapshot), 주어지면 total_count가 같은 영역은
+            나머지 페이지를 조회하지 않고 재사용하며 검색 후 스냅샷을 갱신
+    
+    Returns:
+        검색 결과 목록
+    """
+    rate_limiter = TokenBucketRateLimiter(requests_per_second)
+    planner = QuadtreeRectPlanner(
+        fetch_page=lambda kw, rect, page: fetch_rect_page(
+            kw, rect, page, api_key, cache, use_cache, rate_limiter)[0],
+        boundary=boundary,
+        max_workers=max_workers
+    )
+    known_tiles = snapshot.known_tiles() if snapshot is not None else None
+    places = planner.search(keyword, (start_x, start_y, end_x, end_y), known_tiles=known_tiles)
+    print(f"'{keyword}' 쿼드트리 검색 완료: 요청 {planner.request_count}회, 결과 {len(places)}개 "
+          f"(변경 없는 영역 {planner.reused_tiles}개 재사용)")
+    if snapshot is not None:
+        snapshot.update(places, planner.last_tiles)
+    return places
+
+def snapshot_path_for(output_file):
+    """출력 파일별 증분 갱신 스냅샷 경로"""
+    name = os.path.splitext(os.path.basename(output_file))[0]
+    return os.path.join('data', 'cache', 'snapshots', f"{name}.snapshot.json")
+
+def load_places_by_id(path):
+    """이전에 저장한 장소 목록을 {장소 ID: 장소}로 로드 (없으면 빈 딕셔너리)"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return {place['id']: place for place in json.load(f) if place.get('id')}
+
+def save_place_diff(diff, output_file):
+    """장소 변경 내역을 <출력 파일>_diff.json으로 저장"""
+    name, ext = os.path.splitext(output_file)
+    diff_file = f"{name}_diff{ext or '.json'}"
+    with open(diff_file, 'w', encoding='utf-8') as f:
+        json.dump(diff.to_dict(), f, ensure_ascii=False, indent=2)
+    print(f"변경 내역({diff.summary()})이 {diff_file}에 저장되었습니다.")
+    return diff_file
+
 def remove_duplicates(places):
     """중복 결과 제거 (ID 기준)"""
     unique_places = {}
@@ -217,13 +359,16 @@ def filter_park_only(places, strict_category=False):
         return filtered, excluded_places
     return filtered
 
-def search_busan_places(keyword, api_key, output_file, apply_filter=False, strict_category=False):
+def search_busan_places(keyword, api_key, output_file, apply_filter=False, strict_category=False, incremental=False):
     """
     부산 지역 내 키워드로 검색하고 결과를 파일로 저장
     
     부산 대략적 좌표 범위:
     - 남서쪽(좌하단): 약 128.8, 34.9 
     - 북동쪽(우상단): 약 129.3, 35.4
+    
+    incremental=True이면 이전 스냅샷과 total_count가 달라진 영역만 다시 조회하고,
+    이전 결과 파일 대비 추가/삭제/이동된 장소를 <출력 파일>_diff.json으로 저장합니다.
     """
     print(f"카카오맵 API로 부산 지역 내 '{keyword}' 검색 중...")
     
@@ -232,8 +377,15 @@ def search_busan_places(keyword, api_key, output_file, apply_filter=False, stric
     start_x, start_y = 128.8, 34.9  # 경도, 위도 (남서)
     end_x, end_y = 129.3, 35.4      # 경도, 위도 (북동)
     
-    # 검색 실행
-    places = search_kakao_places_by_rect(keyword, start_x, start_y, end_x, end_y, api_key)
+    # 검색 실행 (저장된 분할 영역 재사용, 부산 경계 밖 영역 제외)
+    snapshot = PlaceSnapshot.load(snapshot_path_for(output_file)) if incremental else None
+    places = search_kakao_places_by_quadtree(
+        keyword, start_x, start_y, end_x, end_y, api_key, boundary=load_busan_boundary(),
+        use_cache=not incremental,  # 증분 모드는 변경 여부 확인을 위해 항상 최신 첫 페이지 조회
+        snapshot=snapshot
+    )
+    if snapshot is not None:
+        snapshot.save(snapshot_path_for(output_file))
     
     # 중복 제거
     unique_places = remove_duplicates(places)
@@ -269,6 +421,12 @@ def search_busan_places(keyword, api_key, output_file, apply_filter=False, stric
         else:
             filename = f"{name}_normal_filtered{ext}"
     
+    # 증분 모드: 이전 결과 파일 대비 변경 내역 저장
+    if incremental:
+        previous_places = load_places_by_id(filename)
+        current_places = {place['id']: place for place in unique_places}
+        save_place_diff(diff_places(previous_places, current_places), filename)
+    
     with open(filename, 'w', encoding='utf-8') as f:
         json.dump(unique_places, f, ensure_ascii=False, indent=2)
     
@@ -276,7 +434,7 @@ def search_busan_places(keyword, api_key, output_file, apply_filter=False, stric
     
     return unique_places
 
-def main():
+def main(incremental=False):
     # 명령줄 인자로 API 키 받기
     # 사용자 요청에 따라 API 키를 하드코딩합니다.
     # 보안 참고: 이 방식은 코드를 공유하거나 버전 관리할 경우 API 키 노출 위험이 있습니다.
@@ -285,12 +443,17 @@ def main():
     
     # 1. 동물병원 검색
     print("1. 동물병원 데이터 검색...")
-    hospitals = search_busan_places("동물병원", api_key, 'data/busan_vet_hospitals_all.json')
+    hospitals = search_busan_places("동물병원", api_key, 'data/busan_vet_hospitals_all.json', incremental=incremental)
     
     # 2. 공원 검색 - 강력 필터링 적용 (여행 > 관광,명소 및 여행 > 공원 카테고리 포함)
     print("\n2. 공원 데이터 검색 (강력 필터링 모드)...")
     # 공원 검색 실행
-    parks = search_kakao_places_by_rect("공원", 128.8, 34.9, 129.3, 35.4, api_key)
+    parks_snapshot_path = snapshot_path_for('data/busan_parks_strict_filtered.json')
+    parks_snapshot = PlaceSnapshot.load(parks_snapshot_path) if incremental else None
+    parks = search_kakao_places_by_quadtree("공원", 128.8, 34.9, 129.3, 35.4, api_key, boundary=load_busan_boundary(),
+                                            use_cache=not incremental, snapshot=parks_snapshot)
+    if parks_snapshot is not None:
+        parks_snapshot.save(parks_snapshot_path)
     parks = remove_duplicates(parks)
     print(f"검색 결과: 총 {len(parks)}개의 '공원' 장소를 찾았습니다. (중복 제거 전: {len(parks)})")
     
@@ -299,6 +462,12 @@ def main():
     print(f"강력 필터링 결과: {len(strict_filtered)}개의 '여행 > 관광,명소' 또는 '여행 > 공원' 카테고리 장소 선택됨 (제외: {len(parks)-len(strict_filtered)}개)")
     
     # 결과 저장
+    if incremental:
+        save_place_diff(
+            diff_places(load_places_by_id('data/busan_parks_strict_filtered.json'),
+                        {place['id']: place for place in strict_filtered}),
+            'data/busan_parks_strict_filtered.json'
+        )
     with open('data/busan_parks_strict_filtered.json', 'w', encoding='utf-8') as f:
         json.dump(strict_filtered, f, ensure_ascii=False, indent=2)
     print(f"결과가 data/busan_parks_strict_filtered.json에 저장되었습니다.")
@@ -321,9 +490,12 @@ def main():
     
     # 4. 애견카페 검색 및 저장 - 필터링 미적용
     print("\n4. 애견카페 데이터 검색...")
-    dog_cafes = search_busan_places("애견카페", api_key, 'data/busan_dog_cafes_all.json')
+    dog_cafes = search_busan_places("애견카페", api_key, 'data/busan_dog_cafes_all.json', incremental=incremental)
     
     print("모든 검색이 완료되었습니다.")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="부산 지역 카카오 장소 영역 검색")
+    parser.add_argument("--incremental", action="store_true",
+                        help="이전 스냅샷 대비 변경된 영역만 다시 조회하고 변경 내역(_diff.json) 저장")
+    main(incremental=parser.parse_args().incremental)
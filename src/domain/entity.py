@@ -2,12 +2,22 @@
 동물병원 및 행정동 엔티티 정의
 """
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, ClassVar, Sequence, Tuple
 
+import numpy as np
+import pandas as pd
 
-@dataclass
+
+def _optional(value: Any) -> Any:
+    """결측값(NaN/None)을 None으로 통일"""
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+    return value
+
+
+@dataclass(slots=True)
 class VetHospital:
-    """동물병원 엔티티"""
+    """동물병원 엔티티 (대량 보관 시 메모리 절약을 위해 __slots__ 사용)"""
     id: str
     name: str
     address: str
@@ -18,6 +28,12 @@ class VetHospital:
     dong_code: Optional[str] = None  # 행정동 코드 (spatial join 후 할당)
     dong_name: Optional[str] = None  # 행정동 이름 (spatial join 후 할당)
     
+    # 저장/변환 시 필드 순서
+    FIELDS: ClassVar[Tuple[str, ...]] = (
+        "id", "name", "address", "latitude", "longitude",
+        "phone", "place_url", "dong_code", "dong_name"
+    )
+    
     @classmethod
     def from_kakao_api_result(cls, item: Dict[str, Any]) -> 'VetHospital':
         """카카오 API 결과로부터 동물병원 객체 생성"""
@@ -30,6 +46,98 @@ class VetHospital:
             phone=item.get('phone'),
             place_url=item.get('place_url')
         )
+    
+    @classmethod
+    def from_kakao_documents(cls, documents: Sequence[Dict[str, Any]]) -> List['VetHospital']:
+        """
+        카카오 API 결과 목록으로부터 동물병원 객체 일괄 생성
+        
+        Args:
+            documents: 카카오 API documents 목록
+            
+        Returns:
+            동물병원 목록 (입력 순서 유지)
+        """
+        return [
+            cls(doc.get('id'), doc.get('place_name'), doc.get('address_name'),
+                float(doc.get('y')), float(doc.get('x')), doc.get('phone'), doc.get('place_url'))
+            for doc in documents
+        ]
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'VetHospital':
+        """to_dict() 형식의 딕셔너리로부터 동물병원 객체 생성"""
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            address=data["address"],
+            latitude=data["latitude"],
+            longitude=data["longitude"],
+            phone=data.get("phone"),
+            place_url=data.get("place_url"),
+            dong_code=data.get("dong_code"),
+            dong_name=data.get("dong_name")
+        )
+    
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> List['VetHospital']:
+        """
+        to_columns() 형식의 열을 가진 데이터프레임으로부터 동물병원 객체 일괄 생성
+        
+        Args:
+            df: id, name, address, latitude, longitude 열 (나머지 열은 선택)
+            
+        Returns:
+            동물병원 목록 (결측값은 None)
+        """
+        size = len(df)
+        columns = []
+        for name in cls.FIELDS:
+            if name not in df.columns:
+                columns.append([None] * size)
+            elif name in ("latitude", "longitude"):
+                columns.append(df[name].to_numpy(dtype=np.float64).tolist())
+            else:
+                columns.append([_optional(value) for value in df[name].tolist()])
+        return [cls(*values) for values in zip(*columns)]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """VetHospital 객체를 딕셔너리로 변환"""
+        return {name: getattr(self, name) for name in self.FIELDS}
+    
+    @classmethod
+    def to_records(cls, hospitals: Sequence['VetHospital']) -> List[Dict[str, Any]]:
+        """
+        동물병원 목록을 딕셔너리 목록으로 일괄 변환 (JSON 저장용)
+        
+        Args:
+            hospitals: 동물병원 목록
+            
+        Returns:
+            to_dict() 형식의 딕셔너리 목록
+        """
+        return [
+            {"id": h.id, "name": h.name, "address": h.address, "latitude": h.latitude,
+             "longitude": h.longitude, "phone": h.phone, "place_url": h.place_url,
+             "dong_code": h.dong_code, "dong_name": h.dong_name}
+            for h in hospitals
+        ]
+    
+    @classmethod
+    def to_columns(cls, hospitals: Sequence['VetHospital']) -> Dict[str, Any]:
+        """
+        동물병원 목록을 열 단위로 일괄 변환 (DataFrame/GeoDataFrame 생성용)
+        
+        Args:
+            hospitals: 동물병원 목록
+            
+        Returns:
+            {필드명: 값 배열}, 위도/경도는 float64 배열
+        """
+        columns = {name: [getattr(h, name) for h in hospitals] for name in cls.FIELDS}
+        columns["latitude"] = np.asarray(columns["latitude"], dtype=np.float64)
+        columns["longitude"] = np.asarray(columns["longitude"], dtype=np.float64)
+        return columns
 
 
 @dataclass
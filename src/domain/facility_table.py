@@ -0,0 +1,251 @@
+"""
+시설 데이터 열(column) 단위 테이블
+- 수집기, 공간 조인, 집계 사이에서 주고받는 공통 데이터 형식
+- 시설마다 dict를 만드는 대신 id/이름/유형/경도/위도/행정동 열을 NumPy 배열로 보관
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
+
+from src.domain.entity import VetHospital
+
+
+def _object_array(values: Optional[Iterable[Any]], size: int) -> np.ndarray:
+    """object 배열로 변환 (None이면 None으로 채운 배열, 이미 object 배열이면 그대로 사용)"""
+    if values is None:
+        return np.full(size, None, dtype=object)
+    if isinstance(values, np.ndarray) and values.dtype == object:
+        array = values
+    else:
+        array = np.empty(size, dtype=object)
+        array[:] = values if isinstance(values, np.ndarray) else list(values)
+    if len(array) != size:
+        raise ValueError("열 배열의 길이가 다릅니다.")
+    return array
+
+
+@dataclass
+class FacilityTable:
+    """시설 목록을 열 단위 NumPy 배열로 보관하는 테이블"""
+    ids: np.ndarray
+    names: np.ndarray
+    types: np.ndarray
+    lon: np.ndarray
+    lat: np.ndarray
+    dong_codes: Optional[np.ndarray] = None
+    dong_names: Optional[np.ndarray] = None
+
+    COLUMNS = ("id", "name", "type", "longitude", "latitude", "dong_code", "dong_name")
+
+    def __post_init__(self):
+        self.lon = np.asarray(self.lon, dtype=np.float64)
+        self.lat = np.asarray(self.lat, dtype=np.float64)
+        size = len(self.lon)
+        if len(self.lat) != size:
+            raise ValueError("경도와 위도 배열의 길이가 다릅니다.")
+        self.ids = _object_array(self.ids, size)
+        self.names = _object_array(self.names, size)
+        self.types = _object_array(self.types, size)
+        self.dong_codes = _object_array(self.dong_codes, size)
+        self.dong_names = _object_array(self.dong_names, size)
+
+    def __len__(self) -> int:
+        return len(self.lon)
+
+    @classmethod
+    def empty(cls) -> 'FacilityTable':
+        """빈 테이블 생성"""
+        return cls(ids=[], names=[], types=[], lon=np.empty(0), lat=np.empty(0))
+
+    @classmethod
+    def from_kakao_documents(cls, documents: Sequence[Dict[str, Any]], facility_type: str) -> 'FacilityTable':
+        """
+        카카오 장소 검색 결과로 테이블 생성
+
+        Args:
+            documents: 카카오 API documents (id, place_name, x, y 포함)
+            facility_type: 시설 유형 (예: '애견카페')
+
+        Returns:
+            시설 테이블
+        """
+        size = len(documents)
+        return cls(
+            ids=[doc.get('id') for doc in documents],
+            names=[doc.get('place_name', '') for doc in documents],
+            types=np.full(size, facility_type, dtype=object),
+            lon=np.fromiter((float(doc.get('x', 0) or 0) for doc in documents), dtype=np.float64, count=size),
+            lat=np.fromiter((float(doc.get('y', 0) or 0) for doc in documents), dtype=np.float64, count=size)
+        )
+
+    @classmethod
+    def from_records(cls, records: Sequence[Dict[str, Any]]) -> 'FacilityTable':
+        """
+        시설 dict 목록으로 테이블 생성 (기존 name/x/y/type 형식 호환용)
+
+        Args:
+            records: 시설 목록 (name, x, y, type, id 필드)
+
+        Returns:
+            시설 테이블
+        """
+        size = len(records)
+        return cls(
+            ids=[r.get('id') for r in records],
+            names=[r.get('name', '') for r in records],
+            types=[r.get('type') for r in records],
+            lon=np.fromiter((float(r.get('x', 0) or 0) for r in records), dtype=np.float64, count=size),
+            lat=np.fromiter((float(r.get('y', 0) or 0) for r in records), dtype=np.float64, count=size)
+        )
+
+    @classmethod
+    def from_hospitals(cls, hospitals: Sequence[VetHospital], facility_type: str = '동물병원') -> 'FacilityTable':
+        """
+        동물병원 엔티티 목록으로 테이블 생성
+
+        Args:
+            hospitals: 동물병원 목록
+            facility_type: 시설 유형
+
+        Returns:
+            시설 테이블 (행정동 정보 포함)
+        """
+        size = len(hospitals)
+        return cls(
+            ids=[h.id for h in hospitals],
+            names=[h.name for h in hospitals],
+            types=np.full(size, facility_type, dtype=object),
+            lon=np.fromiter((h.longitude for h in hospitals), dtype=np.float64, count=size),
+            lat=np.fromiter((h.latitude for h in hospitals), dtype=np.float64, count=size),
+            dong_codes=[h.dong_code for h in hospitals],
+            dong_names=[h.dong_name for h in hospitals]
+        )
+
+    @classmethod
+    def from_dataframe(cls,
+                       df: pd.DataFrame,
+                       facility_type: str,
+                       lon_col: str = 'lng',
+                       lat_col: str = 'lat',
+                       name_col: str = '사업장명',
+                       id_col: Optional[str] = None) -> 'FacilityTable':
+        """
+        데이터프레임 열로 테이블 생성 (행 단위 반복 없음)
+
+        Args:
+            df: 경도/위도 열을 포함한 데이터프레임
+            facility_type: 시설 유형
+            lon_col: 경도 열 이름
+            lat_col: 위도 열 이름
+            name_col: 이름 열 이름 (없으면 빈 문자열)
+            id_col: ID 열 이름 (없으면 None)
+
+        Returns:
+            시설 테이블
+        """
+        size = len(df)
+        return cls(
+            ids=df[id_col].to_numpy(dtype=object) if id_col and id_col in df.columns else None,
+            names=df[name_col].to_numpy(dtype=object) if name_col in df.columns else np.full(size, '', dtype=object),
+            types=np.full(size, facility_type, dtype=object),
+            lon=df[lon_col].to_numpy(dtype=np.float64),
+            lat=df[lat_col].to_numpy(dtype=np.float64)
+        )
+
+    @classmethod
+    def concat(cls, tables: Sequence['FacilityTable']) -> 'FacilityTable':
+        """여러 테이블을 순서대로 이어 붙임"""
+        if not tables:
+            return cls.empty()
+        return cls(**{
+            name: np.concatenate([getattr(table, name) for table in tables])
+            for name in ("ids", "names", "types", "lon", "lat", "dong_codes", "dong_names")
+        })
+
+    def take(self, indices: Any) -> 'FacilityTable':
+        """
+        행 선택 (정수 인덱스 배열 또는 불리언 마스크)
+
+        Returns:
+            선택한 행만 담은 새 테이블
+        """
+        return FacilityTable(
+            ids=self.ids[indices],
+            names=self.names[indices],
+            types=self.types[indices],
+            lon=self.lon[indices],
+            lat=self.lat[indices],
+            dong_codes=self.dong_codes[indices],
+            dong_names=self.dong_names[indices]
+        )
+
+    def with_dongs(self, dong_codes: Sequence[Any], dong_names: Sequence[Any]) -> 'FacilityTable':
+        """행정동 열만 바꾼 새 테이블 (나머지 열은 배열 공유)"""
+        return FacilityTable(
+            ids=self.ids, names=self.names, types=self.types, lon=self.lon, lat=self.lat,
+            dong_codes=dong_codes, dong_names=dong_names
+        )
+
+    def points(self) -> np.ndarray:
+        """경도/위도 배열로 shapely Point 배열 생성"""
+        return shapely.points(self.lon, self.lat)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """열 배열을 복사하지 않고 데이터프레임으로 변환"""
+        return pd.DataFrame(
+            dict(zip(self.COLUMNS, (self.ids, self.names, self.types, self.lon, self.lat,
+                                    self.dong_codes, self.dong_names))),
+            copy=False
+        )
+
+    def to_geodataframe(self, crs: Any = "EPSG:4326") -> gpd.GeoDataFrame:
+        """
+        GeoDataFrame으로 변환 (속성 열은 복사하지 않음)
+
+        Args:
+            crs: 좌표계
+
+        Returns:
+            시설 GeoDataFrame (geometry는 경도/위도 Point)
+        """
+        return gpd.GeoDataFrame(self.to_dataframe(), geometry=self.points(), crs=crs, copy=False)
+
+    def count_by(self, column: str = "dong_name") -> Dict[Any, int]:
+        """
+        열 값별 시설 개수 (None 제외)
+
+        Args:
+            column: 'dong_name', 'dong_code', 'type' 중 하나
+
+        Returns:
+            {값: 개수}
+        """
+        values = {"dong_name": self.dong_names, "dong_code": self.dong_codes, "type": self.types}[column]
+        present = values[values != None]  # noqa: E711 (object 배열의 원소별 비교)
+        if len(present) == 0:
+            return {}
+        unique, counts = np.unique(present.astype(str), return_counts=True)
+        return dict(zip(unique.tolist(), counts.tolist()))
+
+    def to_records(self, district_key: str = 'district', outside_label: str = '경계 외') -> List[Dict[str, Any]]:
+        """
+        시설별 소속 행정동 CSV 저장용 레코드 목록 (name, x, y, type, district)
+
+        Args:
+            district_key: 행정동 이름 키
+            outside_label: 행정동이 없는 시설의 표시값
+
+        Returns:
+            레코드 목록
+        """
+        return [
+            {'name': name, 'x': x, 'y': y, 'type': facility_type,
+             district_key: dong_name if dong_name is not None else outside_label}
+            for name, x, y, facility_type, dong_name in zip(
+                self.names.tolist(), self.lon.tolist(), self.lat.tolist(),
+                self.types.tolist(), self.dong_names.tolist())
+        ]
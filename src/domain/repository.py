@@ -2,7 +2,8 @@
 레포지토리 인터페이스 정의
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+import numpy as np
 import geopandas as gpd
 
 from src.domain.entity import VetHospital, AdministrativeDong
@@ -50,6 +51,11 @@ class AdministrativeDongRepository(ABC):
         """위경도 좌표가 속한 행정동 조회"""
         pass
     
+    @abstractmethod
+    def get_dongs_by_points(self, latitudes: Sequence[float], longitudes: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+        """여러 위경도 좌표가 속한 행정동 코드/이름 배열 일괄 조회"""
+        pass
+    
     @abstractmethod
     def get_all_dongs(self) -> List[AdministrativeDong]:
         """모든 행정동 목록 조회"""
@@ -0,0 +1,216 @@
+"""
+행정동 경계 basemap 캐시 (matplotlib 지도용)
+- 경계 폴리곤을 matplotlib Path로 한 번만 변환하고 출력 해상도에 맞게 단순화
+- 회색 경계 배경은 dpi/크기별로 한 번만 래스터로 렌더링한 뒤 지도마다 이미지로 재사용
+"""
+import hashlib
+import math
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import shapely
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PathCollection
+from matplotlib.figure import Figure
+from matplotlib.path import Path
+from shapely.geometry.polygon import orient
+
+
+def _polygon_path(geometry: Any) -> Path:
+    """Polygon/MultiPolygon을 구멍을 포함한 하나의 compound Path로 변환"""
+    vertices: List[np.ndarray] = []
+    codes: List[np.ndarray] = []
+    for part in shapely.get_parts(geometry):
+        # matplotlib는 nonzero 규칙으로 채우므로 외곽선과 구멍의 방향을 반대로 맞춤
+        part = orient(part, sign=1.0)
+        for ring in [part.exterior, *part.interiors]:
+            coords = np.asarray(ring.coords)[:, :2]
+            if len(coords) < 3:
+                continue
+            ring_codes = np.full(len(coords), Path.LINETO, dtype=Path.code_type)
+            ring_codes[0] = Path.MOVETO
+            ring_codes[-1] = Path.CLOSEPOLY
+            vertices.append(coords)
+            codes.append(ring_codes)
+    if not vertices:
+        return Path(np.empty((0, 2)))
+    return Path(np.concatenate(vertices), np.concatenate(codes))
+
+
+class Basemap:
+    """행정동 경계 Path와 래스터 배경을 캐시하는 basemap"""
+
+    def __init__(self, geometries: Sequence[Any], geographic: bool = True):
+        """
+        basemap 초기화
+
+        Args:
+            geometries: 행정동 경계 폴리곤 목록 (지도에 그릴 순서)
+            geographic: 경위도 좌표계 여부 (True면 geopandas와 같은 종횡비 보정)
+        """
+        self.geometries = np.asarray(geometries, dtype=object)
+        minx, miny, maxx, maxy = shapely.total_bounds(self.geometries)
+        self.bounds = (float(minx), float(miny), float(maxx), float(maxy))
+        # 경위도 지도는 중간 위도에서 경도 1도와 위도 1도의 길이가 같아지도록 종횡비 보정
+        self.aspect = 1 / math.cos(math.radians((miny + maxy) / 2)) if geographic else 1.0
+        self._paths: Dict[float, List[Path]] = {}
+        self._rasters: Dict[Tuple, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.geometries)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # 렌더링 프로세스로 보낼 때 변환된 Path는 유지하고 lock과 래스터는 제외
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_rasters"] = {}
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def tolerance_for(self, width_px: float) -> float:
+        """출력 폭(픽셀)에서 반 픽셀보다 작은 꼭짓점 변화는 보이지 않으므로 그만큼 단순화"""
+        minx, _, maxx, _ = self.bounds
+        return (maxx - minx) / max(width_px, 1) / 2
+
+    def paths(self, tolerance: float = 0.0) -> List[Path]:
+        """
+        단순화 허용 오차별로 한 번만 변환한 경계 Path 목록
+
+        Args:
+            tolerance: 단순화 허용 오차 (좌표 단위, 0이면 원본)
+
+        Returns:
+            폴리곤 순서의 Path 목록
+        """
+        cached = self._paths.get(tolerance)
+        if cached is not None:
+            return cached
+        with self._lock:
+            cached = self._paths.get(tolerance)
+            if cached is None:
+                geometries = self.geometries
+                if tolerance > 0:
+                    geometries = shapely.simplify(geometries, tolerance, preserve_topology=True)
+                cached = [_polygon_path(geometry) for geometry in geometries]
+                self._paths[tolerance] = cached
+        return cached
+
+    def collection(self, tolerance: float = 0.0, **kwargs: Any) -> PathCollection:
+        """캐시된 Path로 새 PathCollection 생성 (artist는 축마다 새로 만들어야 함)"""
+        return PathCollection(self.paths(tolerance), **kwargs)
+
+    def raster(self,
+               width_px: int,
+               dpi: float,
+               facecolor: Any = 'lightgray',
+               edgecolor: Any = 'black',
+               linewidth: float = 0.3,
+               alpha: float = 0.5) -> np.ndarray:
+        """
+        경계 배경을 RGBA 이미지로 렌더링 (크기/dpi/스타일별로 한 번만)
+
+        Args:
+            width_px: 이미지 폭(픽셀), 높이는 경계 범위와 종횡비로 결정
+            dpi: 선 두께 환산에 사용할 dpi (최종 저장 dpi와 같게)
+            facecolor: 폴리곤 채우기 색
+            edgecolor: 경계선 색
+            linewidth: 경계선 두께 (포인트)
+            alpha: 투명도
+
+        Returns:
+            (높이, 폭, 4) uint8 배열
+        """
+        key = (int(width_px), float(dpi), str(facecolor), str(edgecolor), float(linewidth), float(alpha))
+        cached = self._rasters.get(key)
+        if cached is not None:
+            return cached
+
+        minx, miny, maxx, maxy = self.bounds
+        width_px = int(width_px)
+        height_px = max(1, int(round(width_px * (maxy - miny) * self.aspect / max(maxx - minx, 1e-12))))
+
+        # pyplot 상태와 무관한 Agg 캔버스에 축 없이 경계 범위만 꽉 차게 그림 (폴리곤 밖은 투명)
+        fig = Figure(figsize=(width_px / dpi, height_px / dpi), dpi=dpi, facecolor='none')
+        canvas = FigureCanvasAgg(fig)
+        ax = fig.add_axes((0, 0, 1, 1))
+        ax.set_axis_off()
+        ax.add_collection(self.collection(
+            self.tolerance_for(width_px),
+            facecolor=facecolor, edgecolor=edgecolor, linewidth=linewidth, alpha=alpha
+        ))
+        ax.set_xlim(minx, maxx)
+        ax.set_ylim(miny, maxy)
+        canvas.draw()
+        image = np.asarray(canvas.buffer_rgba()).copy()
+
+        with self._lock:
+            self._rasters[key] = image
+        return image
+
+    def draw(self, ax: Any, dpi: float, **style: Any) -> Any:
+        """
+        캐시된 래스터 배경을 축에 이미지로 그리고 지도 범위/종횡비 설정
+
+        Args:
+            ax: matplotlib 축
+            dpi: 저장 dpi (래스터 해상도 결정)
+            **style: raster()의 스타일 인자
+
+        Returns:
+            AxesImage
+        """
+        width_px = int(ax.figure.get_figwidth() * ax.get_position().width * dpi)
+        minx, miny, maxx, maxy = self.bounds
+        image = ax.imshow(self.raster(width_px, dpi, **style), extent=(minx, maxx, miny, maxy),
+                          origin='upper', interpolation='nearest', zorder=0)
+        self.set_extent(ax)
+        return image
+
+    def set_extent(self, ax: Any) -> None:
+        """축 범위를 경계 범위로, 종횡비를 geopandas 지도와 같게 설정"""
+        minx, miny, maxx, maxy = self.bounds
+        ax.set_xlim(minx, maxx)
+        ax.set_ylim(miny, maxy)
+        ax.set_aspect(self.aspect)
+
+
+def boundary_version(geometries: Sequence[Any], crs: Optional[Any] = None) -> str:
+    """경계 폴리곤 내용(WKB)과 좌표계로 basemap 캐시 키 생성"""
+    digest = hashlib.sha1(str(crs).encode("utf-8"))
+    for wkb in shapely.to_wkb(np.asarray(geometries, dtype=object)):
+        digest.update(wkb)
+    return digest.hexdigest()
+
+
+# 경계 버전별 프로세스 전역 basemap 캐시
+_basemaps: Dict[str, Basemap] = {}
+_basemaps_lock = threading.Lock()
+
+
+def get_basemap(dongs_gdf: Any) -> Basemap:
+    """
+    행정동 GeoDataFrame의 경계 버전별로 공유되는 basemap 반환
+
+    같은 경계로 여러 지도를 만들 때(지도 종류별, 구 단위 변형 등) Path 변환과
+    배경 래스터 렌더링을 한 번만 수행합니다.
+
+    Args:
+        dongs_gdf: 행정동 GeoDataFrame
+
+    Returns:
+        프로세스 내에서 공유되는 basemap
+    """
+    geometries = dongs_gdf.geometry.values
+    crs = dongs_gdf.crs
+    key = boundary_version(geometries, crs)
+    with _basemaps_lock:
+        basemap = _basemaps.get(key)
+        if basemap is None:
+            basemap = Basemap(geometries, geographic=bool(crs is not None and crs.is_geographic))
+            _basemaps[key] = basemap
+        return basemap
@@ -0,0 +1,183 @@
+"""
+웹 지도용 행정동 경계 단순화 (줌 레벨별 경량 GeoJSON/TopoJSON 생성)
+- 이웃 행정동이 공유하는 경계를 함께 단순화해 경계 사이 틈이나 겹침이 생기지 않음
+- 줌 레벨의 픽셀 크기에 맞춰 허용 오차와 좌표 소수점 자릿수를 정함
+"""
+import argparse
+import json
+import math
+import os
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+import shapely
+from shapely.geometry import mapping, shape
+
+try:
+    import topojson
+except ImportError:
+    topojson = None
+
+# 기본으로 생성할 줌 레벨 (시 전체 ~ 동네 단위)
+DEFAULT_ZOOMS = (9, 11, 13, 15)
+DEFAULT_OUTPUT_DIR = os.path.join("data", "boundaries")
+
+
+def pixel_size(zoom: int) -> float:
+    """웹 메르카토르 타일(256px) 기준 해당 줌 레벨의 한 픽셀 폭 (경도, 도 단위)"""
+    return 360.0 / (256 * 2 ** zoom)
+
+
+def tolerance_for_zoom(zoom: int) -> float:
+    """해당 줌 레벨에서 보이지 않는 반 픽셀 이하의 꼭짓점 변화를 제거하는 허용 오차"""
+    return pixel_size(zoom) / 2
+
+
+def digits_for_zoom(zoom: int) -> int:
+    """해당 줌 레벨에서 반 픽셀보다 세밀한 좌표 자릿수는 버림 (좌표 양자화)"""
+    return max(0, math.ceil(-math.log10(tolerance_for_zoom(zoom))))
+
+
+def simplify_coverage(geometries: Sequence[Any], tolerance: float) -> np.ndarray:
+    """
+    행정동 폴리곤을 공유 경계 기준으로 함께 단순화
+
+    GEOS의 coverage 단순화는 이웃 폴리곤이 공유하는 경계선을 한 번만 단순화하므로
+    경계 사이에 틈(seam)이나 겹침이 생기지 않습니다 (shapely 2.1 이상 필요).
+    입력 경계 자체가 올바른 coverage가 아니면(이웃 경계가 정확히 일치하지 않거나 겹침)
+    공유 경계를 정할 수 없으므로 폴리곤별 topology 보존 단순화로 대체합니다.
+
+    Args:
+        geometries: 행정동 폴리곤 목록
+        tolerance: 단순화 허용 오차 (좌표 단위)
+
+    Returns:
+        입력 순서의 단순화된 폴리곤 배열
+    """
+    if not hasattr(shapely, "coverage_simplify"):
+        raise ImportError("공유 경계 단순화에는 shapely 2.1 이상이 필요합니다. (pip install 'shapely>=2.1')")
+    geometries = np.asarray(geometries, dtype=object)
+    if not shapely.coverage_is_valid(geometries):
+        print("행정동 경계가 올바른 coverage가 아니어서 폴리곤별로 단순화합니다 (경계 사이에 틈이 생길 수 있음).")
+        return shapely.simplify(geometries, tolerance, preserve_topology=True)
+    return shapely.coverage_simplify(geometries, tolerance, simplify_boundary=True)
+
+
+def simplify_geojson(geojson_data: Dict[str, Any], zoom: int) -> Dict[str, Any]:
+    """
+    GeoJSON FeatureCollection을 줌 레벨에 맞게 단순화하고 좌표 자릿수를 줄임
+
+    Args:
+        geojson_data: 행정동 경계 GeoJSON 데이터
+        zoom: 대상 줌 레벨
+
+    Returns:
+        속성은 그대로이고 geometry만 단순화된 새 GeoJSON 데이터
+    """
+    features = geojson_data['features']
+    geometries = simplify_coverage([shape(feature['geometry']) for feature in features], tolerance_for_zoom(zoom))
+    # 공유 경계의 꼭짓점은 양쪽에서 같은 값으로 반올림되므로 틈이 생기지 않음
+    digits = digits_for_zoom(zoom)
+    geometries = shapely.transform(geometries, lambda coords: np.round(coords, digits))
+
+    simplified = {key: value for key, value in geojson_data.items() if key != 'features'}
+    simplified['features'] = [
+        {**feature, 'geometry': mapping(geometry)}
+        for feature, geometry in zip(features, geometries)
+        if not geometry.is_empty
+    ]
+    return simplified
+
+
+def to_topojson(geojson_data: Dict[str, Any], zoom: int) -> Dict[str, Any]:
+    """
+    단순화된 GeoJSON을 공유 arc와 양자화 좌표를 쓰는 TopoJSON으로 변환 (topojson 패키지 필요)
+
+    Args:
+        geojson_data: 줌 레벨에 맞게 단순화된 GeoJSON 데이터
+        zoom: 대상 줌 레벨 (양자화 격자 크기 결정)
+
+    Returns:
+        TopoJSON 데이터 (객체 이름: 'boundaries')
+    """
+    if topojson is None:
+        raise ImportError("TopoJSON 생성에는 topojson 패키지가 필요합니다. (pip install topojson)")
+    minx, miny, maxx, maxy = shapely.total_bounds(
+        np.array([shape(feature['geometry']) for feature in geojson_data['features']], dtype=object)
+    )
+    # 전체 범위를 반 픽셀 격자로 나눈 개수만큼 양자화
+    quantization = int(max(maxx - minx, maxy - miny) / tolerance_for_zoom(zoom)) + 1
+    topology = topojson.Topology(geojson_data, object_name='boundaries', prequantize=quantization)
+    return json.loads(topology.to_json())
+
+
+def prepare_boundaries(source_path: str,
+                       output_dir: str = DEFAULT_OUTPUT_DIR,
+                       zooms: Sequence[int] = DEFAULT_ZOOMS,
+                       topojson_output: bool = False) -> Dict[int, str]:
+    """
+    줌 레벨별 단순화 경계 파일 생성 (원본보다 오래된 파일만 다시 생성)
+
+    Args:
+        source_path: 원본 행정동 경계 GeoJSON 경로
+        output_dir: 단순화 파일 저장 디렉토리
+        zooms: 생성할 줌 레벨 목록
+        topojson_output: True면 GeoJSON 대신 TopoJSON(.topojson)으로 저장
+
+    Returns:
+        {줌 레벨: 파일 경로}
+    """
+    base_name = os.path.splitext(os.path.basename(source_path))[0]
+    extension = 'topojson' if topojson_output else 'geojson'
+    paths = {zoom: os.path.join(output_dir, f"{base_name}_z{zoom}.{extension}") for zoom in zooms}
+
+    source_mtime = os.stat(source_path).st_mtime_ns
+    stale = {zoom: path for zoom, path in paths.items()
+             if not os.path.exists(path) or os.stat(path).st_mtime_ns < source_mtime}
+    if not stale:
+        return paths
+
+    with open(source_path, 'r', encoding='utf-8') as f:
+        geojson_data = json.load(f)
+    os.makedirs(output_dir, exist_ok=True)
+
+    for zoom, path in stale.items():
+        data = simplify_geojson(geojson_data, zoom)
+        if topojson_output:
+            data = to_topojson(data, zoom)
+        # 동시에 실행되는 다른 프로세스가 쓰다 만 파일을 읽지 않도록 임시 파일 후 교체
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+        print(f"줌 {zoom} 경계 저장: {path} ({os.path.getsize(path):,} bytes)")
+    return paths
+
+
+def select_boundary(paths: Dict[int, str], zoom: int) -> Optional[str]:
+    """
+    지도 줌 레벨에 맞는 단순화 경계 파일 선택
+
+    해당 줌 이상으로 단순화된 파일 중 가장 거친 것을 고르고, 없으면 가장 정밀한 파일을 사용합니다.
+
+    Args:
+        paths: {줌 레벨: 파일 경로}
+        zoom: 지도 줌 레벨
+
+    Returns:
+        파일 경로 (후보가 없으면 None)
+    """
+    if not paths:
+        return None
+    candidates = [z for z in paths if z >= zoom]
+    return paths[min(candidates) if candidates else max(paths)]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="줌 레벨별 단순화 행정동 경계 생성")
+    parser.add_argument("source", nargs="?", default="data/busan_emd_wgs84.geojson", help="원본 행정동 경계 GeoJSON")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR, help="단순화 파일 저장 디렉토리")
+    parser.add_argument("--zooms", nargs="+", type=int, default=list(DEFAULT_ZOOMS), help="생성할 줌 레벨")
+    parser.add_argument("--topojson", action="store_true", help="TopoJSON으로 저장 (topojson 패키지 필요)")
+    args = parser.parse_args()
+    prepare_boundaries(args.source, args.output_dir, args.zooms, args.topojson)
@@ -0,0 +1,102 @@
+"""
+좌표계 변환 (공공데이터 EPSG:5174 좌표 → WGS84 경위도)
+- Transformer는 좌표계 쌍별로 프로세스 전체에서 한 번만 생성
+- 행 단위 반복 대신 NumPy 열 전체를 한 번에 변환
+"""
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from pyproj import Transformer
+
+# 공공데이터(인허가 정보) CSV의 좌표 열 이름
+EPSG5174_X_COLUMN = '좌표정보x(epsg5174)'
+EPSG5174_Y_COLUMN = '좌표정보y(epsg5174)'
+
+SOURCE_CRS = "epsg:5174"
+TARGET_CRS = "epsg:4326"
+
+
+@lru_cache(maxsize=None)
+def _cached_transformer(source_crs: str, target_crs: str) -> Transformer:
+    return Transformer.from_crs(source_crs, target_crs, always_xy=True)
+
+
+def get_transformer(source_crs: str = SOURCE_CRS, target_crs: str = TARGET_CRS) -> Transformer:
+    """
+    좌표계 쌍별로 캐시된 Transformer 반환 (경도, 위도 순서)
+
+    Args:
+        source_crs: 원본 좌표계
+        target_crs: 대상 좌표계
+
+    Returns:
+        always_xy=True로 생성된 Transformer
+    """
+    return _cached_transformer(source_crs.lower(), target_crs.lower())
+
+
+def transform_coordinates(x: Sequence[float],
+                          y: Sequence[float],
+                          source_crs: str = SOURCE_CRS,
+                          target_crs: str = TARGET_CRS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    좌표 배열 전체를 한 번에 변환
+
+    Args:
+        x: 원본 x 좌표 배열
+        y: 원본 y 좌표 배열
+        source_crs: 원본 좌표계
+        target_crs: 대상 좌표계
+
+    Returns:
+        (경도 배열, 위도 배열) float64, 변환할 수 없는 좌표는 NaN
+    """
+    xs = np.asarray(x, dtype=np.float64)
+    ys = np.asarray(y, dtype=np.float64)
+    lngs, lats = get_transformer(source_crs, target_crs).transform(xs, ys)
+    lngs = np.asarray(lngs, dtype=np.float64)
+    lats = np.asarray(lats, dtype=np.float64)
+
+    invalid = ~(np.isfinite(lngs) & np.isfinite(lats))
+    if invalid.any():
+        lngs = np.where(invalid, np.nan, lngs)
+        lats = np.where(invalid, np.nan, lats)
+    return lngs, lats
+
+
+def normalize_coordinate_columns(df: pd.DataFrame,
+                                 x_col: str = EPSG5174_X_COLUMN,
+                                 y_col: str = EPSG5174_Y_COLUMN,
+                                 lng_col: str = 'lng',
+                                 lat_col: str = 'lat',
+                                 source_crs: str = SOURCE_CRS) -> pd.DataFrame:
+    """
+    좌표 열을 WGS84 경위도 열로 변환
+
+    좌표가 비어 있거나 숫자가 아닌 행은 제외하고, 원본 좌표 열도 float64로 바꿔 씁니다.
+
+    Args:
+        df: 원본 좌표 열을 포함한 데이터프레임
+        x_col: 원본 x 좌표 열 이름
+        y_col: 원본 y 좌표 열 이름
+        lng_col: 경도를 저장할 열 이름
+        lat_col: 위도를 저장할 열 이름
+        source_crs: 원본 좌표계
+
+    Returns:
+        경도/위도 열이 추가된 새 데이터프레임
+    """
+    x = pd.to_numeric(df[x_col], errors='coerce')
+    y = pd.to_numeric(df[y_col], errors='coerce')
+    valid = (x.notna() & y.notna()).to_numpy()
+
+    result = df.loc[valid].copy()
+    result[x_col] = x.to_numpy(dtype=np.float64)[valid]
+    result[y_col] = y.to_numpy(dtype=np.float64)[valid]
+
+    lngs, lats = transform_coordinates(result[x_col].to_numpy(), result[y_col].to_numpy(), source_crs)
+    result[lng_col] = lngs
+    result[lat_col] = lats
+    return result
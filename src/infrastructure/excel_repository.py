@@ -1,14 +1,28 @@
 """
 엑셀 파일에서 동물병원 데이터를 로드하는 레포지토리
 """
+import csv
+import hashlib
 import os
-import pandas as pd
+import re
+try:
+    import pandas as pd
 except ImportError:
     print("pandas 모듈을 가져올 수 없습니다. 기본 CSV 처리 방식을 사용합니다.")
-    import csv
     pd = None
 import subprocess
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
+
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet  # noqa: F401  (변환 캐시 저장/읽기용)
+except ImportError:
+    pyarrow = None
 
 from src.domain.entity import VetHospital
 
@@ -18,14 +32,39 @@ class ExcelRepository:
     엑셀 파일에서 동물병원 데이터를 로드하는 레포지토리
     """
     
-    def __init__(self, file_path: str):
+    # 데이터셋마다 열 이름이 다를 수 있으므로 필드별 열 이름 후보 (앞에 있을수록 우선)
+    FIELD_CANDIDATES = {
+        "name": ['사업장명', '병원명', '이름', '업체명', '상호', '사업자명'],
+        "address": [
+            '주소', '소재지도로명주소', '소재지지번주소', '도로명주소', '지번주소',
+            '주소(도로명)', '주소(지번)', '소재지(도로명)', '소재지(지번)'
+        ],
+        "latitude": ['위도', 'latitude', 'lat', 'Y', '좌표정보(Y)', 'Y좌표'],
+        "longitude": ['경도', 'longitude', 'lon', 'lng', 'X', '좌표정보(X)', 'X좌표'],
+        "phone": ['전화번호', '연락처', 'tel', '전화', '대표전화', '소재지전화'],
+        "id": ['id', 'ID', '식별자', '관리번호', '번호'],
+    }
+    # 도시 필터링에 사용하는 주소 열 후보
+    CITY_ADDRESS_FIELDS = ['주소', '소재지도로명주소', '소재지지번주소', '도로명주소', '지번주소', '주소(도로명)', '주소(지번)']
+    # 엑셀을 Parquet 변환 캐시로 옮길 때 한 번에 읽는 행 수
+    CONVERT_CHUNKSIZE = 50000
+    
+    def __init__(self,
+                 file_path: str,
+                 chunksize: Optional[int] = None,
+                 cache_dir: Optional[str] = os.path.join("data", "cache")):
         """
         데이터 파일 레포지토리 초기화
         
         Args:
             file_path: 엑셀 또는 CSV 파일 경로
+            chunksize: 지정하면 파일 전체를 메모리에 올리지 않고 이 행 수만큼씩 읽어 처리
+            cache_dir: 엑셀 파일을 변환한 Parquet 캐시 디렉토리 (None이면 캐시 비활성화)
         """
         self.file_path = file_path
+        self.chunksize = chunksize
+        self.cache_dir = cache_dir
+        self._cache_path: Optional[str] = None
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"파일이 존재하지 않습니다: {file_path}")
             
@@ -51,7 +90,10 @@ class ExcelRepository:
             도시에 해당하는 동물병원 리스트
         """
         try:
-            if self.is_csv:
+            if self.chunksize and pd is not None:
+                # 청크 단위 스트리밍 로드 (메모리 사용량 제한)
+                hospitals = list(self.iter_hospitals(city, self.chunksize))
+            elif self.is_csv:
                 # CSV 파일에서 직접 로드
                 hospitals = self._load_from_csv(self.file_path, city)
             elif pd is not None:
@@ -69,20 +111,149 @@ class ExcelRepository:
         print(f"{len(hospitals)}개 동물병원 데이터 로드됨 (도시: {city})")
         return hospitals
     
+    def iter_hospitals(self, city: str = "부산", chunksize: int = 50000) -> Iterator[VetHospital]:
+        """
+        파일을 chunksize 행씩 읽으면서 도시 필터링과 객체 변환을 청크마다 수행
+        
+        CSV는 pandas chunksize로, XLSX는 openpyxl read_only 모드의 행 반복으로 읽으므로
+        파일 크기와 관계없이 한 번에 chunksize 행만 메모리에 올라갑니다.
+        
+        Args:
+            city: 필터링할 도시 이름
+            chunksize: 한 번에 처리할 행 수
+        
+        Yields:
+            도시에 해당하는 동물병원 (파일의 행 순서)
+        """
+        for chunk in self._iter_chunks(chunksize):
+            filtered = chunk[self._city_mask(chunk, city)]
+            if len(filtered):
+                yield from self._frame_to_hospitals(filtered)
+    
+    def _iter_chunks(self, chunksize: int) -> Iterator["pd.DataFrame"]:
+        """파일을 chunksize 행씩 데이터프레임으로 읽기 (모든 값은 문자열로 읽음)"""
+        if self.is_csv:
+            # 청크마다 dtype 추론이 달라지지 않도록 문자열로 읽고 좌표만 숫자로 변환
+            yield from pd.read_csv(self.file_path, encoding='utf-8', dtype=str, chunksize=chunksize)
+            return
+        
+        cache_path = self._converted_path()
+        if cache_path:
+            parquet_file = pyarrow.parquet.ParquetFile(cache_path)
+            for batch in parquet_file.iter_batches(batch_size=chunksize):
+                yield batch.to_pandas()
+            return
+        
+        yield from self._iter_excel_chunks(chunksize)
+    
+    def _iter_excel_chunks(self, chunksize: int) -> Iterator["pd.DataFrame"]:
+        """엑셀 파일을 chunksize 행씩 문자열 데이터프레임으로 읽기 (openpyxl read_only 모드)"""
+        if openpyxl is None:
+            print("openpyxl을 사용할 수 없어 엑셀 파일 전체를 한 번에 읽습니다.")
+            yield pd.read_excel(self.file_path, dtype=str)
+            return
+        
+        workbook = openpyxl.load_workbook(self.file_path, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            columns = [str(value) if value is not None else f"Unnamed: {i}" for i, value in enumerate(header)]
+            
+            buffer = []
+            for row in rows:
+                buffer.append(row)
+                if len(buffer) >= chunksize:
+                    yield self._rows_to_frame(buffer, columns)
+                    buffer = []
+            if buffer:
+                yield self._rows_to_frame(buffer, columns)
+        finally:
+            workbook.close()
+    
+    @staticmethod
+    def _rows_to_frame(rows: List[tuple], columns: List[str]) -> "pd.DataFrame":
+        """openpyxl 행 튜플 목록을 문자열 데이터프레임으로 변환 (빈 셀은 결측)"""
+        width = len(columns)
+        frame = pd.DataFrame([tuple(row[:width]) + (None,) * (width - len(row)) for row in rows],
+                             columns=columns, dtype=object)
+        return frame.where(frame.isna(), frame.astype(str))
+    
+    def _converted_path(self) -> Optional[str]:
+        """
+        엑셀 파일의 Parquet 변환 캐시 경로 (없으면 이번에 한 번 변환)
+        
+        캐시 파일 이름은 원본 경로의 해시와 내용의 해시로 구성되므로 파일이 바뀌면 새로 변환하고,
+        같은 경로의 이전 버전 캐시만 삭제합니다.
+        
+        Returns:
+            변환 캐시 경로 (캐시를 사용할 수 없거나 변환에 실패하면 None)
+        """
+        if self._cache_path is not None:
+            return self._cache_path
+        if self.is_csv or self.cache_dir is None or pd is None or pyarrow is None:
+            return None
+        
+        digest = hashlib.sha1()
+        with open(self.file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        base_name = os.path.splitext(os.path.basename(self.file_path))[0]
+        # 이름이 같은 다른 경로의 파일과 캐시가 섞이지 않도록 경로 해시를 고정 부분에 포함
+        source_key = hashlib.sha1(os.path.abspath(self.file_path).encode("utf-8")).hexdigest()[:12]
+        cache_path = os.path.join(self.cache_dir, f"{base_name}_{source_key}_{digest.hexdigest()[:16]}.parquet")
+        
+        if not os.path.exists(cache_path) and not self._convert_to_parquet(cache_path):
+            return None
+        self._cache_path = cache_path
+        return cache_path
+    
+    def _convert_to_parquet(self, cache_path: str) -> bool:
+        """엑셀 파일을 청크 단위로 읽어 모든 열을 문자열로 저장한 Parquet 캐시 생성"""
+        print(f"엑셀 파일을 Parquet 캐시로 변환 중: {self.file_path}")
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # 동시에 실행되는 다른 프로세스가 쓰다 만 파일을 읽지 않도록 임시 파일 후 교체
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        writer = None
+        try:
+            for chunk in self._iter_excel_chunks(self.CONVERT_CHUNKSIZE):
+                if writer is None:
+                    schema = pyarrow.schema([(str(column), pyarrow.string()) for column in chunk.columns])
+                    writer = pyarrow.parquet.ParquetWriter(tmp_path, schema)
+                writer.write_table(pyarrow.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            if writer is None:
+                return False
+            writer.close()
+            writer = None
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"엑셀 변환 캐시 저장 실패: {e}")
+            return False
+        finally:
+            if writer is not None:
+                writer.close()
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        
+        # 같은 경로 파일의 이전 버전 캐시만 정리 (hospitals_2024.xlsx 등 이름이 겹치는 파일 캐시는 유지)
+        file_name = os.path.basename(cache_path)
+        source_part = file_name.rsplit("_", 1)[0]
+        stale_pattern = re.compile(re.escape(source_part) + r"_[0-9a-f]{16}\.parquet")
+        for stale_name in os.listdir(self.cache_dir):
+            if stale_name != file_name and stale_pattern.fullmatch(stale_name):
+                os.remove(os.path.join(self.cache_dir, stale_name))
+        return True
+    
     def _load_with_pandas(self, city: str) -> List[VetHospital]:
-        """pandas를 사용해 엑셀 파일에서 데이터 로드"""
-        df = pd.read_excel(self.file_path)
+        """pandas를 사용해 엑셀 파일에서 데이터 로드 (변환 캐시가 있으면 Parquet에서 읽음)"""
+        cache_path = self._converted_path()
+        # 청크 로드와 같은 결과가 되도록 모든 열을 문자열로 읽음 (좌표만 변환 시 숫자로)
+        df = pd.read_parquet(cache_path) if cache_path else pd.read_excel(self.file_path, dtype=str)
         
         # 주소(도로명 또는 지번) 필드가 있다고 가정하고 city로 필터링
-        filtered_df = df[df.apply(lambda row: self._is_in_city(row, city), axis=1)]
-        
-        hospitals = []
-        for _, row in filtered_df.iterrows():
-            hospital = self._row_to_hospital(row)
-            if hospital:
-                hospitals.append(hospital)
-                
-        return hospitals
+        filtered_df = df[self._city_mask(df, city)]
+        return self._frame_to_hospitals(filtered_df)
     
     def _convert_and_load(self, city: str) -> List[VetHospital]:
         """엑셀 파일을 CSV로 변환 후 로드 (pandas 호환성 문제 해결용)"""
@@ -109,11 +280,7 @@ class ExcelRepository:
         """외부 명령어를 사용해 엑셀을 CSV로 변환"""
         cmd = [
             "python", "-c", 
-            f"import pandas as pd
-except ImportError:
-    print("pandas 모듈을 가져올 수 없습니다. 기본 CSV 처리 방식을 사용합니다.")
-    import csv
-    pd = None; pd.read_excel('{excel_path}').to_csv('{csv_path}', index=False, encoding='utf-8')"
+            f"import pandas as pd; pd.read_excel('{excel_path}').to_csv('{csv_path}', index=False, encoding='utf-8')"
         ]
         
         # 서브프로세스로 실행
@@ -145,7 +312,8 @@ except ImportError:
             return self._load_from_csv_basic(csv_path, city)
             
         try:
-            df = pd.read_csv(csv_path, encoding='utf-8')
+            # 청크 로드와 같은 결과가 되도록 모든 열을 문자열로 읽음 (좌표만 변환 시 숫자로)
+            df = pd.read_csv(csv_path, encoding='utf-8', dtype=str)
             print(f"CSV 파일에서 총 {len(df)}개 행 로드됨")
             print(f"컬럼 목록: {', '.join(df.columns.tolist())}")
             
@@ -154,16 +322,10 @@ except ImportError:
             print(df.head(3))
             
             # city로 필터링
-            filtered_df = df[df.apply(lambda row: self._is_in_city(row, city), axis=1)]
+            filtered_df = df[self._city_mask(df, city)]
             print(f"'{city}' 필터링 후 {len(filtered_df)}개 행 남음")
             
-            hospitals = []
-            for _, row in filtered_df.iterrows():
-                hospital = self._row_to_hospital(row)
-                if hospital:
-                    hospitals.append(hospital)
-                    
-            return hospitals
+            return self._frame_to_hospitals(filtered_df)
         except Exception as e:
             print(f"pandas로 CSV 로드 중 오류 발생: {e}")
             return self._load_from_csv_basic(csv_path, city)
@@ -182,7 +344,7 @@ except ImportError:
                 address_fields = [h for h in headers if '주소' in h or '소재지' in h]
                 print(f"주소 관련 필드: {address_fields}")
                 
-                for row_num, row in enumerate(reader):
+                for row in reader:
                     # 도시 필터링
                     is_in_city = False
                     for field in address_fields:
@@ -194,16 +356,7 @@ except ImportError:
                         continue
                         
                     # 병원 객체 생성
-                    hospital_dict = {}
-                    for field in row:
-                        hospital_dict[field] = row[field]
-                    
-                    # 메타데이터 출력 (처음 몇 개만)
-                    if row_num < 3:
-                        print(f"\n데이터 행 {row_num+1}: {hospital_dict}")
-                    
-                    # 병원 객체 생성
-                    hospital = self._dict_to_hospital(hospital_dict)
+                    hospital = self._dict_to_hospital(row)
                     if hospital:
                         hospitals.append(hospital)
                         
@@ -213,71 +366,97 @@ except ImportError:
             print(f"기본 CSV 로드 중 오류: {e}")
             return []
     
-    def _is_in_city(self, row: pd.Series, city: str) -> bool:
-        """행이 특정 도시에 속하는지 확인 (주소 필드에 도시명 포함 여부)"""
-        # 데이터셋의 열 이름이 확실하지 않으므로 가능한 주소 필드 후보들을 확인
-        address_fields = ['주소', '소재지도로명주소', '소재지지번주소', '도로명주소', '지번주소', '주소(도로명)', '주소(지번)']
+    def _detect_schema(self, columns: List[str]) -> Dict[str, List[str]]:
+        """
+        파일의 열 이름에서 필드별로 존재하는 후보 열 찾기 (파일당 한 번)
         
-        for field in address_fields:
-            if field in row and isinstance(row[field], str) and city in row[field]:
-                return True
+        Args:
+            columns: 데이터프레임 열 이름 목록
+        
+        Returns:
+            {필드: 우선순위 순서의 존재하는 열 이름 목록}
+        """
+        present = set(columns)
+        return {
+            field: [column for column in candidates if column in present]
+            for field, candidates in self.FIELD_CANDIDATES.items()
+        }
+    
+    def _city_mask(self, df: "pd.DataFrame", city: str) -> "pd.Series":
+        """행이 특정 도시에 속하는지 여부 (주소 열에 도시명 포함 또는 시도/시군구 일치)"""
+        mask = pd.Series(False, index=df.index)
+        for field in self.CITY_ADDRESS_FIELDS:
+            if field in df.columns:
+                mask |= self._contains(df[field], city)
         
         # 시도 및 시군구 필드가 따로 있는 경우
-        if '시도' in row and row['시도'] == city:
-            return True
-        if '시군구' in row and city in row['시군구']:
-            return True
-            
-        return False
+        if '시도' in df.columns:
+            mask |= (df['시도'] == city).fillna(False).astype(bool)
+        if '시군구' in df.columns:
+            mask |= self._contains(df['시군구'], city)
+        return mask.astype(bool)
     
-    def _row_to_hospital(self, row: pd.Series) -> Optional[VetHospital]:
-        """pandas Series 행을 VetHospital 객체로 변환"""
-        try:
-            # 필드명이 데이터셋마다 다를 수 있으므로 가능한 필드명 후보들을 확인
-            name = self._get_value_from_candidates(row, ['사업장명', '병원명', '이름', '업체명', '상호', '사업자명'])
-            address = self._get_value_from_candidates(row, [
-                '주소', '소재지도로명주소', '소재지지번주소', '도로명주소', '지번주소', 
-                '주소(도로명)', '주소(지번)', '소재지(도로명)', '소재지(지번)'
-            ])
-            
-            # 위도 경도 추출
-            latitude = self._get_value_from_candidates(row, ['위도', 'latitude', 'lat', 'Y', '좌표정보(Y)', 'Y좌표'])
-            longitude = self._get_value_from_candidates(row, ['경도', 'longitude', 'lon', 'lng', 'X', '좌표정보(X)', 'X좌표'])
-            
-            # 전화번호 추출
-            phone = self._get_value_from_candidates(row, ['전화번호', '연락처', 'tel', '전화', '대표전화', '소재지전화'])
-            
+    @staticmethod
+    def _contains(column: "pd.Series", text: str) -> "pd.Series":
+        """문자열 값에 text가 포함되는지 여부 (숫자 등 문자열이 아닌 값은 False)"""
+        if not (pd.api.types.is_string_dtype(column) or column.dtype == object):
+            return pd.Series(False, index=column.index)
+        return column.str.contains(text, regex=False, na=False).astype(bool)
+    
+    @staticmethod
+    def _coalesce(df: "pd.DataFrame", columns: List[str]) -> "pd.Series":
+        """후보 열 중 비어 있지 않은 첫 번째 값 (없으면 None)"""
+        result = pd.Series(None, index=df.index, dtype=object)
+        for column in columns:
+            values = df[column].astype(object)
+            fill = result.isna() & values.notna() & (values != "")
+            result[fill] = values[fill]
+        return result.where(result.notna(), None)
+    
+    def _frame_to_hospitals(self, df: "pd.DataFrame") -> List[VetHospital]:
+        """
+        데이터프레임 열 배열로 VetHospital 목록 일괄 생성
+        
+        열 이름은 파일당 한 번만 확인하고, 이름 또는 주소가 없는 행은 제외합니다.
+        
+        Args:
+            df: 도시 필터링된 데이터프레임
+        
+        Returns:
+            동물병원 목록 (행 순서 유지)
+        """
+        schema = self._detect_schema(df.columns.tolist())
+        names = self._coalesce(df, schema["name"])
+        addresses = self._coalesce(df, schema["address"])
+        valid = (names.notna() & addresses.notna()).to_numpy()
+        
+        # 좌표가 없거나 숫자가 아니면 None
+        coordinates = {}
+        for field in ("latitude", "longitude"):
+            values = pd.to_numeric(self._coalesce(df, schema[field]), errors="coerce")
+            coordinates[field] = values.astype(object).where(values.notna(), None).tolist()
+        phones = self._coalesce(df, schema["phone"]).fillna("").tolist()
+        ids = self._coalesce(df, schema["id"]).tolist()
+        names, addresses = names.tolist(), addresses.tolist()
+        
+        hospitals = []
+        for i in range(len(df)):
+            if not valid[i]:
+                continue
             # ID 생성: 없으면 이름+주소 조합으로 (중복 방지)
-            id_value = self._get_value_from_candidates(row, ['id', 'ID', '식별자', '관리번호', '번호'])
-            if not id_value:
-                id_value = str(hash(f"{name}_{address}"))
-                
-            # 필수 필드 확인
-            if not name or not address:
-                return None
-                
-            # 좌표가 없거나 숫자가 아니면 None으로 설정
-            try:
-                lat_float = float(latitude) if latitude else None
-                lng_float = float(longitude) if longitude else None
-            except:
-                lat_float = None
-                lng_float = None
-                
-            return VetHospital(
+            id_value = str(ids[i]) if ids[i] is not None else str(hash(f"{names[i]}_{addresses[i]}"))
+            hospitals.append(VetHospital(
                 id=id_value,
-                name=name,
-                address=address,
-                latitude=lat_float,
-                longitude=lng_float,
-                phone=phone or "",
+                name=names[i],
+                address=addresses[i],
+                latitude=coordinates["latitude"][i],
+                longitude=coordinates["longitude"][i],
+                phone=phones[i],
                 place_url="",  # 엑셀/CSV에는 없는 필드
                 dong_code=None,
                 dong_name=None
-            )
-        except Exception as e:
-            print(f"병원 객체 생성 중 오류: {e}")
-            return None
+            ))
+        return hospitals
     
     def _dict_to_hospital(self, row_dict: Dict[str, str]) -> Optional[VetHospital]:
         """딕셔너리를 VetHospital 객체로 변환 (기본 CSV 처리용)"""
@@ -363,10 +542,3 @@ except ImportError:
         except Exception as e:
             print(f"딕셔너리 변환 중 오류: {e}")
             return None
-    
-    def _get_value_from_candidates(self, row: pd.Series, candidates: List[str]):
-        """여러 후보 필드명 중 존재하는 첫 번째 필드의 값 반환"""
-        for field in candidates:
-            if field in row and row[field] is not None and row[field] != "":
-                return row[field]
-        return None
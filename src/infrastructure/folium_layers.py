@@ -0,0 +1,227 @@
+"""
+folium 지도용 시설 마커 레이어
+- fast: 시설 유형별 GeoJSON 레이어 하나에 모든 점을 담고 canvas에 원형 마커로 그림
+- cluster: FastMarkerCluster로 브라우저에서 마커를 만들고 묶어서 표시
+- markers: 기존처럼 시설마다 CircleMarker와 Popup 객체를 HTML에 생성
+fast/cluster 모드의 팝업 HTML은 공유 속성 배열에서 마커를 클릭할 때만 만듭니다.
+"""
+import html
+import json
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import folium
+    from folium.plugins import FastMarkerCluster
+    from folium.utilities import JsCode
+except ImportError:
+    folium = None
+
+RENDER_MODES = ('fast', 'cluster', 'markers')
+
+# 좌표는 소수점 6자리(약 10cm)면 충분하므로 HTML 크기를 줄이기 위해 반올림
+COORDINATE_DIGITS = 6
+
+# 팝업 템플릿의 {필드} 자리에 HTML 이스케이프한 속성 값을 채우는 JS 함수
+_RENDER_POPUP_JS = """function(template, props) {
+    return template.replace(/\\{([^{}]+)\\}/g, function(match, key) {
+        var value = props[key];
+        if (value === null || value === undefined) { return ''; }
+        return String(value).replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;')
+            .replace(/"/g, '&quot;').replace(/'/g, '&#x27;');
+    });
+}"""
+
+
+def _require_folium() -> None:
+    if folium is None:
+        raise ImportError("지도 생성에는 folium 패키지가 필요합니다. (pip install folium)")
+
+
+def _js_literal(value: Any) -> str:
+    """HTML <script> 안에 넣을 JSON 리터럴 (값 안의 </script>가 스크립트를 끝내지 않도록 이스케이프)"""
+    return json.dumps(value, ensure_ascii=False).replace('</', '<\\/')
+
+
+def _clean_value(value: Any) -> Any:
+    """JSON으로 보낼 수 있게 결측치는 None, numpy 스칼라는 파이썬 값으로 변환"""
+    if value is None:
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if hasattr(value, 'item'):
+        value = value.item()
+        if isinstance(value, float) and math.isnan(value):
+            return None
+    return value
+
+
+def facility_records(df: Any,
+                     fields: Sequence[str],
+                     lat_col: str = 'lat',
+                     lng_col: str = 'lng') -> Tuple[List[List[float]], List[Dict[str, Any]]]:
+    """
+    시설 DataFrame을 좌표 목록과 팝업용 속성 목록으로 변환 (좌표가 없는 행은 제외)
+
+    Args:
+        df: 시설 DataFrame
+        fields: 팝업에 사용할 열 이름 목록 (없는 열은 None)
+        lat_col: 위도 열 이름
+        lng_col: 경도 열 이름
+
+    Returns:
+        ([[위도, 경도], ...], [{필드: 값}, ...]) - 두 목록의 순서가 같음
+    """
+    lats = df[lat_col].astype(float).to_numpy()
+    lngs = df[lng_col].astype(float).to_numpy()
+    valid = np.isfinite(lats) & np.isfinite(lngs)
+
+    columns = {field: (df[field].tolist() if field in df.columns else [None] * len(df)) for field in fields}
+    coords: List[List[float]] = []
+    properties: List[Dict[str, Any]] = []
+    for i in range(len(df)):
+        if not valid[i]:
+            continue
+        coords.append([round(float(lats[i]), COORDINATE_DIGITS), round(float(lngs[i]), COORDINATE_DIGITS)])
+        properties.append({field: _clean_value(values[i]) for field, values in columns.items()})
+    return coords, properties
+
+
+class _BlankDict(dict):
+    """템플릿에 있지만 속성에 없는 필드는 빈 문자열로 채움"""
+
+    def __missing__(self, key: str) -> str:
+        return ''
+
+
+def render_popup(template: str, props: Dict[str, Any]) -> str:
+    """팝업 템플릿의 {필드} 자리에 HTML 이스케이프한 속성 값을 채움 (JS 팝업 생성과 같은 규칙)"""
+    values = {key: '' if value is None else html.escape(str(value)) for key, value in props.items()}
+    return template.format_map(_BlankDict(values))
+
+
+def _marker_options(color: str, radius: float) -> Dict[str, Any]:
+    return {'radius': radius, 'color': color, 'fill': True, 'fillColor': color, 'fillOpacity': 0.7}
+
+
+def facility_layer(df: Any,
+                   name: str,
+                   color: str,
+                   popup_template: str,
+                   fields: Sequence[str],
+                   lat_col: str = 'lat',
+                   lng_col: str = 'lng',
+                   radius: float = 5,
+                   popup_max_width: int = 250,
+                   show: bool = True,
+                   mode: str = 'fast') -> Any:
+    """
+    시설 유형 하나를 레이어 컨트롤에서 켜고 끌 수 있는 folium 레이어로 생성
+
+    Args:
+        df: 시설 DataFrame
+        name: 레이어 이름 (레이어 컨트롤 표시)
+        color: 마커 선/채우기 색
+        popup_template: {필드} 자리표시자를 가진 팝업 HTML 템플릿
+        fields: 팝업에 사용할 열 이름 목록
+        lat_col: 위도 열 이름
+        lng_col: 경도 열 이름
+        radius: 마커 반지름 (픽셀)
+        popup_max_width: 팝업 최대 폭 (픽셀)
+        show: 지도를 열 때 레이어 표시 여부
+        mode: 'fast'(GeoJSON 레이어 하나), 'cluster'(FastMarkerCluster), 'markers'(시설별 CircleMarker)
+
+    Returns:
+        지도에 추가할 folium 레이어
+    """
+    _require_folium()
+    if mode not in RENDER_MODES:
+        raise ValueError(f"지원하지 않는 렌더링 모드입니다: {mode} (선택: {', '.join(RENDER_MODES)})")
+
+    coords, properties = facility_records(df, fields, lat_col, lng_col)
+    if mode == 'markers':
+        return _marker_group(coords, properties, name, color, popup_template, radius, popup_max_width, show)
+
+    popup_options = json.dumps({'maxWidth': popup_max_width})
+    if mode == 'cluster':
+        # 좌표 행에는 속성 배열의 인덱스만 두고, 팝업은 클릭할 때 공유 속성에서 생성
+        # FastMarkerCluster가 `var callback = <callback>;`으로 넣으므로 공유 배열을 감싼 함수 식 하나로 전달
+        callback = f"""(function() {{
+            var props = {_js_literal(properties)};
+            var template = {_js_literal(popup_template)};
+            var renderPopup = {_RENDER_POPUP_JS};
+            var options = {json.dumps(_marker_options(color, radius))};
+            return function(row) {{
+                var marker = L.circleMarker(new L.LatLng(row[0], row[1]), options);
+                marker.bindPopup(function() {{ return renderPopup(template, props[row[2]]); }}, {popup_options});
+                return marker;
+            }};
+        }})()"""
+        data = [[lat, lng, i] for i, (lat, lng) in enumerate(coords)]
+        return FastMarkerCluster(data, callback=callback, name=name, show=show)
+
+    features = [
+        {'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': [lng, lat]}, 'properties': props}
+        for (lat, lng), props in zip(coords, properties)
+    ]
+    on_each_feature = JsCode(f"""function(feature, layer) {{
+        var template = {_js_literal(popup_template)};
+        var renderPopup = {_RENDER_POPUP_JS};
+        layer.bindPopup(function() {{ return renderPopup(template, feature.properties); }}, {popup_options});
+    }}""")
+    marker = folium.CircleMarker(radius=radius, color=color, fill=True, fill_color=color, fill_opacity=0.7)
+    return folium.GeoJson(
+        {'type': 'FeatureCollection', 'features': features},
+        name=name,
+        show=show,
+        marker=marker,
+        on_each_feature=on_each_feature,
+    )
+
+
+def _marker_group(coords: List[List[float]],
+                  properties: List[Dict[str, Any]],
+                  name: str,
+                  color: str,
+                  popup_template: str,
+                  radius: float,
+                  popup_max_width: int,
+                  show: bool) -> Any:
+    """시설마다 CircleMarker와 Popup을 만드는 기존 방식의 FeatureGroup"""
+    group = folium.FeatureGroup(name=name, show=show)
+    for location, props in zip(coords, properties):
+        folium.CircleMarker(
+            location=location,
+            radius=radius,
+            color=color,
+            fill=True,
+            fill_color=color,
+            fill_opacity=0.7,
+            popup=folium.Popup(render_popup(popup_template, props), max_width=popup_max_width)
+        ).add_to(group)
+    return group
+
+
+def create_map(location: Sequence[float],
+               zoom_start: int,
+               mode: str = 'fast',
+               tiles: Optional[str] = 'cartodbpositron',
+               **kwargs: Any) -> Any:
+    """
+    렌더링 모드에 맞는 folium 지도 생성 (fast/cluster 모드는 벡터 레이어를 canvas에 그림)
+
+    Args:
+        location: 지도 중심 [위도, 경도]
+        zoom_start: 시작 줌 레벨
+        mode: 시설 레이어 렌더링 모드
+        tiles: 배경 타일
+        **kwargs: folium.Map 추가 인자
+
+    Returns:
+        folium.Map
+    """
+    _require_folium()
+    return folium.Map(location=location, zoom_start=zoom_start, tiles=tiles,
+                      prefer_canvas=mode != 'markers', **kwargs)
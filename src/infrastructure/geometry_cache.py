@@ -0,0 +1,105 @@
+"""
+행정동 폴리곤 prepared geometry 캐시
+"""
+import hashlib
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import shapely
+
+
+def geometry_key(geometry: Any) -> str:
+    """폴리곤 내용(WKB)의 해시 (같은 코드/이름이라도 모양이 다르면 다른 키)"""
+    return hashlib.sha1(shapely.to_wkb(geometry)).hexdigest()
+
+
+class PreparedGeometryCache:
+    """폴리곤 내용(WKB 해시)별 prepared 폴리곤 캐시"""
+
+    def __init__(self):
+        self._geometries: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def get_or_prepare(self, geometry: Any, key: Optional[str] = None) -> Any:
+        """
+        같은 내용의 prepared 폴리곤이 캐시에 있으면 반환하고, 없으면 prepare 후 캐시에 저장
+
+        캐시 키는 행정동 코드나 이름이 아니라 폴리곤 내용이므로, 코드가 같아도 경계가 다른
+        파일이나 이름이 같은 서로 다른 행정동이 다른 폴리곤을 돌려받는 일이 없습니다.
+
+        Args:
+            geometry: 행정동 폴리곤 (shapely geometry)
+            key: 미리 계산한 geometry_key(geometry) (없으면 계산)
+
+        Returns:
+            geometry와 내용이 같은 prepared 폴리곤
+        """
+        key = key or geometry_key(geometry)
+        cached = self._geometries.get(key)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            cached = self._geometries.get(key)
+            if cached is None:
+                # shapely 2의 prepare()는 geometry 객체 자체에 prepared 상태를 저장
+                shapely.prepare(geometry)
+                self._geometries[key] = geometry
+                cached = geometry
+        return cached
+
+    def prepare_many(self, geometries: Iterable[Any]) -> np.ndarray:
+        """
+        여러 행정동 폴리곤을 한 번에 prepare
+
+        Args:
+            geometries: 행정동 폴리곤 목록
+
+        Returns:
+            prepared 폴리곤 배열 (입력 순서 유지)
+        """
+        geometries = np.asarray(list(geometries), dtype=object)
+        keys = [hashlib.sha1(wkb).hexdigest() for wkb in shapely.to_wkb(geometries)]
+        prepared: List[Any] = [
+            self.get_or_prepare(geometry, key)
+            for geometry, key in zip(geometries, keys)
+        ]
+        return np.array(prepared, dtype=object)
+
+    def clear(self) -> None:
+        """캐시 비우기 (경계 데이터가 바뀐 경우 사용)"""
+        with self._lock:
+            self._geometries.clear()
+
+    def __len__(self) -> int:
+        return len(self._geometries)
+
+    def __contains__(self, geometry: Any) -> bool:
+        return geometry_key(geometry) in self._geometries
+
+
+# 경계 데이터 출처(파일 경로 등)별 프로세스 전역 캐시
+_caches: Dict[str, PreparedGeometryCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_geometry_cache(source: str = "default") -> PreparedGeometryCache:
+    """
+    경계 데이터 출처별 prepared geometry 캐시 반환
+
+    캐시 키가 폴리곤 내용이므로 출처가 달라도 잘못된 폴리곤을 돌려받지는 않으며,
+    출처는 경계 데이터별로 캐시 크기와 수명을 나누는 용도입니다.
+
+    Args:
+        source: 경계 데이터 출처 식별자 (예: shapefile 경로)
+
+    Returns:
+        프로세스 내에서 공유되는 캐시 객체
+    """
+    with _caches_lock:
+        cache = _caches.get(source)
+        if cache is None:
+            cache = PreparedGeometryCache()
+            _caches[source] = cache
+        return cache
@@ -2,12 +2,13 @@
 카카오맵 API를 통한 동물병원 데이터 수집
 """
 import os
-import time
-import requests
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
 
 from src.domain.entity import VetHospital
+from src.infrastructure.http_client import HttpClientStats, PooledHttpClient
+from src.infrastructure.rate_limiter import TokenBucketRateLimiter
 
 
 class KakaoMapAPI:
@@ -15,12 +16,23 @@ class KakaoMapAPI:
     
     BASE_URL = "https://dapi.kakao.com/v2/local/search/keyword.json"
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self,
+                 api_key: Optional[str] = None,
+                 base_url: Optional[str] = None,
+                 requests_per_second: float = 10.0,
+                 pool_size: int = 10,
+                 max_retries: int = 3,
+                 http_client: Optional[PooledHttpClient] = None):
         """
         카카오맵 API 클라이언트 초기화
         
         Args:
             api_key: 카카오 API 키 (없으면 환경변수에서 로드)
+            base_url: 키워드 검색 API URL (없으면 카카오 공식 URL)
+            requests_per_second: 모든 검색 요청(재시도 포함, 동시 수집 스레드 공유)의 초당 한도
+            pool_size: keep-alive 커넥션 풀 크기
+            max_retries: 429/5xx 응답 시 최대 재시도 횟수
+            http_client: 사용할 HTTP 클라이언트 (없으면 자동 생성)
         """
         load_dotenv()  # .env 파일에서 환경변수 로드
         self.api_key = api_key or os.getenv("KAKAO_API_KEY")
@@ -30,6 +42,14 @@ class KakaoMapAPI:
         self.headers = {
             "Authorization": f"KakaoAK {self.api_key}"
         }
+        self.base_url = base_url or self.BASE_URL
+        self.rate_limiter = TokenBucketRateLimiter(requests_per_second)
+        self.http_client = http_client or PooledHttpClient(pool_size=pool_size, max_retries=max_retries)
+    
+    @property
+    def stats(self) -> HttpClientStats:
+        """HTTP 호출 통계 (요청/재시도 수, 수신 바이트, 지연 시간 히스토그램)"""
+        return self.http_client.stats
     
     def search_keyword(self, 
                       keyword: str, 
@@ -51,6 +71,10 @@ class KakaoMapAPI:
             
         Returns:
             검색 결과 딕셔너리
+            
+        Raises:
+            requests.HTTPError: 재시도 후에도 429/4xx/5xx 응답인 경우
+            requests.RequestException: 재시도 후에도 연결 오류/타임아웃이 계속되는 경우
         """
         params = {
             "query": keyword,
@@ -66,10 +90,12 @@ class KakaoMapAPI:
                 "radius": radius
             })
         
-        response = requests.get(
-            self.BASE_URL,
+        # 커넥션 풀을 재사용하고 429/5xx 응답은 백오프 후 재시도 (재시도도 공유 속도 제한 적용)
+        response = self.http_client.get(
+            self.base_url,
             headers=self.headers,
-            params=params
+            params=params,
+            rate_limiter=self.rate_limiter
         )
         
         response.raise_for_status()  # HTTP 에러 발생 시 예외 발생
@@ -78,20 +104,29 @@ class KakaoMapAPI:
     def collect_vet_hospitals(self, 
                          city: str = "부산", 
                          dong_names: Optional[list] = None,
-                         keywords: Optional[list] = None) -> List[VetHospital]:
+                         keywords: Optional[list] = None,
+                         concurrent: bool = False,
+                         max_workers: int = 8) -> List[VetHospital]:
         """
         도시 내 모든 동물병원 수집 (동별+키워드별 반복, 모든 페이지, 중복 제거)
         Args:
             city: 도시 이름 (예: "부산")
             dong_names: 행정동 이름 리스트
             keywords: 검색 키워드 리스트
+            concurrent: True이면 여러 검색어를 동시에 수집 (공유 속도 제한 적용)
+            max_workers: 동시 수집 스레드 수
         Returns:
             수집된 동물병원 목록
+        Raises:
+            requests.RequestException: 재시도 후에도 실패한 페이지가 있는 경우 (일부 결과만 반환하지 않음)
         """
         if dong_names is None:
             dong_names = []
         if keywords is None:
             keywords = ["동물병원", "동물의료센터", "반려동물병원", "24시동물병원", "동물클리닉"]
+        if concurrent:
+            queries = [f"{dong} {keyword}" for dong in dong_names for keyword in keywords]
+            return self.search_keywords_concurrently(queries, max_workers=max_workers)
         all_hospitals = []
         seen_ids = set()
         for dong in dong_names:
@@ -99,24 +134,19 @@ class KakaoMapAPI:
                 page = 1
                 while True:
                     query = f"{dong} {keyword}"
-                    try:
-                        result = self.search_keyword(query, page=page)
-                        documents = result.get("documents", [])
-                        if not documents:
-                            break
-                        for item in documents:
-                            if item["id"] not in seen_ids:
-                                seen_ids.add(item["id"])
-                                hospital = VetHospital.from_kakao_api_result(item)
-                                all_hospitals.append(hospital)
-                        meta = result.get("meta", {})
-                        if meta.get("is_end", True):
-                            break
-                        page += 1
-                        time.sleep(0.2)
-                    except Exception as e:
-                        print(f"검색 중 오류 발생: {e} (query={query}, page={page})")
+                    result = self.search_keyword(query, page=page)
+                    documents = result.get("documents", [])
+                    if not documents:
+                        break
+                    for item in documents:
+                        if item["id"] not in seen_ids:
+                            seen_ids.add(item["id"])
+                            hospital = VetHospital.from_kakao_api_result(item)
+                            all_hospitals.append(hospital)
+                    meta = result.get("meta", {})
+                    if meta.get("is_end", True):
                         break
+                    page += 1
         return all_hospitals
         
     def search_direct_keyword(self, keyword: str) -> List[VetHospital]:
@@ -128,6 +158,9 @@ class KakaoMapAPI:
             
         Returns:
             수집된 동물병원 목록
+            
+        Raises:
+            requests.RequestException: 재시도 후에도 실패한 페이지가 있는 경우 (일부 결과만 반환하지 않음)
         """
         all_hospitals = []
         seen_ids = set()
@@ -136,36 +169,170 @@ class KakaoMapAPI:
         print(f"키워드 '{keyword}'로 직접 검색 시작...")
         
         while True:
-            try:
-                # 키워드로 검색 (페이지 단위)
-                result = self.search_keyword(keyword, page=page, size=15)
-                documents = result.get("documents", [])
-                
-                # 검색 결과 없으면 종료
-                if not documents:
-                    break
-                
-                # 병원 객체 생성하며 중복 제거
-                for item in documents:
-                    if item["id"] not in seen_ids:
-                        seen_ids.add(item["id"])
-                        hospital = VetHospital.from_kakao_api_result(item)
-                        all_hospitals.append(hospital)
-                
-                print(f"페이지 {page} 검색 완료: {len(documents)}개 결과 (누적: {len(all_hospitals)}개)")
-                
-                # 마지막 페이지면 종료
-                meta = result.get("meta", {})
-                if meta.get("is_end", True):
-                    break
-                    
-                # 다음 페이지로
-                page += 1
-                time.sleep(0.2)  # API 호출 제한 방지
-                
-            except Exception as e:
-                print(f"검색 중 오류 발생: {e} (keyword={keyword}, page={page})")
+            # 키워드로 검색 (페이지 단위)
+            result = self.search_keyword(keyword, page=page, size=15)
+            documents = result.get("documents", [])
+            
+            # 검색 결과 없으면 종료
+            if not documents:
+                break
+            
+            # 병원 객체 생성하며 중복 제거
+            for item in documents:
+                if item["id"] not in seen_ids:
+                    seen_ids.add(item["id"])
+                    hospital = VetHospital.from_kakao_api_result(item)
+                    all_hospitals.append(hospital)
+            
+            print(f"페이지 {page} 검색 완료: {len(documents)}개 결과 (누적: {len(all_hospitals)}개)")
+            
+            # 마지막 페이지면 종료
+            meta = result.get("meta", {})
+            if meta.get("is_end", True):
                 break
                 
+            # 다음 페이지로 (호출 간격은 search_keyword의 공유 속도 제한으로 조절)
+            page += 1
+        
         print(f"총 {len(all_hospitals)}개 동물병원 검색 완료")
+        print(f"API 호출 통계: {self.stats.summary()}")
+        return all_hospitals
+    
+    def search_keywords_concurrently(self, keywords: List[str], max_workers: int = 8) -> List[VetHospital]:
+        """
+        여러 키워드를 동시에 검색 (모든 페이지 결과 수집, 중복 제거)
+        
+        각 키워드의 페이지는 순서대로 조회하고, 키워드끼리는 스레드 풀에서 병렬로 조회합니다.
+        전체 요청 속도는 클라이언트가 공유하는 토큰 버킷으로 제한됩니다.
+        
+        Args:
+            keywords: 검색 키워드 목록
+            max_workers: 동시 수집 스레드 수
+            
+        Returns:
+            수집된 동물병원 목록 (키워드 순서 기준, 장소 ID로 중복 제거)
+            
+        Raises:
+            requests.RequestException: 재시도 후에도 실패한 페이지가 있는 경우 (일부 결과만 반환하지 않음)
+        """
+        if not keywords:
+            return []
+        
+        print(f"{len(keywords)}개 검색어 동시 수집 시작 (스레드 {max_workers}개, 초당 {self.rate_limiter.rate:g}회 제한)")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self._fetch_all_pages, keywords))
+        
+        # 결과 병합은 메인 스레드에서 키워드 순서대로 수행해 실행 순서와 무관하게 동일한 결과 보장
+        unique_documents = []
+        seen_ids = set()
+        for documents in results:
+            for item in documents:
+                if item["id"] not in seen_ids:
+                    seen_ids.add(item["id"])
+                    unique_documents.append(item)
+        all_hospitals = VetHospital.from_kakao_documents(unique_documents)
+        
+        print(f"총 {len(all_hospitals)}개 동물병원 동시 수집 완료")
+        print(f"API 호출 통계: {self.stats.summary()}")
         return all_hospitals
+    
+    def search_keywords_incrementally(self,
+                                      keywords: List[str],
+                                      known_tiles: Optional[Dict[str, Tuple[int, List[Dict[str, Any]]]]] = None,
+                                      concurrent: bool = False,
+                                      max_workers: int = 8) -> Tuple[List[VetHospital], Dict[str, Tuple[int, List[Dict[str, Any]]]]]:
+        """
+        이전 수집 결과를 재사용하며 여러 키워드 검색 (첫 페이지의 total_count가 같으면 나머지 페이지 생략)
+        
+        Args:
+            keywords: 검색 키워드 목록
+            known_tiles: {키워드: (이전 total_count, 이전 장소 문서 목록)} (PlaceSnapshot.known_tiles())
+            concurrent: True이면 키워드끼리 스레드 풀에서 병렬로 조회 (공유 속도 제한 적용)
+            max_workers: 동시 수집 스레드 수
+            
+        Returns:
+            (수집된 동물병원 목록 (장소 ID로 중복 제거), {키워드: (total_count, 장소 문서 목록)})
+        """
+        known_tiles = known_tiles or {}
+        
+        def fetch(keyword: str) -> Tuple[int, List[Dict[str, Any]]]:
+            return self._fetch_keyword(keyword, known=known_tiles.get(keyword))
+        
+        if concurrent and keywords:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(fetch, keywords))
+        else:
+            results = [fetch(keyword) for keyword in keywords]
+        tiles = dict(zip(keywords, results))
+        
+        unique_documents = []
+        seen_ids = set()
+        for _, documents in results:
+            for item in documents:
+                if item["id"] not in seen_ids:
+                    seen_ids.add(item["id"])
+                    unique_documents.append(item)
+        
+        reused = sum(1 for keyword in keywords if tiles[keyword] is known_tiles.get(keyword))
+        print(f"{len(keywords)}개 검색어 증분 수집 완료 (변경 없음 {reused}개, 다시 조회 {len(keywords) - reused}개)")
+        print(f"API 호출 통계: {self.stats.summary()}")
+        return VetHospital.from_kakao_documents(unique_documents), tiles
+    
+    def _fetch_keyword(self,
+                       keyword: str,
+                       known: Optional[Tuple[int, List[Dict[str, Any]]]] = None,
+                       size: int = 15) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        한 키워드의 검색 결과 조회 (첫 페이지의 total_count가 이전과 같으면 이전 문서 재사용)
+        
+        Args:
+            keyword: 검색 키워드
+            known: (이전 total_count, 이전 장소 문서 목록)
+            size: 한 페이지 결과 수
+            
+        Returns:
+            (total_count, 장소 문서 목록)
+        """
+        result = self.search_keyword(keyword, page=1, size=size)
+        meta = result.get("meta", {})
+        total_count = meta.get("total_count", 0)
+        if known is not None and known[0] == total_count:
+            return known
+        
+        documents = list(result.get("documents", []))
+        page = 1
+        while documents and not meta.get("is_end", True):
+            page += 1
+            result = self.search_keyword(keyword, page=page, size=size)
+            page_documents = result.get("documents", [])
+            if not page_documents:
+                break
+            documents.extend(page_documents)
+            meta = result.get("meta", {})
+        return total_count, documents
+    
+    def _fetch_all_pages(self, keyword: str, size: int = 15) -> List[Dict[str, Any]]:
+        """
+        한 키워드의 모든 페이지 검색 결과 조회 (공유 속도 제한 적용)
+        
+        Args:
+            keyword: 검색 키워드
+            size: 한 페이지 결과 수
+            
+        Returns:
+            검색된 장소 문서 목록
+        """
+        documents = []
+        page = 1
+        while True:
+            result = self.search_keyword(keyword, page=page, size=size)
+            
+            page_documents = result.get("documents", [])
+            if not page_documents:
+                break
+            documents.extend(page_documents)
+            
+            if result.get("meta", {}).get("is_end", True):
+                break
+            page += 1
+        return documents
@@ -0,0 +1,188 @@
+"""
+장소 수집 결과 스냅샷 및 증분(delta) 갱신 지원
+- 카카오 장소 ID 기준 이전 수집 결과 보관
+- 영역/검색어별 total_count 보관 (변경된 영역만 다시 조회)
+- 추가/삭제/이동된 장소 diff 계산 및 행정동별 개수 증분 반영
+"""
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+Place = Dict[str, Any]
+
+
+@dataclass
+class PlaceDiff:
+    """두 수집 결과 사이의 장소 변경 내역"""
+    added: List[Place] = field(default_factory=list)
+    removed: List[Place] = field(default_factory=list)
+    moved: List[Tuple[Place, Place]] = field(default_factory=list)  # (이전, 현재)
+
+    def is_empty(self) -> bool:
+        """변경 내역이 없는지 확인"""
+        return not (self.added or self.removed or self.moved)
+
+    def summary(self) -> str:
+        """변경 내역 요약 문자열"""
+        return f"추가 {len(self.added)}개, 삭제 {len(self.removed)}개, 이동 {len(self.moved)}개"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 저장용 딕셔너리로 변환"""
+        return {
+            "added": self.added,
+            "removed": self.removed,
+            "moved": [{"before": before, "after": after} for before, after in self.moved]
+        }
+
+    def save(self, path: str) -> None:
+        """
+        변경 내역 JSON 저장 (count_facilities_by_district.py --apply-diff 입력 형식)
+
+        Args:
+            path: 저장할 파일 경로 (예: output/vet_hospitals_diff.json)
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+
+def _coordinates(place: Place) -> Tuple[float, float]:
+    return float(place.get("x", 0) or 0), float(place.get("y", 0) or 0)
+
+
+def diff_places(previous: Dict[str, Place], current: Dict[str, Place], tolerance: float = 1e-7) -> PlaceDiff:
+    """
+    장소 ID 기준 두 수집 결과 비교
+
+    Args:
+        previous: 이전 수집 결과 {장소 ID: 장소}
+        current: 현재 수집 결과 {장소 ID: 장소}
+        tolerance: 이동으로 판단할 최소 좌표 변화량(경위도)
+
+    Returns:
+        추가/삭제/이동 내역
+    """
+    diff = PlaceDiff()
+    for place_id, place in current.items():
+        before = previous.get(place_id)
+        if before is None:
+            diff.added.append(place)
+            continue
+        (x0, y0), (x1, y1) = _coordinates(before), _coordinates(place)
+        if abs(x0 - x1) > tolerance or abs(y0 - y1) > tolerance:
+            diff.moved.append((before, place))
+
+    for place_id, place in previous.items():
+        if place_id not in current:
+            diff.removed.append(place)
+    return diff
+
+
+def apply_diff_to_counts(counts: Dict[str, int],
+                         diff: PlaceDiff,
+                         locate: Callable[[float, float], Optional[str]]) -> Dict[str, int]:
+    """
+    변경 내역을 행정동별 개수에 증분 반영 (변경된 장소의 행정동만 갱신)
+
+    Args:
+        counts: 행정동별 시설 개수 (제자리에서 갱신)
+        diff: 장소 변경 내역
+        locate: (경도, 위도) -> 행정동 이름 (경계 밖이면 None)
+
+    Returns:
+        영향을 받은 행정동별 개수 변화량 {행정동: 증감}
+    """
+    deltas: Dict[str, int] = {}
+
+    def add(place: Place, amount: int) -> None:
+        district = locate(*_coordinates(place))
+        if district is None:
+            return
+        deltas[district] = deltas.get(district, 0) + amount
+
+    for place in diff.added:
+        add(place, 1)
+    for place in diff.removed:
+        add(place, -1)
+    for before, after in diff.moved:
+        add(before, -1)
+        add(after, 1)
+
+    deltas = {district: delta for district, delta in deltas.items() if delta != 0}
+    for district, delta in deltas.items():
+        counts[district] = max(0, counts.get(district, 0) + delta)
+    return deltas
+
+
+class PlaceSnapshot:
+    """장소 ID 기준 마지막 수집 결과와 영역/검색어별 total_count 스냅샷"""
+
+    def __init__(self,
+                 places: Optional[Dict[str, Place]] = None,
+                 tiles: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        스냅샷 초기화
+
+        Args:
+            places: {장소 ID: 장소}
+            tiles: {영역/검색어 키: {"total_count": int, "ids": [장소 ID, ...]}}
+        """
+        self.places: Dict[str, Place] = places or {}
+        self.tiles: Dict[str, Dict[str, Any]] = tiles or {}
+
+    @classmethod
+    def load(cls, path: str) -> 'PlaceSnapshot':
+        """스냅샷 파일 로드 (없으면 빈 스냅샷)"""
+        if not os.path.exists(path):
+            return cls()
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(places=data.get("places", {}), tiles=data.get("tiles", {}))
+
+    def save(self, path: str) -> None:
+        """스냅샷 파일 저장"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"places": self.places, "tiles": self.tiles}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def known_tiles(self) -> Dict[str, Tuple[int, List[Place]]]:
+        """
+        영역/검색어별 이전 total_count와 장소 목록
+
+        Returns:
+            {영역/검색어 키: (total_count, 장소 목록)}
+        """
+        return {
+            key: (tile["total_count"], [self.places[pid] for pid in tile["ids"] if pid in self.places])
+            for key, tile in self.tiles.items()
+        }
+
+    def update(self, places: Iterable[Place], tiles: Dict[str, Tuple[int, List[Place]]]) -> PlaceDiff:
+        """
+        새 수집 결과로 스냅샷 갱신
+
+        Args:
+            places: 새로 수집한 장소 목록
+            tiles: {영역/검색어 키: (total_count, 장소 목록)}
+
+        Returns:
+            이전 스냅샷 대비 변경 내역
+        """
+        current = {}
+        for place in places:
+            place_id = place.get("id")
+            if place_id and place_id not in current:
+                current[place_id] = place
+
+        diff = diff_places(self.places, current)
+        self.places = current
+        self.tiles = {
+            key: {"total_count": total_count, "ids": [p.get("id") for p in documents]}
+            for key, (total_count, documents) in tiles.items()
+        }
+        return diff
@@ -0,0 +1,64 @@
+"""
+API 호출 속도 제한을 위한 토큰 버킷
+"""
+import threading
+import time
+from typing import Callable, Optional
+
+
+class TokenBucketRateLimiter:
+    """여러 스레드가 공유하는 토큰 버킷 방식 호출 속도 제한기"""
+
+    def __init__(self,
+                 requests_per_second: float,
+                 burst: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        토큰 버킷 초기화
+
+        Args:
+            requests_per_second: 초당 허용 요청 수 (토큰 충전 속도)
+            burst: 버킷 최대 토큰 수 (없으면 requests_per_second와 동일, 최소 1)
+            clock: 현재 시각 함수 (테스트용)
+            sleep: 대기 함수 (테스트용)
+        """
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second는 0보다 커야 합니다.")
+
+        self.rate = float(requests_per_second)
+        self.capacity = float(burst) if burst is not None else max(1.0, self.rate)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """경과 시간만큼 토큰 충전 (lock을 잡은 상태에서 호출)"""
+        now = self._clock()
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰을 얻을 때까지 대기
+
+        Args:
+            tokens: 필요한 토큰 수
+
+        Returns:
+            대기한 시간(초)
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait_time = (tokens - self._tokens) / self.rate
+            self._sleep(wait_time)
+            waited += wait_time
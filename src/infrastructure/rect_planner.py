@@ -0,0 +1,229 @@
+"""
+카카오 영역(rect) 검색용 쿼드트리 분할 계획기
+- 키워드별 최종 분할 영역(leaf)을 저장해 다음 갱신 때 바로 재사용
+- 같은 깊이의 형제 영역은 스레드 풀에서 동시에 조회
+- 행정동 경계 밖에 완전히 있는 영역은 조회하지 않음
+- 이전 갱신과 total_count가 같은 영역은 첫 페이지만 조회하고 이전 결과 재사용
+"""
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import shapely
+from shapely.geometry import box
+
+Rect = Tuple[float, float, float, float]
+FetchPage = Callable[[str, Rect, int], Dict[str, Any]]
+
+
+def rect_key(rect: Rect) -> str:
+    """영역을 저장용 문자열 키로 변환"""
+    return ",".join(f"{float(v):.7f}" for v in rect)
+
+
+def split_rect(rect: Rect) -> List[Rect]:
+    """
+    영역을 4등분 (좌하단, 우하단, 좌상단, 우상단 순서)
+
+    Args:
+        rect: (start_x, start_y, end_x, end_y)
+
+    Returns:
+        4개의 하위 영역
+    """
+    start_x, start_y, end_x, end_y = rect
+    mid_x = (start_x + end_x) / 2
+    mid_y = (start_y + end_y) / 2
+    return [
+        (start_x, start_y, mid_x, mid_y),
+        (mid_x, start_y, end_x, mid_y),
+        (start_x, mid_y, mid_x, end_y),
+        (mid_x, mid_y, end_x, end_y)
+    ]
+
+
+class QuadtreeRectPlanner:
+    """키워드별 분할 영역을 기억하는 쿼드트리 영역 검색 계획기"""
+
+    DEFAULT_LAYOUT_PATH = os.path.join("data", "cache", "rect_layouts.json")
+
+    def __init__(self,
+                 fetch_page: FetchPage,
+                 layout_path: Optional[str] = DEFAULT_LAYOUT_PATH,
+                 boundary: Optional[Any] = None,
+                 max_workers: int = 4,
+                 max_results: int = 45,
+                 min_size: float = 1e-4):
+        """
+        계획기 초기화
+
+        Args:
+            fetch_page: (키워드, 영역, 페이지) -> 카카오 API 응답 딕셔너리를 반환하는 함수
+            layout_path: 키워드별 분할 영역 저장 파일 (None이면 저장하지 않음)
+            boundary: 검색 대상 경계 (예: 부산 행정동 union), 완전히 밖에 있는 영역은 건너뜀
+            max_workers: 형제 영역 동시 조회 스레드 수
+            max_results: 한 영역에서 페이지로 가져올 수 있는 최대 결과 수 (카카오 API 제한 45)
+            min_size: 더 이상 분할하지 않을 최소 영역 크기(경위도)
+        """
+        self.fetch_page = fetch_page
+        self.layout_path = layout_path
+        self.boundary = boundary
+        self.max_workers = max_workers
+        self.max_results = max_results
+        self.min_size = min_size
+        self.request_count = 0
+        self.reused_tiles = 0
+        # 마지막 검색의 최종 영역별 결과 {영역 키: (total_count, 장소 목록)}
+        self.last_tiles: Dict[str, Tuple[int, List[Dict[str, Any]]]] = {}
+        self._count_lock = threading.Lock()
+
+        if self.boundary is not None:
+            shapely.prepare(self.boundary)
+
+    def search(self,
+               keyword: str,
+               root_rect: Rect,
+               known_tiles: Optional[Dict[str, Tuple[int, List[Dict[str, Any]]]]] = None) -> List[Dict[str, Any]]:
+        """
+        영역 내 키워드 검색 결과 전체 수집
+
+        저장된 분할 영역이 있으면 그 영역들부터 조회를 시작하고,
+        결과가 제한을 넘는 영역만 추가로 분할합니다.
+
+        Args:
+            keyword: 검색 키워드
+            root_rect: 전체 검색 영역 (start_x, start_y, end_x, end_y)
+            known_tiles: 이전 갱신의 영역별 (total_count, 장소 목록), 
+                total_count가 같은 영역은 나머지 페이지를 조회하지 않고 재사용
+
+        Returns:
+            검색된 장소 문서 목록 (영역 경계에 걸친 장소는 중복될 수 있음)
+        """
+        root_rect = tuple(float(v) for v in root_rect)
+        frontier = self.load_layout(keyword, root_rect) or [root_rect]
+        documents: List[Dict[str, Any]] = []
+        leaves: List[Rect] = []
+        self.last_tiles = {}
+        known_tiles = known_tiles or {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while frontier:
+                # 같은 깊이의 영역들을 동시에 조회 (자식 영역은 다음 반복에서 처리)
+                frontier = [rect for rect in frontier if self._intersects_boundary(rect)]
+                next_frontier: List[Rect] = []
+                for rect, children, total_count, rect_documents in executor.map(
+                        lambda r: self._probe(keyword, r, known_tiles.get(rect_key(r))), frontier):
+                    if children:
+                        next_frontier.extend(children)
+                    else:
+                        leaves.append(rect)
+                        documents.extend(rect_documents)
+                        self.last_tiles[rect_key(rect)] = (total_count, rect_documents)
+                frontier = next_frontier
+
+        self.save_layout(keyword, root_rect, leaves)
+        return documents
+
+    def _probe(self,
+               keyword: str,
+               rect: Rect,
+               known: Optional[Tuple[int, List[Dict[str, Any]]]] = None
+               ) -> Tuple[Rect, List[Rect], int, List[Dict[str, Any]]]:
+        """
+        영역 1개 조회: 결과가 제한을 넘으면 하위 영역 반환, 아니면 모든 페이지 수집
+
+        Args:
+            keyword: 검색 키워드
+            rect: 조회할 영역
+            known: 이전 갱신의 (total_count, 장소 목록)
+
+        Returns:
+            (영역, 하위 영역 목록, total_count, 장소 문서 목록)
+        """
+        result = self._fetch(keyword, rect, 1)
+        meta = result.get("meta", {})
+        total_count = meta.get("total_count", 0)
+
+        can_split = (rect[2] - rect[0]) > self.min_size and (rect[3] - rect[1]) > self.min_size
+        if total_count > self.max_results and can_split:
+            return rect, split_rect(rect), total_count, []
+
+        # 다음 페이지가 필요한데 이전 갱신과 개수가 같으면 나머지 페이지는 이전 결과 재사용
+        if result and not meta.get("is_end", True) and known is not None and known[0] == total_count:
+            with self._count_lock:
+                self.reused_tiles += 1
+            return rect, [], total_count, list(known[1])
+
+        documents = list(result.get("documents", []))
+        page = 1
+        while documents and not meta.get("is_end", True):
+            page += 1
+            result = self._fetch(keyword, rect, page)
+            page_documents = result.get("documents", [])
+            if not page_documents:
+                break
+            documents.extend(page_documents)
+            meta = result.get("meta", {})
+        return rect, [], total_count, documents
+
+    def _fetch(self, keyword: str, rect: Rect, page: int) -> Dict[str, Any]:
+        """
+        요청 수를 세며 페이지 조회
+
+        조회 실패를 빈 결과로 바꾸면 실패한 영역이 결과 0개인 leaf로 저장되어 이후 갱신에서도
+        그 영역의 장소가 빠지므로, 오류는 그대로 전달해 분할 영역과 스냅샷을 갱신하지 않습니다.
+        (성공한 응답은 응답 캐시에 남으므로 다시 실행할 때 실패한 요청만 새로 호출됩니다.)
+        """
+        with self._count_lock:
+            self.request_count += 1
+        try:
+            return self.fetch_page(keyword, rect, page)
+        except Exception as e:
+            print(f"API 요청 오류: {e} (keyword={keyword}, rect={rect}, page={page})")
+            raise
+
+    def _intersects_boundary(self, rect: Rect) -> bool:
+        """영역이 검색 대상 경계와 겹치는지 확인 (경계가 없으면 항상 True)"""
+        if self.boundary is None:
+            return True
+        return bool(self.boundary.intersects(box(*rect)))
+
+    def _layout_key(self, keyword: str, root_rect: Rect) -> str:
+        return f"{keyword}|{rect_key(root_rect)}"
+
+    def load_layout(self, keyword: str, root_rect: Rect) -> List[Rect]:
+        """
+        저장된 분할 영역 로드
+
+        Returns:
+            분할 영역 목록 (없으면 빈 목록)
+        """
+        if not self.layout_path or not os.path.exists(self.layout_path):
+            return []
+        try:
+            with open(self.layout_path, "r", encoding="utf-8") as f:
+                layouts = json.load(f)
+        except (OSError, ValueError):
+            return []
+        return [tuple(rect) for rect in layouts.get(self._layout_key(keyword, root_rect), [])]
+
+    def save_layout(self, keyword: str, root_rect: Rect, leaves: Sequence[Rect]) -> None:
+        """키워드별 최종 분할 영역 저장"""
+        if not self.layout_path:
+            return
+        layouts: Dict[str, List[List[float]]] = {}
+        if os.path.exists(self.layout_path):
+            try:
+                with open(self.layout_path, "r", encoding="utf-8") as f:
+                    layouts = json.load(f)
+            except (OSError, ValueError):
+                layouts = {}
+
+        layouts[self._layout_key(keyword, root_rect)] = [list(rect) for rect in sorted(leaves)]
+        os.makedirs(os.path.dirname(os.path.abspath(self.layout_path)), exist_ok=True)
+        tmp_path = f"{self.layout_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(layouts, f, ensure_ascii=False)
+        os.replace(tmp_path, self.layout_path)
@@ -0,0 +1,159 @@
+"""
+카카오 API 응답 캐시 (SQLite 단일 파일, TTL 및 용량 기반 정리)
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, Optional, Sequence
+
+
+class ResponseCache:
+    """검색 조건(키워드 + 영역 + 페이지)으로 주소가 정해지는 API 응답 캐시"""
+
+    DEFAULT_PATH = os.path.join("data", "cache", "kakao_responses.sqlite")
+
+    def __init__(self,
+                 path: str = DEFAULT_PATH,
+                 ttl_seconds: Optional[float] = 7 * 24 * 3600,
+                 max_bytes: int = 64 * 1024 * 1024,
+                 clock: Callable[[], float] = time.time):
+        """
+        응답 캐시 초기화
+
+        Args:
+            path: SQLite 파일 경로 (":memory:"이면 메모리 캐시)
+            ttl_seconds: 캐시 유효 시간(초), None이면 만료 없음
+            max_bytes: 압축된 응답 총 크기 상한, 넘으면 오래 사용하지 않은 항목부터 삭제
+            clock: 현재 시각 함수 (테스트용)
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # 동시 수집 스레드에서 함께 사용하므로 연결은 lock으로 보호
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " payload BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(keyword: str, rect: Sequence[float], page: int) -> str:
+        """
+        검색 조건으로 캐시 키 생성
+
+        Args:
+            keyword: 검색 키워드
+            rect: 검색 영역 (start_x, start_y, end_x, end_y)
+            page: 페이지 번호
+
+        Returns:
+            검색 조건의 SHA-256 해시
+        """
+        canonical = json.dumps(
+            {"keyword": keyword, "rect": [f"{float(v):.7f}" for v in rect], "page": int(page)},
+            ensure_ascii=False,
+            sort_keys=True
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 응답 조회 (만료된 항목은 삭제 후 None 반환)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            응답 딕셔너리 또는 None
+        """
+        now = self._clock()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            payload, created_at = row
+            if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+        return json.loads(zlib.decompress(payload).decode("utf-8"))
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        응답 저장 (용량 상한을 넘으면 오래 사용하지 않은 항목부터 삭제)
+
+        Args:
+            key: 캐시 키
+            value: 응답 딕셔너리
+        """
+        payload = zlib.compress(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, payload, size, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, payload, len(payload), now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """만료 항목 및 용량 초과분 삭제 (lock을 잡은 상태에서 호출)"""
+        if self.ttl_seconds is not None:
+            self._conn.execute(
+                "DELETE FROM responses WHERE created_at < ?", (self._clock() - self.ttl_seconds,)
+            )
+
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY accessed_at ASC").fetchall()
+        stale_keys = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            stale_keys.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", stale_keys)
+
+    def total_bytes(self) -> int:
+        """저장된 압축 응답 총 크기"""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """SQLite 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
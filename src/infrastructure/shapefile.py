@@ -1,20 +1,49 @@
 """
 행정동 shapefile 처리 및 GeoDataFrame 관리
 """
+import os
+import hashlib
+import re
+import numpy as np
+import shapely
 import geopandas as gpd
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence, Tuple, Union
+from shapely import STRtree
 from shapely.geometry import Point
 
 from src.domain.entity import AdministrativeDong
+from src.domain.facility_table import FacilityTable
 from src.domain.repository import AdministrativeDongRepository
+from src.infrastructure.geometry_cache import get_geometry_cache
+
+try:
+    import pyarrow  # noqa: F401  (GeoParquet 캐시용)
+except ImportError:
+    pyarrow = None
 
 
 class ShapefileRepository(AdministrativeDongRepository):
     """행정동 shapefile 레포지토리 구현"""
     
-    def __init__(self):
+    # 캐시 무효화 판단에 사용하는 shapefile 구성 파일 확장자
+    SHAPEFILE_PARTS = (".shp", ".shx", ".dbf", ".prj", ".cpg")
+    
+    def __init__(self, cache_dir: Optional[str] = os.path.join("data", "cache"), region_prefix: str = "26"):
+        """
+        행정동 shapefile 레포지토리 초기화
+        
+        Args:
+            cache_dir: 필터링된 행정동 경계 GeoParquet 캐시 디렉토리 (None이면 캐시 비활성화)
+            region_prefix: 로드할 지역의 행정동 코드 접두어 (부산: '26')
+        """
+        self.cache_dir = cache_dir
+        self.region_prefix = region_prefix
         self.dongs: List[AdministrativeDong] = []
         self.gdf: Optional[gpd.GeoDataFrame] = None
+        self._tree: Optional[STRtree] = None
+        self._dong_codes: Optional[np.ndarray] = None
+        self._dong_names: Optional[np.ndarray] = None
+        self._prepared: Optional[np.ndarray] = None
     
     def load_dongs(self, shapefile_path: str) -> List[AdministrativeDong]:
         """
@@ -26,17 +55,93 @@ class ShapefileRepository(AdministrativeDongRepository):
         Returns:
             행정동 객체 목록
         """
-        self.gdf = gpd.read_file(shapefile_path)
+        # 캐시가 유효하면 shapefile(DBF/SHP) 파싱 없이 GeoParquet에서 바로 로드
+        cache_path = self._get_cache_path(shapefile_path)
+        busan_gdf = self._read_cache(cache_path)
+        
+        if busan_gdf is None:
+            self.gdf = gpd.read_file(shapefile_path)
+            
+            # 부산시 데이터만 필터링 (행정동 코드가 '26'으로 시작하는 경우)
+            busan_gdf = self.gdf[self.gdf['ADM_CD'].astype(str).str.startswith(self.region_prefix)]
+            self._write_cache(cache_path, busan_gdf)
         
-        # 부산시 데이터만 필터링 (행정동 코드가 '26'으로 시작하는 경우)
-        busan_gdf = self.gdf[self.gdf['ADM_CD'].astype(str).str.startswith('26')]
         self.gdf = busan_gdf
         
         # 행정동 객체 생성
         self.dongs = [AdministrativeDong.from_geopandas_row(row) for _, row in busan_gdf.iterrows()]
         
+        # 공간 인덱스 생성 (조회마다 전체 행정동을 순회하지 않도록 한 번만 구축)
+        # prepared 폴리곤 캐시는 경계 버전(캐시 키)별로 공유
+        self._build_spatial_index(cache_path or shapefile_path)
+        
         return self.dongs
     
+    def _get_cache_path(self, shapefile_path: str) -> Optional[str]:
+        """
+        shapefile 구성 파일의 크기/수정시각과 지역 접두어로 캐시 파일 경로 생성
+        
+        Args:
+            shapefile_path: shapefile 경로
+            
+        Returns:
+            캐시 파일 경로 (캐시를 사용할 수 없으면 None)
+        """
+        if self.cache_dir is None or pyarrow is None or not os.path.exists(shapefile_path):
+            return None
+        
+        base_path = os.path.splitext(shapefile_path)[0]
+        # 파일 이름의 고정 부분에 원본 경로를 넣어 이름이 같은 다른 shapefile의 캐시와 구분
+        source_key = hashlib.sha1(f"{os.path.abspath(shapefile_path)}|{self.region_prefix}".encode("utf-8"))
+        key = source_key.copy()
+        for ext in self.SHAPEFILE_PARTS:
+            part_path = base_path + ext
+            if os.path.exists(part_path):
+                stat = os.stat(part_path)
+                key.update(f"|{ext}:{stat.st_size}:{stat.st_mtime_ns}".encode("utf-8"))
+        
+        file_name = (f"{os.path.basename(base_path)}_{self.region_prefix}_"
+                     f"{source_key.hexdigest()[:12]}_{key.hexdigest()[:16]}.parquet")
+        return os.path.join(self.cache_dir, file_name)
+    
+    def _read_cache(self, cache_path: Optional[str]) -> Optional[gpd.GeoDataFrame]:
+        """GeoParquet 캐시 로드 (없거나 손상된 경우 None)"""
+        if cache_path is None or not os.path.exists(cache_path):
+            return None
+        try:
+            return gpd.read_parquet(cache_path)
+        except Exception as e:
+            print(f"행정동 경계 캐시 로드 실패, shapefile을 다시 읽습니다: {e}")
+            return None
+    
+    def _write_cache(self, cache_path: Optional[str], gdf: gpd.GeoDataFrame) -> None:
+        """필터링된 행정동 경계를 GeoParquet 캐시로 저장"""
+        if cache_path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            # 동시에 실행되는 다른 프로세스가 쓰다 만 파일을 읽지 않도록 임시 파일 후 교체
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            gdf.to_parquet(tmp_path)
+            os.replace(tmp_path, cache_path)
+            
+            # 같은 shapefile(같은 경로/지역)의 이전 버전 캐시만 정리
+            cache_dir, file_name = os.path.split(cache_path)
+            source_part = file_name.rsplit("_", 1)[0]
+            stale_pattern = re.compile(re.escape(source_part) + r"_[0-9a-f]{16}\.parquet")
+            for stale_name in os.listdir(cache_dir):
+                if stale_name != file_name and stale_pattern.fullmatch(stale_name):
+                    os.remove(os.path.join(cache_dir, stale_name))
+        except Exception as e:
+            print(f"행정동 경계 캐시 저장 실패: {e}")
+    
+    def _build_spatial_index(self, source: str) -> None:
+        """로드된 행정동 경계로 STRtree 공간 인덱스 및 prepared 폴리곤 생성"""
+        self._tree = STRtree(self.gdf.geometry.values)
+        self._dong_codes = self.gdf['ADM_CD'].to_numpy(dtype=object)
+        self._dong_names = self.gdf['ADM_NM'].to_numpy(dtype=object)
+        self._prepared = get_geometry_cache(source).prepare_many(self.gdf.geometry.values)
+    
     def get_dong_by_code(self, dong_code: str) -> Optional[AdministrativeDong]:
         """
         코드로 행정동 조회
@@ -68,12 +173,55 @@ class ShapefileRepository(AdministrativeDongRepository):
         
         point = Point(longitude, latitude)  # shapely Point 객체 생성 (경도, 위도 순서)
         
-        # 포인트가 포함된 행정동 찾기
-        for idx, row in self.gdf.iterrows():
-            if row.geometry.contains(point):
-                return AdministrativeDong.from_geopandas_row(row)
+        # 공간 인덱스로 bbox 후보만 추린 뒤 prepared 폴리곤으로 포함 여부 검사
+        candidates = self._tree.query(point)
+        candidates = candidates[shapely.contains(self._prepared[candidates], point)]
+        if len(candidates) == 0:
+            return None
         
-        return None
+        # 경계가 겹치는 경우 기존과 동일하게 먼저 로드된 행정동 반환
+        return self.dongs[int(candidates.min())]
+    
+    def get_dongs_by_points(self,
+                            latitudes: Sequence[float],
+                            longitudes: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        여러 위경도 좌표가 속한 행정동을 한 번에 조회
+        
+        Args:
+            latitudes: 위도 배열
+            longitudes: 경도 배열
+            
+        Returns:
+            (행정동 코드 배열, 행정동 이름 배열) - 행정동을 찾지 못한 좌표는 None
+        """
+        if self.gdf is None:
+            raise ValueError("행정동 데이터가 로드되지 않았습니다. load_dongs()를 먼저 호출하세요.")
+        
+        lats = np.asarray(latitudes, dtype=float)
+        lons = np.asarray(longitudes, dtype=float)
+        if lats.shape != lons.shape:
+            raise ValueError("위도와 경도 배열의 길이가 다릅니다.")
+        
+        codes = np.full(len(lats), None, dtype=object)
+        names = np.full(len(lats), None, dtype=object)
+        if len(lats) == 0:
+            return codes, names
+        
+        points = shapely.points(lons, lats)
+        point_idx, dong_idx = self._tree.query(points)
+        inside = shapely.contains(self._prepared[dong_idx], points[point_idx])
+        point_idx, dong_idx = point_idx[inside], dong_idx[inside]
+        
+        if len(point_idx) > 0:
+            # 좌표별로 가장 먼저 로드된 행정동 하나만 선택
+            order = np.lexsort((dong_idx, point_idx))
+            point_idx, dong_idx = point_idx[order], dong_idx[order]
+            _, first = np.unique(point_idx, return_index=True)
+            codes[point_idx[first]] = self._dong_codes[dong_idx[first]]
+            names[point_idx[first]] = self._dong_names[dong_idx[first]]
+        
+        return codes, names
     
     def get_all_dongs(self) -> List[AdministrativeDong]:
         """
@@ -96,12 +244,12 @@ class ShapefileRepository(AdministrativeDongRepository):
         
         return self.gdf
     
-    def spatial_join_hospitals(self, hospitals: List[Dict[str, Any]]) -> gpd.GeoDataFrame:
+    def spatial_join_hospitals(self, hospitals: Union[FacilityTable, List[Dict[str, Any]]]) -> gpd.GeoDataFrame:
         """
         동물병원 데이터와 행정동 데이터를 공간 조인
         
         Args:
-            hospitals: 동물병원 데이터 목록 (위도, 경도 포함)
+            hospitals: 시설 테이블 또는 동물병원 데이터 목록 (위도, 경도 포함)
             
         Returns:
             동물병원이 속한 행정동 정보가 포함된 GeoDataFrame
@@ -109,12 +257,15 @@ class ShapefileRepository(AdministrativeDongRepository):
         if self.gdf is None:
             raise ValueError("행정동 데이터가 로드되지 않았습니다. load_dongs()를 먼저 호출하세요.")
         
-        # 동물병원 데이터로 GeoDataFrame 생성
-        hospitals_df = gpd.GeoDataFrame(
-            hospitals,
-            geometry=[Point(h["longitude"], h["latitude"]) for h in hospitals],
-            crs=self.gdf.crs
-        )
+        # 동물병원 데이터로 GeoDataFrame 생성 (시설 테이블은 열 배열을 그대로 사용)
+        if isinstance(hospitals, FacilityTable):
+            hospitals_df = hospitals.to_geodataframe(crs=self.gdf.crs)
+        else:
+            hospitals_df = gpd.GeoDataFrame(
+                hospitals,
+                geometry=[Point(h["longitude"], h["latitude"]) for h in hospitals],
+                crs=self.gdf.crs
+            )
         
         # 공간 조인 수행
         joined = gpd.sjoin(
@@ -126,6 +277,19 @@ class ShapefileRepository(AdministrativeDongRepository):
         
         return joined
     
+    def assign_dongs(self, facilities: FacilityTable) -> FacilityTable:
+        """
+        시설 테이블의 모든 좌표에 행정동 코드/이름 일괄 할당
+        
+        Args:
+            facilities: 시설 테이블
+            
+        Returns:
+            행정동 열이 채워진 새 시설 테이블 (행정동 밖의 시설은 None)
+        """
+        codes, names = self.get_dongs_by_points(facilities.lat, facilities.lon)
+        return facilities.with_dongs(codes, names)
+    
     def count_hospitals_by_dong(self, hospitals: List[Dict[str, Any]]) -> Dict[str, int]:
         """
         행정동별 동물병원 개수 집계
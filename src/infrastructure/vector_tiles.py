@@ -0,0 +1,354 @@
+"""
+행정동 경계와 시설 위치를 Mapbox Vector Tile(z/x/y) 피라미드로 내보내기
+- 줌 레벨마다 공유 경계 기준으로 단순화한 행정동 경계와, 겹치는 점을 줄인 시설 위치를 타일로 나눔
+- 단일 MBTiles 파일 또는 z/x/y.pbf 디렉토리로 저장 (MVT 인코딩에는 mapbox_vector_tile 필요)
+"""
+import argparse
+import gzip
+import json
+import os
+import sqlite3
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
+from shapely import STRtree
+
+from src.infrastructure.boundaries import simplify_coverage
+from src.infrastructure.coordinates import transform_coordinates
+
+try:
+    import mapbox_vector_tile
+except ImportError:
+    mapbox_vector_tile = None
+
+# 웹 메르카토르(EPSG:3857) 세계 범위의 절반 (미터)
+WEB_MERCATOR_HALF = 20037508.342789244
+# 타일 내부 좌표 해상도와 경계에서 잘라낼 때의 여유 폭 (타일 좌표 단위)
+TILE_EXTENT = 4096
+TILE_BUFFER = 64
+# 이 줌 미만에서는 시설 점을 화면 픽셀 격자 한 칸당 하나만 남김
+FACILITY_CELL_PIXELS = 4
+
+DONG_LAYER = "dongs"
+FACILITY_LAYER = "facilities"
+
+# (레이어 이름 -> [{geometry, properties}], 타일 범위) -> 타일 바이트
+TileEncoder = Callable[[Dict[str, List[Dict[str, Any]]], Tuple[float, float, float, float]], bytes]
+Tile = Tuple[int, int, int, bytes]
+
+
+def tile_size(zoom: int) -> float:
+    """해당 줌 레벨 타일 한 변의 길이 (웹 메르카토르 미터)"""
+    return 2 * WEB_MERCATOR_HALF / (2 ** zoom)
+
+
+def pixel_resolution(zoom: int) -> float:
+    """해당 줌 레벨의 화면 한 픽셀 길이 (256px 타일 기준, 미터)"""
+    return tile_size(zoom) / 256
+
+
+def tile_bounds(zoom: int, x: int, y: int) -> Tuple[float, float, float, float]:
+    """XYZ 타일의 웹 메르카토르 범위 (minx, miny, maxx, maxy), y는 북쪽부터 증가"""
+    size = tile_size(zoom)
+    minx = -WEB_MERCATOR_HALF + x * size
+    maxy = WEB_MERCATOR_HALF - y * size
+    return (minx, maxy - size, minx + size, maxy)
+
+
+def tile_indices(mx: np.ndarray, my: np.ndarray, zoom: int) -> Tuple[np.ndarray, np.ndarray]:
+    """웹 메르카토르 좌표 배열이 속한 타일 x, y 인덱스 배열"""
+    size = tile_size(zoom)
+    last = 2 ** zoom - 1
+    xs = np.clip(np.floor((np.asarray(mx) + WEB_MERCATOR_HALF) / size), 0, last).astype(np.int64)
+    ys = np.clip(np.floor((WEB_MERCATOR_HALF - np.asarray(my)) / size), 0, last).astype(np.int64)
+    return xs, ys
+
+
+def tile_range(bounds: Sequence[float], zoom: int) -> Iterator[Tuple[int, int]]:
+    """웹 메르카토르 범위를 덮는 타일 (x, y) 목록"""
+    minx, miny, maxx, maxy = bounds
+    (x0, x1), (y1, y0) = tile_indices(np.array([minx, maxx]), np.array([miny, maxy]), zoom)
+    for x in range(int(x0), int(x1) + 1):
+        for y in range(int(y0), int(y1) + 1):
+            yield x, y
+
+
+def thin_points(mx: np.ndarray, my: np.ndarray, cell: float, groups: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    격자 한 칸(그룹별)에 점 하나만 남기는 점 줄이기 (낮은 줌에서 겹쳐 보이는 점 제거)
+
+    Args:
+        mx: 웹 메르카토르 x 배열
+        my: 웹 메르카토르 y 배열
+        cell: 격자 한 칸의 길이 (미터)
+        groups: 그룹 코드 배열 (예: 시설 유형), 그룹마다 따로 줄임
+
+    Returns:
+        남길 점의 인덱스 배열 (입력 순서)
+    """
+    if len(mx) == 0:
+        return np.empty(0, dtype=np.int64)
+    keys = [np.floor(np.asarray(mx) / cell).astype(np.int64), np.floor(np.asarray(my) / cell).astype(np.int64)]
+    if groups is not None:
+        keys.append(np.asarray(groups, dtype=np.int64))
+    _, first = np.unique(np.stack(keys, axis=1), axis=0, return_index=True)
+    return np.sort(first)
+
+
+def encode_mvt(layers: Dict[str, List[Dict[str, Any]]], bounds: Tuple[float, float, float, float]) -> bytes:
+    """
+    레이어별 피처를 Mapbox Vector Tile로 인코딩 (mapbox_vector_tile 필요)
+
+    Args:
+        layers: {레이어 이름: [{'geometry': shapely geometry, 'properties': dict}]}
+        bounds: 타일의 웹 메르카토르 범위
+
+    Returns:
+        MVT protobuf 바이트
+    """
+    if mapbox_vector_tile is None:
+        raise ImportError("벡터 타일 인코딩에는 mapbox_vector_tile이 필요합니다. (pip install mapbox-vector-tile)")
+    tile_layers = [{"name": name, "features": features} for name, features in layers.items()]
+    try:
+        # mapbox_vector_tile 2.x
+        return mapbox_vector_tile.encode(
+            tile_layers,
+            default_options={"quantize_bounds": bounds, "extents": TILE_EXTENT, "y_coord_down": False}
+        )
+    except TypeError:
+        # mapbox_vector_tile 1.x
+        return mapbox_vector_tile.encode(tile_layers, quantize_bounds=bounds, extents=TILE_EXTENT)
+
+
+def facilities_to_mercator(facilities_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    시설 CSV(name, x, y, type, district)를 웹 메르카토르 좌표 열(mx, my)을 가진 데이터프레임으로 변환
+
+    좌표가 없거나 숫자가 아닌 시설은 제외합니다.
+    """
+    x = pd.to_numeric(facilities_df['x'], errors='coerce')
+    y = pd.to_numeric(facilities_df['y'], errors='coerce')
+    valid = (x.notna() & y.notna()).to_numpy()
+    result = facilities_df.loc[valid].reset_index(drop=True)
+    mx, my = transform_coordinates(x[valid], y[valid], source_crs="epsg:4326", target_crs="epsg:3857")
+    result['mx'] = mx
+    result['my'] = my
+    return result[np.isfinite(mx) & np.isfinite(my)].reset_index(drop=True)
+
+
+def build_tiles(dongs_gdf: gpd.GeoDataFrame,
+                facilities_df: pd.DataFrame,
+                minzoom: int = 8,
+                maxzoom: int = 14,
+                dong_fields: Sequence[str] = ('ADM_CD', 'ADM_NM'),
+                facility_fields: Sequence[str] = ('name', 'type', 'district'),
+                encoder: TileEncoder = encode_mvt) -> Iterator[Tile]:
+    """
+    줌 레벨별 행정동/시설 타일 생성
+
+    - 행정동: 줌마다 반 픽셀 허용 오차로 공유 경계를 함께 단순화한 뒤 타일 범위(+여유 폭)로 잘라냄
+    - 시설: maxzoom 미만에서는 유형별로 FACILITY_CELL_PIXELS 픽셀 격자 한 칸에 하나만 남김
+
+    Args:
+        dongs_gdf: 행정동 GeoDataFrame (좌표계 포함)
+        facilities_df: facilities_to_mercator() 결과 (mx, my 열 포함)
+        minzoom: 최소 줌 레벨
+        maxzoom: 최대 줌 레벨 (모든 시설 포함)
+        dong_fields: 행정동 타일에 넣을 속성 열
+        facility_fields: 시설 타일에 넣을 속성 열
+        encoder: 타일 인코딩 함수
+
+    Yields:
+        (z, x, y, 타일 바이트), 피처가 없는 타일은 건너뜀
+    """
+    dongs = dongs_gdf.to_crs("EPSG:3857")
+    dong_geometries = dongs.geometry.values
+    dong_properties = dongs[[f for f in dong_fields if f in dongs.columns]].to_dict('records')
+    facility_properties = facilities_df[[f for f in facility_fields if f in facilities_df.columns]]
+    facility_properties = facility_properties.astype(object).where(facility_properties.notna(), None).to_dict('records')
+    mx = facilities_df['mx'].to_numpy(dtype=np.float64)
+    my = facilities_df['my'].to_numpy(dtype=np.float64)
+    type_codes = pd.factorize(facilities_df['type'])[0] if 'type' in facilities_df.columns else None
+
+    # 행정동 범위의 타일만 훑고, 범위 밖 시설(좌표 기본값 (0, 0)으로 저장된 '경계 외' 시설 등)은
+    # 그 시설이 있는 타일만 추가 (전체 범위를 시설까지 넓히면 높은 줌의 타일 수가 폭증함)
+    dong_bounds = shapely.total_bounds(dong_geometries)
+
+    for zoom in range(minzoom, maxzoom + 1):
+        simplified = simplify_coverage(dong_geometries, pixel_resolution(zoom) / 2)
+        tree = STRtree(simplified)
+
+        # 시설을 타일별로 묶음 (낮은 줌에서는 겹치는 점을 먼저 줄임)
+        kept = np.arange(len(mx)) if zoom >= maxzoom else thin_points(
+            mx, my, pixel_resolution(zoom) * FACILITY_CELL_PIXELS, type_codes
+        )
+        tile_x, tile_y = tile_indices(mx[kept], my[kept], zoom)
+        facilities_by_tile: Dict[Tuple[int, int], np.ndarray] = {}
+        if len(kept):
+            order = np.lexsort((tile_y, tile_x))
+            keys = np.stack([tile_x[order], tile_y[order]], axis=1)
+            starts = np.flatnonzero(np.r_[True, np.any(keys[1:] != keys[:-1], axis=1)])
+            for start, end in zip(starts, np.r_[starts[1:], len(order)]):
+                facilities_by_tile[(int(keys[start, 0]), int(keys[start, 1]))] = kept[order[start:end]]
+
+        for x, y in sorted(set(tile_range(dong_bounds, zoom)).union(facilities_by_tile)):
+            box_bounds = tile_bounds(zoom, x, y)
+            layers: Dict[str, List[Dict[str, Any]]] = {}
+
+            margin = tile_size(zoom) * TILE_BUFFER / TILE_EXTENT
+            clip = (box_bounds[0] - margin, box_bounds[1] - margin, box_bounds[2] + margin, box_bounds[3] + margin)
+            candidates = tree.query(shapely.box(*clip), predicate='intersects')
+            if len(candidates):
+                candidates = np.sort(candidates)
+                clipped = shapely.clip_by_rect(simplified[candidates], *clip)
+                features = [
+                    {"geometry": geometry, "properties": dong_properties[i]}
+                    for i, geometry in zip(candidates.tolist(), clipped)
+                    if not geometry.is_empty
+                ]
+                if features:
+                    layers[DONG_LAYER] = features
+
+            members = facilities_by_tile.get((x, y))
+            if members is not None:
+                layers[FACILITY_LAYER] = [
+                    {"geometry": shapely.Point(mx[i], my[i]), "properties": facility_properties[i]}
+                    for i in members.tolist()
+                ]
+
+            if layers:
+                yield zoom, x, y, encoder(layers, box_bounds)
+
+
+def tile_metadata(dongs_gdf: gpd.GeoDataFrame,
+                  minzoom: int,
+                  maxzoom: int,
+                  name: str = "busan_facilities") -> Dict[str, str]:
+    """MBTiles metadata 테이블 값 (경위도 범위, 중심, 벡터 레이어 목록)"""
+    minx, miny, maxx, maxy = dongs_gdf.to_crs("EPSG:4326").total_bounds
+    vector_layers = [
+        {"id": DONG_LAYER, "fields": {"ADM_CD": "String", "ADM_NM": "String"},
+         "minzoom": minzoom, "maxzoom": maxzoom},
+        {"id": FACILITY_LAYER, "fields": {"name": "String", "type": "String", "district": "String"},
+         "minzoom": minzoom, "maxzoom": maxzoom},
+    ]
+    return {
+        "name": name,
+        "format": "pbf",
+        "type": "overlay",
+        "minzoom": str(minzoom),
+        "maxzoom": str(maxzoom),
+        "bounds": f"{minx:.6f},{miny:.6f},{maxx:.6f},{maxy:.6f}",
+        "center": f"{(minx + maxx) / 2:.6f},{(miny + maxy) / 2:.6f},{minzoom}",
+        "json": json.dumps({"vector_layers": vector_layers}, ensure_ascii=False),
+    }
+
+
+def write_mbtiles(path: str, tiles: Iterable[Tile], metadata: Dict[str, str]) -> int:
+    """
+    타일을 단일 MBTiles(SQLite) 파일로 저장 (gzip 압축, TMS y 좌표)
+
+    Args:
+        path: MBTiles 파일 경로 (있으면 덮어씀)
+        tiles: (z, x, y, 타일 바이트)
+        metadata: metadata 테이블 값
+
+    Returns:
+        저장한 타일 수
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.execute("CREATE TABLE metadata (name TEXT, value TEXT)")
+        conn.execute("CREATE TABLE tiles (zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER, tile_data BLOB)")
+        conn.execute("CREATE UNIQUE INDEX tile_index ON tiles (zoom_level, tile_column, tile_row)")
+        conn.executemany("INSERT INTO metadata (name, value) VALUES (?, ?)", metadata.items())
+        count = 0
+        for z, x, y, data in tiles:
+            # MBTiles는 TMS 규칙(y가 남쪽부터 증가)을 사용
+            conn.execute("INSERT INTO tiles VALUES (?, ?, ?, ?)", (z, x, (2 ** z - 1) - y, gzip.compress(data)))
+            count += 1
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(tmp_path, path)
+    return count
+
+
+def write_tile_directory(output_dir: str, tiles: Iterable[Tile], metadata: Optional[Dict[str, str]] = None) -> int:
+    """
+    타일을 z/x/y.pbf 디렉토리 피라미드로 저장 (정적 파일 서버용, 압축하지 않음)
+
+    Returns:
+        저장한 타일 수
+    """
+    count = 0
+    for z, x, y, data in tiles:
+        tile_dir = os.path.join(output_dir, str(z), str(x))
+        os.makedirs(tile_dir, exist_ok=True)
+        with open(os.path.join(tile_dir, f"{y}.pbf"), 'wb') as f:
+            f.write(data)
+        count += 1
+    if metadata is not None:
+        with open(os.path.join(output_dir, "metadata.json"), 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, ensure_ascii=False, indent=2)
+    return count
+
+
+def export_vector_tiles(dongs_gdf: gpd.GeoDataFrame,
+                        facilities_df: pd.DataFrame,
+                        output_path: str,
+                        minzoom: int = 8,
+                        maxzoom: int = 14,
+                        encoder: TileEncoder = encode_mvt) -> int:
+    """
+    행정동/시설 벡터 타일 내보내기 (.mbtiles면 단일 파일, 아니면 z/x/y 디렉토리)
+
+    Args:
+        dongs_gdf: 행정동 GeoDataFrame
+        facilities_df: name, x(경도), y(위도), type, district 열을 가진 시설 데이터프레임
+        output_path: MBTiles 파일 또는 타일 디렉토리 경로
+        minzoom: 최소 줌 레벨
+        maxzoom: 최대 줌 레벨
+        encoder: 타일 인코딩 함수
+
+    Returns:
+        저장한 타일 수
+    """
+    tiles = build_tiles(dongs_gdf, facilities_to_mercator(facilities_df), minzoom, maxzoom, encoder=encoder)
+    metadata = tile_metadata(dongs_gdf, minzoom, maxzoom)
+    if output_path.endswith(".mbtiles"):
+        count = write_mbtiles(output_path, tiles, metadata)
+    else:
+        count = write_tile_directory(output_path, tiles, metadata)
+    print(f"벡터 타일 {count}개 저장: {output_path} (줌 {minzoom}~{maxzoom})")
+    return count
+
+
+if __name__ == "__main__":
+    from src.infrastructure.shapefile import ShapefileRepository
+
+    parser = argparse.ArgumentParser(description="행정동/시설 벡터 타일(MVT) 내보내기")
+    parser.add_argument("--shapefile", default="BND_ADM_DONG_PG/BND_ADM_DONG_PG.shp", help="행정동 shapefile 경로")
+    parser.add_argument("--facilities", default="output/facilities_with_district.csv", help="시설 CSV 경로")
+    parser.add_argument("--output", default="output/busan_facilities.mbtiles",
+                        help="출력 경로 (.mbtiles면 단일 파일, 아니면 z/x/y.pbf 디렉토리)")
+    parser.add_argument("--minzoom", type=int, default=8, help="최소 줌 레벨")
+    parser.add_argument("--maxzoom", type=int, default=14, help="최대 줌 레벨")
+    args = parser.parse_args()
+
+    dong_repository = ShapefileRepository()
+    dong_repository.load_dongs(args.shapefile)
+    export_vector_tiles(
+        dong_repository.get_dongs_geodataframe(),
+        pd.read_csv(args.facilities),
+        args.output,
+        args.minzoom,
+        args.maxzoom
+    )
@@ -5,12 +5,19 @@ import os
 import json
 import pandas as pd
 import geopandas as gpd
-from typing import List, Dict, Any, Optional
-from shapely.geometry import Point
+import shapely
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Dict, Optional, Sequence, Tuple
 
 from src.domain.entity import VetHospital
 from src.domain.repository import VetHospitalRepository
 
+try:
+    import pyarrow
+    import pyarrow.parquet  # noqa: F401  (GeoParquet 저장/읽기용)
+except ImportError:
+    pyarrow = None
+
 
 class InMemoryVetHospitalRepository(VetHospitalRepository):
     """메모리 기반 동물병원 레포지토리 구현"""
@@ -39,99 +46,198 @@ class InMemoryVetHospitalRepository(VetHospitalRepository):
         return counts
 
 
+def write_json(frame: pd.DataFrame, path: str) -> None:
+    """동물병원 테이블을 JSON 배열로 저장 (결측값은 null)"""
+    records = frame.astype(object).where(frame.notna(), None).to_dict("records")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(records, f, ensure_ascii=False, indent=2)
+
+
+def write_csv(frame: pd.DataFrame, path: str) -> None:
+    """동물병원 테이블을 CSV로 저장"""
+    frame.to_csv(path, index=False, encoding="utf-8")
+
+
+def _to_geodataframe(frame: pd.DataFrame) -> gpd.GeoDataFrame:
+    """경도/위도 열로 Point geometry를 만든 GeoDataFrame"""
+    return gpd.GeoDataFrame(
+        frame,
+        geometry=shapely.points(frame["longitude"].to_numpy(), frame["latitude"].to_numpy()),
+        crs="EPSG:4326"
+    )
+
+
+def write_geojson(frame: pd.DataFrame, path: str) -> None:
+    """동물병원 테이블을 GeoJSON으로 저장"""
+    _to_geodataframe(frame).to_file(path, driver="GeoJSON")
+
+
+def write_geoparquet(frame: pd.DataFrame, path: str) -> None:
+    """동물병원 테이블을 GeoParquet으로 저장 (pyarrow 필요)"""
+    if pyarrow is None:
+        raise ImportError("GeoParquet 저장에는 pyarrow가 필요합니다. (pip install pyarrow)")
+    _to_geodataframe(frame).to_parquet(path, index=False)
+
+
+# 저장 형식별 (파일 이름, 저장 함수)
+HospitalWriter = Callable[[pd.DataFrame, str], None]
+HOSPITAL_WRITERS: Dict[str, Tuple[str, HospitalWriter]] = {
+    "json": ("vet_hospitals.json", write_json),
+    "csv": ("vet_hospitals.csv", write_csv),
+    "geojson": ("vet_hospitals.geojson", write_geojson),
+    "geoparquet": ("vet_hospitals.parquet", write_geoparquet),
+}
+
+
 class FileVetHospitalRepository(VetHospitalRepository):
     """파일 기반 동물병원 레포지토리 구현"""
     
-    def __init__(self, data_dir: str = "data"):
+    # pyarrow가 있으면 다음 로드를 빠르게 하기 위해 GeoParquet도 함께 저장
+    DEFAULT_FORMATS = ("json", "csv", "geojson") + (("geoparquet",) if pyarrow is not None else ())
+    
+    def __init__(self,
+                 data_dir: str = "data",
+                 formats: Sequence[str] = DEFAULT_FORMATS,
+                 writers: Optional[Dict[str, Tuple[str, HospitalWriter]]] = None,
+                 max_workers: Optional[int] = None):
+        """
+        파일 기반 레포지토리 초기화
+        
+        Args:
+            data_dir: 저장 디렉토리
+            formats: 기본 저장 형식 ('json', 'csv', 'geojson', 'geoparquet')
+            writers: 저장 형식별 (파일 이름, 저장 함수), 없으면 HOSPITAL_WRITERS
+            max_workers: 형식별 동시 저장 스레드 수 (없으면 형식 수)
+        """
         self.data_dir = data_dir
         self.hospitals: List[VetHospital] = []
+        self._loaded = False
+        self._by_dong: Optional[Dict[str, List[VetHospital]]] = None
+        self._counts: Optional[Dict[str, int]] = None
+        self.writers = dict(writers or HOSPITAL_WRITERS)
+        self.formats = self._check_formats(formats)
+        self.max_workers = max_workers
         
         # 데이터 디렉토리 생성
         os.makedirs(data_dir, exist_ok=True)
     
-    def save_hospitals(self, hospitals: List[VetHospital]) -> None:
+    def _check_formats(self, formats: Sequence[str]) -> Tuple[str, ...]:
+        """지원하는 저장 형식인지 확인"""
+        unknown = [fmt for fmt in formats if fmt not in self.writers]
+        if unknown:
+            raise ValueError(f"지원하지 않는 저장 형식입니다: {unknown} (지원: {sorted(self.writers)})")
+        return tuple(dict.fromkeys(formats))
+    
+    def save_hospitals(self, hospitals: List[VetHospital], formats: Optional[Sequence[str]] = None) -> None:
         """
         동물병원 목록 저장
-        - JSON 파일로 저장
-        - CSV 파일로 저장
-        - GeoJSON 파일로 저장
+        - 열 단위 테이블로 한 번만 변환한 뒤 형식별 저장 함수에 전달
+        - 여러 형식은 스레드 풀에서 동시에 저장
+        
+        Args:
+            hospitals: 동물병원 목록
+            formats: 저장 형식 (없으면 레포지토리 기본 형식)
         """
-        self.hospitals = hospitals
+        self._set_hospitals(hospitals)
+        formats = self._check_formats(formats) if formats is not None else self.formats
+        if not formats:
+            return
         
-        # JSON 파일로 저장
-        hospitals_dict = [self._hospital_to_dict(h) for h in hospitals]
-        with open(os.path.join(self.data_dir, "vet_hospitals.json"), "w", encoding="utf-8") as f:
-            json.dump(hospitals_dict, f, ensure_ascii=False, indent=2)
+        frame = pd.DataFrame(VetHospital.to_columns(hospitals))
+        jobs = [(fmt, os.path.join(self.data_dir, self.writers[fmt][0]), self.writers[fmt][1]) for fmt in formats]
         
-        # CSV 파일로 저장
-        df = pd.DataFrame([self._hospital_to_dict(h) for h in hospitals])
-        df.to_csv(os.path.join(self.data_dir, "vet_hospitals.csv"), index=False, encoding="utf-8")
+        if len(jobs) == 1:
+            _, path, writer = jobs[0]
+            writer(frame, path)
+            return
         
-        # GeoJSON 파일로 저장
-        gdf = gpd.GeoDataFrame(
-            [self._hospital_to_dict(h) for h in hospitals],
-            geometry=[Point(h.longitude, h.latitude) for h in hospitals],
-            crs="EPSG:4326"
-        )
-        gdf.to_file(os.path.join(self.data_dir, "vet_hospitals.geojson"), driver="GeoJSON")
+        with ThreadPoolExecutor(max_workers=self.max_workers or len(jobs)) as executor:
+            futures = {fmt: executor.submit(writer, frame, path) for fmt, path, writer in jobs}
+        
+        errors = {fmt: future.exception() for fmt, future in futures.items() if future.exception() is not None}
+        if errors:
+            raise RuntimeError(f"동물병원 데이터 저장 실패: {', '.join(errors)}") from next(iter(errors.values()))
     
     def get_hospitals(self) -> List[VetHospital]:
-        """저장된 동물병원 목록 조회"""
-        if not self.hospitals:
-            self._load_hospitals()
+        """저장된 동물병원 목록 조회 (처음 호출 시 한 번만 로드)"""
+        if not self._loaded:
+            self._set_hospitals(list(self.iter_hospitals()))
         return self.hospitals
     
     def get_hospitals_by_dong(self, dong_code: str) -> List[VetHospital]:
-        """특정 행정동의 동물병원 목록 조회"""
-        if not self.hospitals:
-            self._load_hospitals()
-        return [h for h in self.hospitals if h.dong_code == dong_code]
+        """특정 행정동의 동물병원 목록 조회 (행정동 코드 인덱스 사용)"""
+        return list(self._dong_index().get(dong_code, []))
     
     def get_hospitals_count_by_dong(self) -> Dict[str, int]:
-        """행정동별 동물병원 개수 조회"""
-        if not self.hospitals:
-            self._load_hospitals()
+        """
+        행정동별 동물병원 개수 조회
         
-        counts = {}
-        for hospital in self.hospitals:
-            if hospital.dong_code:
-                counts[hospital.dong_code] = counts.get(hospital.dong_code, 0) + 1
-        return counts
+        저장 전까지 결과를 재사용하며, 병원 목록을 아직 로드하지 않았고 열 단위 파일이 있으면
+        dong_code 열만 읽어 집계합니다.
+        """
+        if self._counts is None:
+            if not self._loaded and self._columnar_path():
+                codes = pd.read_parquet(self._columnar_path(), columns=["dong_code"])["dong_code"]
+                codes = codes[codes.notna() & (codes.astype(str) != "")]
+                self._counts = {str(code): int(count) for code, count in codes.value_counts(sort=False).items()}
+            else:
+                self._counts = {code: len(hospitals) for code, hospitals in self._dong_index().items()}
+        return dict(self._counts)
     
-    def _load_hospitals(self) -> None:
-        """저장된 동물병원 데이터 로드"""
-        json_path = os.path.join(self.data_dir, "vet_hospitals.json")
+    def iter_hospitals(self, batch_size: int = 10000) -> Iterator[VetHospital]:
+        """
+        저장된 동물병원을 순서대로 하나씩 읽기
+        
+        GeoParquet 파일이 JSON보다 최신이면 batch_size 행씩 필요한 열만 읽어 객체로 변환하고,
+        아니면 JSON 파일 전체를 읽습니다.
+        
+        Args:
+            batch_size: 열 단위 파일에서 한 번에 읽을 행 수
+        
+        Yields:
+            동물병원 객체
+        """
+        columnar_path = self._columnar_path()
+        if columnar_path:
+            parquet_file = pyarrow.parquet.ParquetFile(columnar_path)
+            columns = [name for name in VetHospital.FIELDS if name in parquet_file.schema_arrow.names]
+            for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+                yield from VetHospital.from_dataframe(batch.to_pandas())
+            return
         
+        json_path = os.path.join(self.data_dir, self.writers.get("json", HOSPITAL_WRITERS["json"])[0])
         if os.path.exists(json_path):
             with open(json_path, "r", encoding="utf-8") as f:
                 hospitals_dict = json.load(f)
-            
-            self.hospitals = [self._dict_to_hospital(h) for h in hospitals_dict]
-    
-    def _hospital_to_dict(self, hospital: VetHospital) -> Dict[str, Any]:
-        """VetHospital 객체를 딕셔너리로 변환"""
-        return {
-            "id": hospital.id,
-            "name": hospital.name,
-            "address": hospital.address,
-            "latitude": hospital.latitude,
-            "longitude": hospital.longitude,
-            "phone": hospital.phone,
-            "place_url": hospital.place_url,
-            "dong_code": hospital.dong_code,
-            "dong_name": hospital.dong_name
-        }
-    
-    def _dict_to_hospital(self, data: Dict[str, Any]) -> VetHospital:
-        """딕셔너리를 VetHospital 객체로 변환"""
-        return VetHospital(
-            id=data["id"],
-            name=data["name"],
-            address=data["address"],
-            latitude=data["latitude"],
-            longitude=data["longitude"],
-            phone=data.get("phone"),
-            place_url=data.get("place_url"),
-            dong_code=data.get("dong_code"),
-            dong_name=data.get("dong_name")
-        )
+            for h in hospitals_dict:
+                yield VetHospital.from_dict(h)
+    
+    def _set_hospitals(self, hospitals: List[VetHospital]) -> None:
+        """병원 목록 교체 (인덱스와 집계 결과 무효화)"""
+        self.hospitals = hospitals
+        self._loaded = True
+        self._by_dong = None
+        self._counts = None
+    
+    def _dong_index(self) -> Dict[str, List[VetHospital]]:
+        """행정동 코드 -> 병원 목록 인덱스 (처음 필요할 때 한 번만 생성)"""
+        if self._by_dong is None:
+            index: Dict[str, List[VetHospital]] = {}
+            for hospital in self.get_hospitals():
+                if hospital.dong_code:
+                    index.setdefault(hospital.dong_code, []).append(hospital)
+            self._by_dong = index
+        return self._by_dong
+    
+    def _columnar_path(self) -> Optional[str]:
+        """읽기에 사용할 GeoParquet 파일 경로 (pyarrow가 없거나 JSON보다 오래됐으면 None)"""
+        if pyarrow is None or "geoparquet" not in self.writers:
+            return None
+        parquet_path = os.path.join(self.data_dir, self.writers["geoparquet"][0])
+        if not os.path.exists(parquet_path):
+            return None
+        json_path = os.path.join(self.data_dir, self.writers.get("json", HOSPITAL_WRITERS["json"])[0])
+        # 같은 저장에서 함께 쓴 파일이면 내용이 같으므로 더 최근 파일을 사용
+        if os.path.exists(json_path) and os.stat(json_path).st_mtime_ns > os.stat(parquet_path).st_mtime_ns:
+            return None
+        return parquet_path
@@ -4,19 +4,23 @@
 import os
 import argparse
 from dotenv import load_dotenv
-from typing import List
+from typing import List, Optional, Sequence
 
 from src.domain.entity import VetHospital
 from src.infrastructure.kakao_api import KakaoMapAPI
 from src.infrastructure.excel_repository import ExcelRepository
-from src.infrastructure.shapefile import ShapefileRepository
-from src.infrastructure.vet_hospital_repository import FileVetHospitalRepository
+from src.infrastructure.vet_hospital_repository import FileVetHospitalRepository, HOSPITAL_WRITERS
+from src.interface.pipeline_context import PipelineContext
 from src.usecase.collect_vet_hospitals import CollectVetHospitalsUseCase
 from src.usecase.collect_excel_hospitals import CollectExcelHospitalsUseCase
 from src.usecase.visualize_vet_hospitals import VisualizeVetHospitalsUseCase
 
 
-def run_api_etl_pipeline(shapefile_path: str, city: str = "부산", visualize: bool = True) -> List[VetHospital]:
+def run_api_etl_pipeline(shapefile_path: str, city: str = "부산", visualize: bool = True,
+                         context: Optional[PipelineContext] = None,
+                         concurrent: bool = False,
+                         incremental: bool = False,
+                         diff_file: Optional[str] = None) -> List[VetHospital]:
     """
     카카오맵 API를 활용한 동물병원 데이터 ETL 파이프라인 실행
     
@@ -24,21 +28,19 @@ def run_api_etl_pipeline(shapefile_path: str, city: str = "부산", visualize: b
         shapefile_path: 행정동 shapefile 경로
         city: 도시 이름 (예: "부산")
         visualize: 시각화 생성 여부
+        context: 공유 파이프라인 컨텍스트 (없으면 새로 생성)
+        concurrent: 키워드별 검색을 동시에 실행할지 여부 (API 클라이언트의 속도 제한 공유)
+        incremental: 이전 수집 결과와 비교해 추가/이동된 병원만 공간 조인하고 변경 내역을 저장할지 여부
+        diff_file: 증분 수집 변경 내역 저장 경로 (없으면 <출력 디렉토리>/vet_hospitals_diff.json)
         
     Returns:
         수집된 동물병원 목록
     """
     print(f"=== {city} 동물병원 데이터 ETL 파이프라인 시작 (API 기반) ===")
     
-    # 1. 레포지토리 초기화
-    print("레포지토리 초기화 중...")
-    dong_repository = ShapefileRepository()
-    vet_hospital_repository = FileVetHospitalRepository(data_dir="data")
-    
-    # 2. 행정동 데이터 로드
-    print(f"행정동 데이터 로드 중... (파일: {shapefile_path})")
-    dongs = dong_repository.load_dongs(shapefile_path)
-    print(f"총 {len(dongs)}개 행정동 로드 완료")
+    # 1~2. 레포지토리 초기화 및 행정동 데이터 로드 (컨텍스트가 있으면 재사용)
+    if context is None:
+        context = PipelineContext.create(shapefile_path)
     
     # 3. 카카오맵 API 클라이언트 초기화
     print("카카오맵 API 클라이언트 초기화 중...")
@@ -47,17 +49,26 @@ def run_api_etl_pipeline(shapefile_path: str, city: str = "부산", visualize: b
     # 4. 동물병원 데이터 수집 유즈케이스 실행
     print(f"{city} 동물병원 데이터 수집 중...")
     collect_usecase = CollectVetHospitalsUseCase(
-        vet_hospital_repository=vet_hospital_repository,
-        dong_repository=dong_repository,
+        vet_hospital_repository=context.vet_hospital_repository,
+        dong_repository=context.dong_repository,
         kakao_api=kakao_api
     )
-    hospitals = collect_usecase.execute(city=city)
+    hospitals = collect_usecase.execute(city=city, concurrent=concurrent, incremental=incremental)
     print(f"총 {len(hospitals)}개 동물병원 데이터 수집 완료")
     
+    # 증분 수집 변경 내역 저장 (행정동별 집계에 증분 반영할 때 사용)
+    if incremental and collect_usecase.last_diff is not None:
+        diff_file = diff_file or os.path.join(context.output_dir, "vet_hospitals_diff.json")
+        collect_usecase.last_diff.save(diff_file)
+        print(f"변경 내역({collect_usecase.last_diff.summary()})이 {diff_file}에 저장되었습니다.")
+        print(f"행정동별 집계 반영: python count_facilities_by_district.py --apply-diff {diff_file} --type 동물병원")
+    
     return hospitals
 
 
-def run_excel_etl_pipeline(shapefile_path: str, excel_path: str, city: str = "부산", visualize: bool = True) -> List[VetHospital]:
+def run_excel_etl_pipeline(shapefile_path: str, excel_path: str, city: str = "부산", visualize: bool = True,
+                           context: Optional[PipelineContext] = None,
+                           chunksize: Optional[int] = None) -> List[VetHospital]:
     """
     엑셀 파일을 활용한 동물병원 데이터 ETL 파이프라인 실행
     
@@ -66,28 +77,24 @@ def run_excel_etl_pipeline(shapefile_path: str, excel_path: str, city: str = "
         excel_path: 동물병원 엑셀 파일 경로
         city: 도시 이름 (예: "부산")
         visualize: 시각화 생성 여부
+        context: 공유 파이프라인 컨텍스트 (없으면 새로 생성)
+        chunksize: 지정하면 파일을 이 행 수만큼씩 스트리밍으로 읽음
         
     Returns:
         수집된 동물병원 목록
     """
     print(f"=== {city} 동물병원 데이터 ETL 파이프라인 시작 (엑셀 기반) ===")
     
-    # 1. 레포지토리 초기화
-    print("레포지토리 초기화 중...")
-    dong_repository = ShapefileRepository()
-    vet_hospital_repository = FileVetHospitalRepository(data_dir="data")
-    excel_repository = ExcelRepository(excel_path)
-    
-    # 2. 행정동 데이터 로드
-    print(f"행정동 데이터 로드 중... (파일: {shapefile_path})")
-    dongs = dong_repository.load_dongs(shapefile_path)
-    print(f"총 {len(dongs)}개 행정동 로드 완료")
+    # 1~2. 레포지토리 초기화 및 행정동 데이터 로드 (컨텍스트가 있으면 재사용)
+    if context is None:
+        context = PipelineContext.create(shapefile_path)
+    excel_repository = ExcelRepository(excel_path, chunksize=chunksize)
     
     # 3. 동물병원 데이터 수집 유즈케이스 실행
     print(f"{city} 동물병원 엑셀 데이터 수집 중...")
     collect_usecase = CollectExcelHospitalsUseCase(
-        vet_hospital_repository=vet_hospital_repository,
-        dong_repository=dong_repository,
+        vet_hospital_repository=context.vet_hospital_repository,
+        dong_repository=context.dong_repository,
         excel_repository=excel_repository
     )
     hospitals = collect_usecase.execute(city=city)
@@ -97,7 +104,13 @@ def run_excel_etl_pipeline(shapefile_path: str, excel_path: str, city: str = "
 
 
 def run_etl_pipeline(shapefile_path: str, city: str = "부산", visualize: bool = True, 
-                    data_source: str = "api", excel_path: str = None) -> None:
+                    data_source: str = "api", excel_path: str = None,
+                    hospital_formats: Sequence[str] = FileVetHospitalRepository.DEFAULT_FORMATS,
+                    chunksize: Optional[int] = None,
+                    parallel_render: bool = False,
+                    concurrent: bool = False,
+                    incremental: bool = False,
+                    diff_file: Optional[str] = None) -> None:
     """
     동물병원 데이터 ETL 파이프라인 실행
     
@@ -107,48 +120,67 @@ def run_etl_pipeline(shapefile_path: str, city: str = "부산", visualize: bool
         visualize: 시각화 생성 여부
         data_source: 데이터 소스 ("api" 또는 "excel")
         excel_path: 엑셀 파일 경로 (data_source가 "excel"일 때만 사용)
+        hospital_formats: 동물병원 데이터 저장 형식 (json, csv, geojson, geoparquet)
+        chunksize: 엑셀/CSV 파일을 이 행 수만큼씩 스트리밍으로 읽음 (없으면 전체 로드)
+        parallel_render: 시각화 그림을 프로세스 풀에서 동시에 렌더링할지 여부
+        concurrent: API 수집 시 키워드별 검색을 속도 제한을 공유하며 동시에 실행할지 여부
+            (엑셀 소스는 API를 호출하지 않으므로 무시)
+        incremental: API 수집 시 이전 수집 결과 대비 변경분만 갱신할지 여부 (엑셀 소스는 무시)
+        diff_file: 증분 수집 변경 내역 저장 경로 (없으면 <출력 디렉토리>/vet_hospitals_diff.json)
     """
+    # 레포지토리 및 행정동 데이터는 한 번만 로드해 모든 단계에서 공유
+    context = PipelineContext.create(shapefile_path, hospital_formats=hospital_formats)
+    
     # 데이터 소스에 따라 적절한 파이프라인 실행
-    if data_source == "excel" and excel_path:
-        hospitals = run_excel_etl_pipeline(
-            shapefile_path=shapefile_path,
-            excel_path=excel_path,
-            city=city,
-            visualize=False  # 시각화는 아래에서 공통으로 처리
-        )
-    else:  # 기본값은 API
-        hospitals = run_api_etl_pipeline(
-            shapefile_path=shapefile_path,
-            city=city,
-            visualize=False  # 시각화는 아래에서 공통으로 처리
-        )
-    
-    # 레포지토리 및 데이터 설정 (공통)
-    dong_repository = ShapefileRepository()
-    vet_hospital_repository = FileVetHospitalRepository(data_dir="data")
-    dongs = dong_repository.load_dongs(shapefile_path)
-    
-    # 5. 행정동별 동물병원 개수 출력
-    hospital_counts = vet_hospital_repository.get_hospitals_count_by_dong()
-    print("\n=== 행정동별 동물병원 개수 ===")
-    for dong in dongs:
-        count = hospital_counts.get(dong.code, 0)
-        if count > 0:
-            print(f"{dong.name}: {count}개")
+    with context.stage("collect"):
+        if data_source == "excel" and excel_path:
+            if concurrent:
+                print("엑셀 데이터 소스는 API를 호출하지 않으므로 동시 수집 옵션을 무시합니다.")
+            if incremental:
+                print("엑셀 데이터 소스는 이전 수집 결과와 비교하지 않으므로 증분 수집 옵션을 무시합니다.")
+            hospitals = run_excel_etl_pipeline(
+                shapefile_path=shapefile_path,
+                excel_path=excel_path,
+                city=city,
+                visualize=False,  # 시각화는 아래에서 공통으로 처리
+                context=context,
+                chunksize=chunksize
+            )
+        else:  # 기본값은 API
+            hospitals = run_api_etl_pipeline(
+                shapefile_path=shapefile_path,
+                city=city,
+                visualize=False,  # 시각화는 아래에서 공통으로 처리
+                context=context,
+                concurrent=concurrent,
+                incremental=incremental,
+                diff_file=diff_file
+            )
+    
+    # 5. 행정동별 동물병원 개수 출력 (수집 단계에서 저장한 병원 목록 재사용)
+    with context.stage("count"):
+        hospital_counts = context.vet_hospital_repository.get_hospitals_count_by_dong()
+        print("\n=== 행정동별 동물병원 개수 ===")
+        for dong in context.dongs:
+            count = hospital_counts.get(dong.code, 0)
+            if count > 0:
+                print(f"{dong.name}: {count}개")
     
     # 6. 시각화 생성
     if visualize:
-        print("\n=== 시각화 생성 중... ===")
-        visualize_usecase = VisualizeVetHospitalsUseCase(
-            vet_hospital_repository=vet_hospital_repository,
-            dong_repository=dong_repository,
-            output_dir="output"
-        )
-        output_files = visualize_usecase.create_all_visualizations()
-        print(f"시각화 파일 {len(output_files)}개 생성 완료:")
-        for file_path in output_files:
-            print(f"- {file_path}")
+        with context.stage("visualize"):
+            print("\n=== 시각화 생성 중... ===")
+            visualize_usecase = VisualizeVetHospitalsUseCase(
+                vet_hospital_repository=context.vet_hospital_repository,
+                dong_repository=context.dong_repository,
+                output_dir=context.output_dir
+            )
+            output_files = visualize_usecase.create_all_visualizations(parallel=parallel_render)
+            print(f"시각화 파일 {len(output_files)}개 생성 완료:")
+            for file_path in output_files:
+                print(f"- {file_path}")
     
+    context.print_timings()
     print("\n=== ETL 파이프라인 완료 ===")
 
 
@@ -188,6 +220,41 @@ if __name__ == "__main__":
         default="data/fulldata_02_03_01_P_동물병원.xlsx",
         help="동물병원 엑셀 파일 경로 (--data-source=excel일 때 사용)"
     )
+    parser.add_argument(
+        "--formats",
+        nargs="+",
+        choices=sorted(HOSPITAL_WRITERS),
+        default=list(FileVetHospitalRepository.DEFAULT_FORMATS),
+        help="동물병원 데이터 저장 형식 (예: --formats json geoparquet)"
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help="엑셀/CSV 파일을 이 행 수만큼씩 스트리밍으로 읽기 (큰 전국 파일용, 예: 50000)"
+    )
+    parser.add_argument(
+        "--parallel-render",
+        action="store_true",
+        help="시각화 그림을 프로세스 풀에서 동시에 렌더링 (Agg 백엔드)"
+    )
+    parser.add_argument(
+        "--concurrent",
+        action="store_true",
+        help="API 수집 시 키워드별 검색을 동시에 실행 (속도 제한 공유, --data-source=api일 때 사용)"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="API 수집 시 이전 결과와 비교해 추가/이동된 병원만 갱신하고 변경 내역 저장 (--data-source=api일 때 사용)"
+    )
+    parser.add_argument(
+        "--diff-file",
+        type=str,
+        default=None,
+        help="증분 수집 변경 내역 저장 경로 (기본값: output/vet_hospitals_diff.json, "
+             "count_facilities_by_district.py --apply-diff 입력)"
+    )
     
     args = parser.parse_args()
     
@@ -197,5 +264,11 @@ if __name__ == "__main__":
         city=args.city,
         visualize=not args.no_visualize,
         data_source=args.data_source,
-        excel_path=args.excel_path
+        excel_path=args.excel_path,
+        hospital_formats=args.formats,
+        chunksize=args.chunksize,
+        parallel_render=args.parallel_render,
+        concurrent=args.concurrent,
+        incremental=args.incremental,
+        diff_file=args.diff_file
     )
@@ -0,0 +1,81 @@
+"""
+ETL 파이프라인 단계 간 공유 컨텍스트
+"""
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Sequence
+
+from src.domain.entity import AdministrativeDong
+from src.infrastructure.shapefile import ShapefileRepository
+from src.infrastructure.vet_hospital_repository import FileVetHospitalRepository
+
+
+@dataclass
+class PipelineContext:
+    """수집 → 집계 → 시각화 단계가 함께 사용하는 레포지토리 및 입력 데이터"""
+    shapefile_path: str
+    dong_repository: ShapefileRepository
+    vet_hospital_repository: FileVetHospitalRepository
+    dongs: List[AdministrativeDong]
+    output_dir: str = "output"
+    stage_timings: Dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def create(cls,
+               shapefile_path: str,
+               data_dir: str = "data",
+               output_dir: str = "output",
+               hospital_formats: Sequence[str] = FileVetHospitalRepository.DEFAULT_FORMATS) -> 'PipelineContext':
+        """
+        레포지토리를 초기화하고 행정동 데이터를 한 번만 로드해 컨텍스트 생성
+
+        Args:
+            shapefile_path: 행정동 shapefile 경로
+            data_dir: 동물병원 데이터 디렉토리
+            output_dir: 시각화 출력 디렉토리
+            hospital_formats: 동물병원 데이터 저장 형식
+
+        Returns:
+            파이프라인 컨텍스트
+        """
+        start = time.perf_counter()
+
+        print("레포지토리 초기화 중...")
+        dong_repository = ShapefileRepository()
+        vet_hospital_repository = FileVetHospitalRepository(data_dir=data_dir, formats=hospital_formats)
+
+        print(f"행정동 데이터 로드 중... (파일: {shapefile_path})")
+        dongs = dong_repository.load_dongs(shapefile_path)
+        print(f"총 {len(dongs)}개 행정동 로드 완료")
+
+        context = cls(
+            shapefile_path=shapefile_path,
+            dong_repository=dong_repository,
+            vet_hospital_repository=vet_hospital_repository,
+            dongs=dongs,
+            output_dir=output_dir
+        )
+        context.stage_timings["load"] = time.perf_counter() - start
+        return context
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        단계 실행 시간 측정
+
+        Args:
+            name: 단계 이름 (예: "collect")
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_timings[name] = self.stage_timings.get(name, 0.0) + time.perf_counter() - start
+
+    def print_timings(self) -> None:
+        """단계별 실행 시간 출력"""
+        print("\n=== 단계별 실행 시간 ===")
+        for name, seconds in self.stage_timings.items():
+            print(f"{name}: {seconds:.2f}초")
+        print(f"전체: {sum(self.stage_timings.values()):.2f}초")
@@ -1,11 +1,13 @@
 """
 엑셀 파일에서 동물병원 데이터를 수집하는 유즈케이스
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Optional
 
 from src.domain.entity import VetHospital
+from src.domain.facility_table import FacilityTable
 from src.domain.repository import VetHospitalRepository, AdministrativeDongRepository
 from src.infrastructure.excel_repository import ExcelRepository
+from src.usecase.dong_assignment import assign_dong_info
 
 
 class CollectExcelHospitalsUseCase:
@@ -64,20 +66,12 @@ class CollectExcelHospitalsUseCase:
             print(f"\n좌표가 없는 병원 {len(hospitals) - len(hospitals_with_coords)}개가 필터링되었습니다.")
         
         # 4. 행정동 정보와 공간 조인
-        hospitals_dict = [self._hospital_to_dict(h) for h in hospitals_with_coords]
-        joined = self.dong_repository.spatial_join_hospitals(hospitals_dict)
+        facilities = FacilityTable.from_hospitals(hospitals_with_coords)
+        joined = self.dong_repository.spatial_join_hospitals(facilities)
         print(f"\n=== 공간조인 결과 회수: {len(joined)} ====")
         
-        # 5. 행정동 정보 추가
-        for hospital in hospitals_with_coords:
-            hospital_joined = joined[joined["id"] == hospital.id]
-            
-            # 공간조인 결과가 있는 경우
-            if not hospital_joined.empty:
-                dong_code = hospital_joined.iloc[0].get("ADM_CD")
-                dong_name = hospital_joined.iloc[0].get("ADM_NM")
-                hospital.dong_code = dong_code
-                hospital.dong_name = dong_name
+        # 5. 행정동 정보 추가 (병원 ID 기준 조인 결과 일괄 반영)
+        assign_dong_info(hospitals_with_coords, joined)
         
         # 6. 기존 부산 필터링은 이미 city 파라미터로 수행됐으므로 생략
         print(f"\n=== {city} 동물병원 예시(10개) ====")
@@ -89,17 +83,3 @@ class CollectExcelHospitalsUseCase:
         print(f"총 {len(hospitals_with_coords)}개 동물병원 데이터 수집 완료")
         
         return hospitals_with_coords
-    
-    def _hospital_to_dict(self, hospital: VetHospital) -> Dict[str, Any]:
-        """VetHospital 객체를 딕셔너리로 변환"""
-        return {
-            "id": hospital.id,
-            "name": hospital.name,
-            "address": hospital.address,
-            "latitude": hospital.latitude,
-            "longitude": hospital.longitude,
-            "phone": hospital.phone,
-            "place_url": hospital.place_url,
-            "dong_code": hospital.dong_code,
-            "dong_name": hospital.dong_name
-        }
@@ -1,21 +1,29 @@
 """
 동물병원 데이터 수집 및 가공 유즈케이스
 """
+import os
 from typing import List, Dict, Any, Optional
 
 from src.domain.entity import VetHospital
+from src.domain.facility_table import FacilityTable
 from src.domain.repository import VetHospitalRepository, AdministrativeDongRepository
 from src.infrastructure.kakao_api import KakaoMapAPI
+from src.infrastructure.place_snapshot import PlaceDiff, PlaceSnapshot, diff_places
+from src.usecase.dong_assignment import assign_dong_info
 
 
 class CollectVetHospitalsUseCase:
     """동물병원 데이터 수집 및 가공 유즈케이스"""
     
+    # 증분 수집용 키워드별 total_count/장소 스냅샷
+    DEFAULT_SNAPSHOT_PATH = os.path.join("data", "cache", "snapshots", "vet_hospitals_api.snapshot.json")
+    
     def __init__(
         self,
         vet_hospital_repository: VetHospitalRepository,
         dong_repository: AdministrativeDongRepository,
-        kakao_api: Optional[KakaoMapAPI] = None
+        kakao_api: Optional[KakaoMapAPI] = None,
+        snapshot_path: Optional[str] = None
     ):
         """
         동물병원 데이터 수집 유즈케이스 초기화
@@ -24,19 +32,30 @@ class CollectVetHospitalsUseCase:
             vet_hospital_repository: 동물병원 레포지토리
             dong_repository: 행정동 레포지토리
             kakao_api: 카카오맵 API 클라이언트 (없으면 자동 생성)
+            snapshot_path: 증분 수집 스냅샷 파일 경로 (없으면 DEFAULT_SNAPSHOT_PATH)
         """
         self.vet_hospital_repository = vet_hospital_repository
         self.dong_repository = dong_repository
         self.kakao_api = kakao_api or KakaoMapAPI()
+        self.snapshot_path = snapshot_path or self.DEFAULT_SNAPSHOT_PATH
+        self.last_diff: Optional[PlaceDiff] = None
     
-    def execute(self, city: str = "부산") -> List[VetHospital]:
+    def execute(self, city: str = "부산", concurrent: bool = False, incremental: bool = False) -> List[VetHospital]:
         """
         동물병원 데이터 수집 및 가공 실행 (동별+키워드별+페이지별 반복)
         Args:
             city: 도시 이름 (예: "부산")
+            concurrent: True이면 키워드별 검색을 동시에 실행 (API 클라이언트의 속도 제한 공유)
+            incremental: True이면 키워드별 첫 페이지의 total_count가 스냅샷과 같으면 나머지 페이지를
+                다시 조회하지 않고 스냅샷의 결과를 재사용하며, 이전에 저장된 병원 중 위치가 같은 병원은
+                행정동 정보를 재사용하고 추가/이동된 병원만 공간 조인한 뒤 변경 내역을 last_diff에 기록
         Returns:
             처리된 동물병원 목록
         """
+        previous = {}
+        if incremental:
+            previous = {h.id: h for h in self.vet_hospital_repository.get_hospitals()}
+        
         # 여러 키워드로 검색해서 더 많은 병원 데이터 수집
         search_keywords = [
             f"{city} 동물병원",
@@ -49,16 +68,30 @@ class CollectVetHospitalsUseCase:
         all_hospitals = []
         all_ids = set()
         
-        # 각 키워드별로 검색 및 결과 병합
-        for keyword in search_keywords:
-            # 현재 키워드로 검색
-            current_hospitals = self.kakao_api.search_direct_keyword(keyword)
-            
-            # 중복 제거하며 추가
-            for hospital in current_hospitals:
-                if hospital.id not in all_ids:
-                    all_ids.add(hospital.id)
-                    all_hospitals.append(hospital)
+        if incremental:
+            # 키워드별 첫 페이지만 조회해 total_count가 바뀐 키워드만 모든 페이지 다시 조회
+            snapshot = PlaceSnapshot.load(self.snapshot_path)
+            all_hospitals, tiles = self.kakao_api.search_keywords_incrementally(
+                search_keywords, snapshot.known_tiles(), concurrent=concurrent
+            )
+            all_ids = {hospital.id for hospital in all_hospitals}
+            snapshot.update([document for _, documents in tiles.values() for document in documents], tiles)
+            snapshot.save(self.snapshot_path)
+        elif concurrent:
+            # 모든 키워드를 동시에 검색 (중복 제거된 결과)
+            all_hospitals = self.kakao_api.search_keywords_concurrently(search_keywords)
+            all_ids = {hospital.id for hospital in all_hospitals}
+        else:
+            # 각 키워드별로 검색 및 결과 병합
+            for keyword in search_keywords:
+                # 현재 키워드로 검색
+                current_hospitals = self.kakao_api.search_direct_keyword(keyword)
+                
+                # 중복 제거하며 추가
+                for hospital in current_hospitals:
+                    if hospital.id not in all_ids:
+                        all_ids.add(hospital.id)
+                        all_hospitals.append(hospital)
                     
         print(f"\n=== 총 검색된 동물병원: {len(search_keywords)}개 키워드, {len(all_ids)}개 중복제거 결과 ====")
         hospitals = all_hospitals
@@ -68,32 +101,25 @@ class CollectVetHospitalsUseCase:
         for i, h in enumerate(hospitals[:10]):
             print(f"{i+1}. {h.name}: {h.address}")
         
-        # 5. 행정동 정보와 공간 조인
-        hospitals_dict = [self._hospital_to_dict(h) for h in hospitals]
-        joined = self.dong_repository.spatial_join_hospitals(hospitals_dict)
-        print(f"\n=== 공간조인 결과 회수: {len(joined)} ====")
+        # 5. 행정동 정보와 공간 조인 (증분 모드에서는 추가/이동된 병원만)
+        to_join = self._reuse_dong_info(hospitals, previous) if incremental else hospitals
+        if to_join or not incremental:
+            facilities = FacilityTable.from_hospitals(to_join)
+            joined = self.dong_repository.spatial_join_hospitals(facilities)
+            print(f"\n=== 공간조인 결과 회수: {len(joined)} ====")
+            
+            # 6. 행정동 정보 추가 (병원 ID 기준 조인 결과 일괄 반영)
+            assign_dong_info(to_join, joined)
         
-        # 6. 행정동 정보 추가 및 부산시(ADM_CD 26 또는 주소에 '부산' 포함) 필터링
+        # 7. 부산시(ADM_CD 26 또는 주소에 '부산' 포함) 필터링
         busan_hospitals = []
         
         for hospital in hospitals:
             # 1) 주소에 부산이 포함된 경우
             is_busan_address = '부산' in hospital.address if hospital.address else False
             
-            # 2) 공간조인으로 부산 ADM_CD가 있는 경우
-            hospital_joined = joined[joined["id"] == hospital.id]
-            is_busan_dong = False
-            
-            # 공간조인 결과가 있는 경우
-            if not hospital_joined.empty:
-                dong_code = hospital_joined.iloc[0].get("ADM_CD")
-                dong_name = hospital_joined.iloc[0].get("ADM_NM")
-                hospital.dong_code = dong_code
-                hospital.dong_name = dong_name
-                
-                # 부산시인지 확인 (ADM_CD가 26으로 시작하면 부산)
-                if dong_code and str(dong_code).startswith("26"):
-                    is_busan_dong = True
+            # 2) 공간조인으로 부산 ADM_CD가 있는 경우 (ADM_CD가 26으로 시작하면 부산)
+            is_busan_dong = bool(hospital.dong_code) and str(hospital.dong_code).startswith("26")
             
             # 주소에 부산이 포함되거나 공간조인으로 부산 동으로 확인되면 포함
             if is_busan_address or is_busan_dong:
@@ -104,20 +130,50 @@ class CollectVetHospitalsUseCase:
         for i, h in enumerate(busan_hospitals[:10]):
             print(f"{i+1}. {h.name}: {h.address} (동코드: {h.dong_code}, 동명: {h.dong_name})")
         
-        # 7. 레포지토리에 저장 (부산만)
+        if incremental:
+            self.last_diff = diff_places(
+                {h.id: self._hospital_to_place(h) for h in previous.values()},
+                {h.id: self._hospital_to_place(h) for h in busan_hospitals}
+            )
+            print(f"\n=== 이전 수집 대비 변경 내역: {self.last_diff.summary()} ====")
+        
+        # 8. 레포지토리에 저장 (부산만)
         self.vet_hospital_repository.save_hospitals(busan_hospitals)
         return busan_hospitals
     
-    def _hospital_to_dict(self, hospital: VetHospital) -> Dict[str, Any]:
-        """VetHospital 객체를 딕셔너리로 변환"""
+    def _reuse_dong_info(self, hospitals: List[VetHospital], previous: Dict[str, VetHospital]) -> List[VetHospital]:
+        """
+        위치가 바뀌지 않은 병원에 이전 행정동 정보 재사용
+        
+        Args:
+            hospitals: 새로 수집한 병원 목록
+            previous: 이전에 저장된 {병원 ID: 병원}
+        
+        Returns:
+            공간 조인이 필요한 병원 목록 (추가되었거나 이동한 병원)
+        """
+        to_join = []
+        for hospital in hospitals:
+            before = previous.get(hospital.id)
+            if (before is not None and before.dong_code
+                    and abs(before.latitude - hospital.latitude) <= 1e-7
+                    and abs(before.longitude - hospital.longitude) <= 1e-7):
+                hospital.dong_code = before.dong_code
+                hospital.dong_name = before.dong_name
+            else:
+                to_join.append(hospital)
+        print(f"\n=== 행정동 정보 재사용: {len(hospitals) - len(to_join)}개, 공간조인 대상: {len(to_join)}개 ====")
+        return to_join
+    
+    @staticmethod
+    def _hospital_to_place(hospital: VetHospital) -> Dict[str, Any]:
+        """변경 내역 비교용 장소 딕셔너리 (카카오 장소와 같은 x/y 좌표 키)"""
         return {
             "id": hospital.id,
-            "name": hospital.name,
-            "address": hospital.address,
-            "latitude": hospital.latitude,
-            "longitude": hospital.longitude,
-            "phone": hospital.phone,
-            "place_url": hospital.place_url,
+            "place_name": hospital.name,
+            "address_name": hospital.address,
+            "x": hospital.longitude,
+            "y": hospital.latitude,
             "dong_code": hospital.dong_code,
             "dong_name": hospital.dong_name
         }
@@ -0,0 +1,44 @@
+"""
+공간조인 결과를 동물병원 객체에 반영하는 헬퍼
+"""
+from typing import Any, Dict, List
+
+import pandas as pd
+
+from src.domain.entity import VetHospital
+
+
+def _column_to_dict(frame: pd.DataFrame, column: str) -> Dict[Any, Any]:
+    """조인 결과 컬럼을 {병원 ID: 값} 딕셔너리로 변환 (결측값은 None)"""
+    if column not in frame.columns:
+        return {}
+    values = frame[column].astype(object)
+    values = values.where(values.notna(), None)
+    return dict(zip(frame.index, values))
+
+
+def assign_dong_info(hospitals: List[VetHospital], joined: pd.DataFrame) -> None:
+    """
+    공간조인 결과의 행정동 코드/이름을 병원 객체에 할당
+
+    조인 결과를 병원 ID로 한 번만 인덱싱한 뒤 병원 목록을 순회하므로
+    병원 수에 대해 선형 시간에 처리됩니다. 같은 ID의 조인 결과가 여러 개인 경우
+    (경계가 겹치는 행정동) 첫 번째 결과를 사용합니다.
+
+    Args:
+        hospitals: 행정동 정보를 할당할 동물병원 목록
+        joined: spatial_join_hospitals()의 결과 (id, ADM_CD, ADM_NM 컬럼)
+    """
+    if joined is None or len(joined) == 0 or "id" not in joined.columns:
+        return
+
+    first_rows = joined.drop_duplicates(subset="id", keep="first").set_index("id")
+    matched_ids = set(first_rows.index)
+    codes = _column_to_dict(first_rows, "ADM_CD")
+    names = _column_to_dict(first_rows, "ADM_NM")
+
+    for hospital in hospitals:
+        if hospital.id not in matched_ids:
+            continue
+        hospital.dong_code = codes.get(hospital.id)
+        hospital.dong_name = names.get(hospital.id)
@@ -2,15 +2,155 @@
 동물병원 데이터 시각화 유즈케이스
 """
 import os
+import matplotlib
 import matplotlib.pyplot as plt
-import geopandas as gpd
-import pandas as pd
 import numpy as np
-from typing import Dict, Optional, Tuple, List
-import matplotlib.cm as cm
-from matplotlib.colors import Normalize
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple, List
 
+from src.domain.entity import VetHospital
 from src.domain.repository import VetHospitalRepository, AdministrativeDongRepository
+from src.infrastructure.basemap import Basemap, get_basemap
+
+# 지도 저장 해상도
+MAP_DPI = 300
+
+# 한글 폰트 설정 (메인 프로세스와 렌더링 워커 프로세스에 동일하게 적용)
+RC_PARAMS = {
+    'font.family': 'AppleGothic',  # Mac OS용
+    'axes.unicode_minus': False,
+}
+
+
+def _init_render_worker(rc_params: Dict[str, Any]) -> None:
+    """렌더링 워커 프로세스 초기화 (화면 없는 Agg 백엔드 + 폰트 설정)"""
+    matplotlib.use("Agg")
+    plt.rcParams.update(rc_params)
+
+
+def render_choropleth_map(basemap: Basemap,
+                          values: np.ndarray,
+                          title: str,
+                          figsize: Tuple[int, int],
+                          save_path: str) -> List[str]:
+    """
+    basemap의 캐시된 경계 Path에 행정동별 값을 색으로 입혀 choropleth 지도를 그려 저장
+    
+    Args:
+        basemap: 행정동 경계 basemap
+        values: basemap 폴리곤 순서의 동물병원 수
+    
+    Returns:
+        저장한 파일 경로 목록
+    """
+    fig, ax = plt.subplots(figsize=figsize)
+    
+    # Choropleth 맵 그리기 (출력 해상도에 맞게 단순화된 경계 재사용)
+    collection = basemap.collection(
+        basemap.tolerance_for(figsize[0] * MAP_DPI),
+        array=np.asarray(values, dtype=np.float64),
+        cmap='YlOrRd',
+        edgecolor='black',
+        linewidth=0.3
+    )
+    ax.add_collection(collection)
+    basemap.set_extent(ax)
+    fig.colorbar(collection, ax=ax, label='동물병원 수')
+    
+    # 제목 설정 및 축 제거
+    ax.set_title(title, fontsize=16)
+    ax.set_axis_off()
+    
+    fig.savefig(save_path, dpi=MAP_DPI, bbox_inches='tight')
+    plt.close(fig)
+    return [save_path]
+
+
+def render_point_map(basemap: Basemap,
+                     longitudes: np.ndarray,
+                     latitudes: np.ndarray,
+                     title: str,
+                     figsize: Tuple[int, int],
+                     save_path: str) -> List[str]:
+    """
+    캐시된 행정동 경계 배경 위에 동물병원 위치 점만 그려 저장
+    
+    Args:
+        basemap: 행정동 경계 basemap
+        longitudes: 동물병원 경도 배열
+        latitudes: 동물병원 위도 배열
+    
+    Returns:
+        저장한 파일 경로 목록
+    """
+    fig, ax = plt.subplots(figsize=figsize)
+    
+    # 행정동 경계 배경 (경계 버전/해상도별로 한 번만 렌더링한 래스터)
+    basemap.draw(ax, MAP_DPI, facecolor='lightgray', edgecolor='black', linewidth=0.3, alpha=0.5)
+    
+    # 동물병원 위치 점 그리기
+    ax.scatter(longitudes, latitudes, color='red', s=20, marker='o', alpha=0.7, zorder=2)
+    
+    # 제목 설정 및 축 제거
+    ax.set_title(title, fontsize=16)
+    ax.set_axis_off()
+    
+    fig.savefig(save_path, dpi=MAP_DPI, bbox_inches='tight')
+    plt.close(fig)
+    return [save_path]
+
+
+def render_top_dongs_bar_chart(top_dongs: pd.DataFrame,
+                               title: str,
+                               figsize: Tuple[int, int],
+                               save_path: str,
+                               svg: bool = True) -> List[str]:
+    """
+    상위 행정동 막대 그래프를 한 번 그려 PNG와 SVG(웹 표시용)로 저장
+    
+    Returns:
+        저장한 파일 경로 목록 (PNG, SVG 순서)
+    """
+    fig, ax = plt.subplots(figsize=figsize)
+    
+    # 막대 그래프 그리기
+    bars = ax.bar(top_dongs['dong_name'], top_dongs['count'], color='skyblue')
+    
+    # 막대 위에 값 표시
+    for bar in bars:
+        height = bar.get_height()
+        ax.text(
+            bar.get_x() + bar.get_width() / 2.,
+            height + 0.1,
+            f'{int(height)}',
+            ha='center',
+            va='bottom',
+            fontsize=12
+        )
+    
+    # 제목 및 레이블 설정
+    ax.set_title(title, fontsize=16)
+    ax.set_xlabel('행정동', fontsize=12)
+    ax.set_ylabel('동물병원 수', fontsize=12)
+    
+    # 격자 추가 및 여백 조정
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+    fig.tight_layout()
+    
+    # 같은 그림을 두 형식으로 저장
+    fig.savefig(save_path, dpi=MAP_DPI, bbox_inches='tight')
+    saved = [save_path]
+    if svg:
+        svg_path = os.path.splitext(save_path)[0] + ".svg"
+        fig.savefig(svg_path, format='svg')
+        saved.append(svg_path)
+    plt.close(fig)
+    return saved
+
+
+# (렌더링 함수, 인자) 작업 단위
+RenderJob = Tuple[Callable[..., List[str]], Dict[str, Any]]
 
 
 class VisualizeVetHospitalsUseCase:
@@ -38,8 +178,7 @@ class VisualizeVetHospitalsUseCase:
         os.makedirs(output_dir, exist_ok=True)
         
         # 한글 폰트 설정
-        plt.rcParams['font.family'] = 'AppleGothic'  # Mac OS용
-        plt.rcParams['axes.unicode_minus'] = False
+        plt.rcParams.update(RC_PARAMS)
     
     def create_choropleth_map(self, 
                              title: str = "부산시 행정동별 동물병원 분포",
@@ -53,41 +192,8 @@ class VisualizeVetHospitalsUseCase:
             figsize: 그림 크기
             save_path: 저장 경로 (없으면 기본 경로에 저장)
         """
-        # 행정동 GeoDataFrame 가져오기
-        dongs_gdf = self.dong_repository.get_dongs_geodataframe()
-        
-        # 행정동별 동물병원 개수 가져오기
-        hospital_counts = self.vet_hospital_repository.get_hospitals_count_by_dong()
-        
-        # 행정동 GeoDataFrame에 동물병원 개수 추가
-        dongs_gdf['vet_count'] = dongs_gdf['ADM_CD'].map(hospital_counts).fillna(0)
-        
-        # 그림 생성
-        fig, ax = plt.subplots(figsize=figsize)
-        
-        # Choropleth 맵 그리기
-        dongs_gdf.plot(
-            column='vet_count',
-            ax=ax,
-            legend=True,
-            cmap='YlOrRd',
-            edgecolor='black',
-            linewidth=0.3,
-            legend_kwds={'label': '동물병원 수'}
-        )
-        
-        # 제목 설정
-        ax.set_title(title, fontsize=16)
-        
-        # 축 제거
-        ax.set_axis_off()
-        
-        # 파일 저장
-        if save_path is None:
-            save_path = os.path.join(self.output_dir, "vet_hospitals_choropleth.png")
-        
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        render, kwargs = self._choropleth_job(title, figsize, save_path)
+        render(**kwargs)
     
     def create_point_map(self, 
                         title: str = "부산시 동물병원 위치",
@@ -101,61 +207,8 @@ class VisualizeVetHospitalsUseCase:
             figsize: 그림 크기
             save_path: 저장 경로 (없으면 기본 경로에 저장)
         """
-        # 행정동 GeoDataFrame 가져오기
-        dongs_gdf = self.dong_repository.get_dongs_geodataframe()
-        
-        # 동물병원 목록 가져오기
-        hospitals = self.vet_hospital_repository.get_hospitals()
-        
-        # 동물병원 GeoDataFrame 생성
-        hospitals_df = pd.DataFrame([{
-            'name': h.name,
-            'address': h.address,
-            'latitude': h.latitude,
-            'longitude': h.longitude,
-            'dong_code': h.dong_code,
-            'dong_name': h.dong_name
-        } for h in hospitals])
-        
-        hospitals_gdf = gpd.GeoDataFrame(
-            hospitals_df,
-            geometry=gpd.points_from_xy(hospitals_df.longitude, hospitals_df.latitude),
-            crs=dongs_gdf.crs
-        )
-        
-        # 그림 생성
-        fig, ax = plt.subplots(figsize=figsize)
-        
-        # 행정동 경계 그리기
-        dongs_gdf.plot(
-            ax=ax,
-            color='lightgray',
-            edgecolor='black',
-            linewidth=0.3,
-            alpha=0.5
-        )
-        
-        # 동물병원 위치 점 그리기
-        hospitals_gdf.plot(
-            ax=ax,
-            color='red',
-            markersize=20,
-            marker='o',
-            alpha=0.7
-        )
-        
-        # 제목 설정
-        ax.set_title(title, fontsize=16)
-        
-        # 축 제거
-        ax.set_axis_off()
-        
-        # 파일 저장
-        if save_path is None:
-            save_path = os.path.join(self.output_dir, "vet_hospitals_points.png")
-        
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        render, kwargs = self._point_map_job(title, figsize, save_path)
+        render(**kwargs)
     
     def create_top_dongs_bar_chart(self, 
                                   top_n: int = 5,
@@ -163,7 +216,7 @@ class VisualizeVetHospitalsUseCase:
                                   figsize: Tuple[int, int] = (10, 6),
                                   save_path: Optional[str] = None) -> None:
         """
-        동물병원 수 상위 행정동 막대 그래프 생성
+        동물병원 수 상위 행정동 막대 그래프 생성 (한 번 그려 PNG와 SVG로 저장)
         
         Args:
             top_n: 상위 개수
@@ -171,105 +224,98 @@ class VisualizeVetHospitalsUseCase:
             figsize: 그림 크기
             save_path: 저장 경로 (없으면 기본 경로에 저장)
         """
-        # 행정동별 동물병원 개수 가져오기
-        hospital_counts = self.vet_hospital_repository.get_hospitals_count_by_dong()
-        
-        # 행정동 정보 가져오기
-        dongs = {dong.code: dong.name for dong in self.dong_repository.get_all_dongs()}
-        
-        # 데이터프레임 생성
-        df = pd.DataFrame([
-            {'dong_code': code, 'dong_name': dongs.get(code, code), 'count': count}
-            for code, count in hospital_counts.items()
-        ])
-        
-        # 동물병원 수 기준 정렬 및 상위 N개 선택
-        top_dongs = df.sort_values('count', ascending=False).head(top_n)
-        
-        # 그림 생성
-        fig, ax = plt.subplots(figsize=figsize)
-        
-        # 막대 그래프 그리기
-        bars = ax.bar(top_dongs['dong_name'], top_dongs['count'], color='skyblue')
-        
-        # 막대 위에 값 표시
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(
-                bar.get_x() + bar.get_width() / 2.,
-                height + 0.1,
-                f'{int(height)}',
-                ha='center',
-                va='bottom',
-                fontsize=12
-            )
+        render, kwargs = self._bar_chart_job(top_n, title, figsize, save_path)
+        render(**kwargs)
+    
+    def create_all_visualizations(self, parallel: bool = False, max_workers: Optional[int] = None) -> List[str]:
+        """
+        모든 시각화 생성
         
-        # 제목 및 레이블 설정
-        ax.set_title(title, fontsize=16)
-        ax.set_xlabel('행정동', fontsize=12)
-        ax.set_ylabel('동물병원 수', fontsize=12)
+        그림에 필요한 데이터는 레포지토리에서 한 번 모은 뒤, parallel이면 그림마다
+        Agg 백엔드를 쓰는 프로세스 풀에 나눠 동시에 렌더링합니다.
         
-        # 격자 추가
-        ax.grid(axis='y', linestyle='--', alpha=0.7)
+        Args:
+            parallel: 프로세스 풀에서 그림을 동시에 렌더링할지 여부
+            max_workers: 렌더링 프로세스 수 (없으면 그림 수)
         
-        # 여백 조정
-        plt.tight_layout()
+        Returns:
+            생성된 파일 경로 목록
+        """
+        jobs: List[RenderJob] = [
+            self._choropleth_job(),
+            self._point_map_job(),
+            self._bar_chart_job(),
+        ]
+        
+        if not parallel:
+            results = [render(**kwargs) for render, kwargs in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers or len(jobs),
+                                     initializer=_init_render_worker,
+                                     initargs=(RC_PARAMS,)) as executor:
+                futures = [executor.submit(render, **kwargs) for render, kwargs in jobs]
+                results = [future.result() for future in futures]
+        
+        return [path for saved in results for path in saved]
+    
+    def _choropleth_job(self,
+                        title: str = "부산시 행정동별 동물병원 분포",
+                        figsize: Tuple[int, int] = (12, 10),
+                        save_path: Optional[str] = None) -> RenderJob:
+        """choropleth 지도 렌더링 작업 (행정동 순서의 동물병원 개수 포함)"""
+        dongs_gdf = self.dong_repository.get_dongs_geodataframe()
+        hospital_counts = self.vet_hospital_repository.get_hospitals_count_by_dong()
+        values = dongs_gdf['ADM_CD'].map(hospital_counts).fillna(0).to_numpy(dtype=np.float64)
         
-        # 파일 저장
         if save_path is None:
-            save_path = os.path.join(self.output_dir, "top_dongs_bar_chart.png")
-        
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        # SVG 형식으로도 저장 (웹 표시용)
-        svg_path = os.path.splitext(save_path)[0] + ".svg"
-        plt.figure(figsize=figsize)
-        bars = plt.bar(top_dongs['dong_name'], top_dongs['count'], color='skyblue')
-        
-        # 막대 위에 값 표시
-        for bar in bars:
-            height = bar.get_height()
-            plt.text(
-                bar.get_x() + bar.get_width() / 2.,
-                height + 0.1,
-                f'{int(height)}',
-                ha='center',
-                va='bottom',
-                fontsize=12
-            )
+            save_path = os.path.join(self.output_dir, "vet_hospitals_choropleth.png")
+        return render_choropleth_map, dict(basemap=self._basemap(figsize), values=values,
+                                           title=title, figsize=figsize, save_path=save_path)
+    
+    def _point_map_job(self,
+                       title: str = "부산시 동물병원 위치",
+                       figsize: Tuple[int, int] = (12, 10),
+                       save_path: Optional[str] = None) -> RenderJob:
+        """점 지도 렌더링 작업 (동물병원 경위도 배열 포함)"""
+        # 동물병원 목록을 열 단위로 한 번에 변환
+        columns = VetHospital.to_columns(self.vet_hospital_repository.get_hospitals())
         
-        plt.title(title, fontsize=16)
-        plt.xlabel('행정동', fontsize=12)
-        plt.ylabel('동물병원 수', fontsize=12)
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-        plt.tight_layout()
-        plt.savefig(svg_path, format='svg')
-        plt.close()
+        if save_path is None:
+            save_path = os.path.join(self.output_dir, "vet_hospitals_points.png")
+        return render_point_map, dict(basemap=self._basemap(figsize), longitudes=columns['longitude'],
+                                      latitudes=columns['latitude'], title=title, figsize=figsize,
+                                      save_path=save_path)
     
-    def create_all_visualizations(self) -> List[str]:
+    def _basemap(self, figsize: Tuple[int, int]) -> Basemap:
         """
-        모든 시각화 생성
+        행정동 경계 버전별로 공유되는 basemap
         
-        Returns:
-            생성된 파일 경로 목록
+        렌더링 프로세스에 보내기 전에 출력 해상도의 경계 Path를 미리 변환해 두므로
+        여러 지도(및 워커)가 같은 변환 결과를 재사용합니다.
         """
-        output_files = []
-        
-        # Choropleth 지도
-        choropleth_path = os.path.join(self.output_dir, "vet_hospitals_choropleth.png")
-        self.create_choropleth_map(save_path=choropleth_path)
-        output_files.append(choropleth_path)
+        basemap = get_basemap(self.dong_repository.get_dongs_geodataframe())
+        basemap.paths(basemap.tolerance_for(figsize[0] * MAP_DPI))
+        return basemap
+    
+    def _bar_chart_job(self,
+                       top_n: int = 5,
+                       title: str = "동물병원 수 상위 행정동",
+                       figsize: Tuple[int, int] = (10, 6),
+                       save_path: Optional[str] = None) -> RenderJob:
+        """상위 행정동 막대 그래프 렌더링 작업 (상위 N개 행정동 표 포함)"""
+        # 행정동별 동물병원 개수 및 행정동 이름
+        hospital_counts = self.vet_hospital_repository.get_hospitals_count_by_dong()
+        dongs = {dong.code: dong.name for dong in self.dong_repository.get_all_dongs()}
         
-        # 점 지도
-        point_map_path = os.path.join(self.output_dir, "vet_hospitals_points.png")
-        self.create_point_map(save_path=point_map_path)
-        output_files.append(point_map_path)
+        df = pd.DataFrame({
+            'dong_code': list(hospital_counts.keys()),
+            'dong_name': [dongs.get(code, code) for code in hospital_counts],
+            'count': list(hospital_counts.values()),
+        })
         
-        # 상위 행정동 막대 그래프
-        bar_chart_path = os.path.join(self.output_dir, "top_dongs_bar_chart.png")
-        self.create_top_dongs_bar_chart(save_path=bar_chart_path)
-        output_files.append(bar_chart_path)
-        output_files.append(os.path.splitext(bar_chart_path)[0] + ".svg")
+        # 동물병원 수 기준 정렬 및 상위 N개 선택
+        top_dongs = df.sort_values('count', ascending=False).head(top_n)
         
-        return output_files
+        if save_path is None:
+            save_path = os.path.join(self.output_dir, "top_dongs_bar_chart.png")
+        return render_top_dongs_bar_chart, dict(top_dongs=top_dongs, title=title, figsize=figsize, save_path=save_path)
@@ -0,0 +1,63 @@
+"""
+행정동 경계 basemap 캐시 테스트
+"""
+import pickle
+
+import geopandas as gpd
+import numpy as np
+from shapely.geometry import MultiPolygon, Polygon, box
+
+from src.infrastructure.basemap import Basemap, get_basemap
+
+
+def _dongs_gdf():
+    donut = Polygon([(0, 0), (1, 0), (1, 1), (0, 1)], holes=[[(0.4, 0.4), (0.6, 0.4), (0.6, 0.6), (0.4, 0.6)]])
+    return gpd.GeoDataFrame(
+        {"ADM_CD": ["1", "2"]},
+        geometry=[donut, MultiPolygon([box(1, 0, 2, 1), box(2, 0, 3, 1)])],
+        crs="EPSG:4326"
+    )
+
+
+class TestBasemap:
+    """basemap 캐시 테스트 클래스"""
+    
+    def test_shared_per_boundary_version(self):
+        """같은 경계는 같은 basemap을, 바뀐 경계는 새 basemap을 반환하는지 테스트"""
+        first = get_basemap(_dongs_gdf())
+        
+        assert get_basemap(_dongs_gdf()) is first
+        changed = _dongs_gdf()
+        changed.geometry.values[1] = box(1, 0, 2, 2)
+        assert get_basemap(changed) is not first
+    
+    def test_paths_keep_holes_and_parts(self):
+        """구멍과 여러 조각을 하나의 compound Path로 변환하고 재사용하는지 테스트"""
+        basemap = Basemap(_dongs_gdf().geometry.values)
+        
+        paths = basemap.paths()
+        
+        assert basemap.paths() is paths
+        assert len(paths[0].to_polygons()) == 2
+        assert len(paths[1].to_polygons()) == 2
+        assert basemap.bounds == (0.0, 0.0, 3.0, 1.0)
+        
+        # 구멍은 채우지 않고 투명하게 남김
+        image = Basemap(_dongs_gdf().geometry.values, geographic=False).raster(
+            300, dpi=100, edgecolor='none', alpha=1.0
+        )
+        assert image[50, 50, 3] == 0
+        assert image[50, 20, 3] == 255
+        assert image[50, 250, 3] == 255
+    
+    def test_raster_cached_and_picklable(self):
+        """래스터를 한 번만 렌더링하고, 피클 시 Path만 유지하는지 테스트"""
+        basemap = Basemap(_dongs_gdf().geometry.values, geographic=False)
+        
+        image = basemap.raster(300, dpi=100)
+        
+        assert image.shape == (100, 300, 4) and image.dtype == np.uint8
+        assert basemap.raster(300, dpi=100) is image
+        restored = pickle.loads(pickle.dumps(basemap))
+        assert restored._rasters == {}
+        assert len(restored.paths(basemap.tolerance_for(300))) == 2
@@ -0,0 +1,77 @@
+"""
+줌 레벨별 행정동 경계 단순화 테스트
+"""
+import json
+import os
+
+import numpy as np
+import pytest
+import shapely
+from shapely.geometry import Polygon, mapping, shape
+
+from src.infrastructure.boundaries import prepare_boundaries, select_boundary, simplify_coverage, simplify_geojson
+
+
+def _dense_geojson():
+    """구불구불한 경계를 공유하는 두 행정동 (꼭짓점이 촘촘한 원본 해상도 데이터 흉내)"""
+    ys = np.linspace(35.0, 35.2, 2001)
+    border = [(129.1 + 0.002 * np.sin(y * 900) + 1e-7 * i, y) for i, y in enumerate(ys)]
+    left = Polygon([(129.0, 35.0)] + border + [(129.0, 35.2)])
+    right = Polygon(border + [(129.2, 35.2), (129.2, 35.0)])
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {"type": "Feature", "properties": {"ADM_CD": "1", "ADM_NM": "A동"}, "geometry": mapping(left)},
+            {"type": "Feature", "properties": {"ADM_CD": "2", "ADM_NM": "B동"}, "geometry": mapping(right)},
+        ]
+    }
+
+
+class TestBoundaries:
+    """경계 단순화 테스트 클래스"""
+    
+    def test_simplify_keeps_shared_border(self):
+        """단순화 후에도 이웃 행정동 사이에 틈이나 겹침이 없는지 테스트"""
+        simplified = simplify_geojson(_dense_geojson(), zoom=11)
+        
+        geometries = [shape(feature["geometry"]) for feature in simplified["features"]]
+        union = shapely.union_all(geometries)
+        assert [f["properties"]["ADM_NM"] for f in simplified["features"]] == ["A동", "B동"]
+        assert union.geom_type == "Polygon" and len(union.interiors) == 0
+        assert abs(union.area - sum(g.area for g in geometries)) < 1e-12
+        assert sum(len(g.exterior.coords) for g in geometries) < 1000
+    
+    def test_simplify_coverage_requires_shapely_21(self, monkeypatch):
+        """공유 경계 단순화를 지원하지 않는 shapely에서는 조용히 폴리곤별 단순화로 바꾸지 않는지 테스트"""
+        monkeypatch.delattr(shapely, "coverage_simplify")
+        with pytest.raises(ImportError):
+            simplify_coverage([Polygon([(0, 0), (1, 0), (1, 1)])], 0.1)
+    
+    def test_simplify_coverage_invalid_coverage_fallback(self):
+        """겹치는 폴리곤처럼 올바른 coverage가 아니면 폴리곤별로 단순화하는지 테스트"""
+        overlapping = [Polygon([(0, 0), (2, 0), (2, 2), (0, 2)]), Polygon([(1, 1), (3, 1), (3, 3), (1, 3)])]
+        simplified = simplify_coverage(overlapping, 0.1)
+        assert [g.equals(o) for g, o in zip(simplified, overlapping)] == [True, True]
+    
+    def test_prepare_boundaries_payload_and_reuse(self, tmp_path):
+        """원본보다 5배 이상 작은 파일을 만들고, 원본이 그대로면 다시 만들지 않는지 테스트"""
+        source = tmp_path / "emd.geojson"
+        source.write_text(json.dumps(_dense_geojson(), ensure_ascii=False, indent=2), encoding="utf-8")
+        
+        paths = prepare_boundaries(str(source), str(tmp_path / "out"), zooms=(9, 13))
+        mtimes = {zoom: os.stat(path).st_mtime_ns for zoom, path in paths.items()}
+        
+        assert set(paths) == {9, 13}
+        assert os.path.getsize(paths[13]) * 5 < os.path.getsize(source)
+        assert os.path.getsize(paths[9]) <= os.path.getsize(paths[13])
+        assert prepare_boundaries(str(source), str(tmp_path / "out"), zooms=(9, 13)) == paths
+        assert {zoom: os.stat(path).st_mtime_ns for zoom, path in paths.items()} == mtimes
+    
+    def test_select_boundary(self):
+        """지도 줌 이상으로 단순화된 파일 중 가장 거친 파일을 고르는지 테스트"""
+        paths = {9: "z9", 11: "z11", 13: "z13"}
+        
+        assert select_boundary(paths, 10) == "z11"
+        assert select_boundary(paths, 11) == "z11"
+        assert select_boundary(paths, 15) == "z13"
+        assert select_boundary({}, 11) is None
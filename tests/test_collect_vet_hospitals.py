@@ -1,6 +1,7 @@
 """
 동물병원 수집 및 가공 유즈케이스 테스트
 """
+import numpy as np
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import geopandas as gpd
@@ -10,7 +11,9 @@ from shapely.geometry import Point, Polygon
 from src.domain.entity import VetHospital, AdministrativeDong
 from src.domain.repository import VetHospitalRepository, AdministrativeDongRepository
 from src.infrastructure.kakao_api import KakaoMapAPI
+from src.infrastructure.place_snapshot import PlaceSnapshot
 from src.usecase.collect_vet_hospitals import CollectVetHospitalsUseCase
+from src.usecase.dong_assignment import assign_dong_info
 
 
 class TestCollectVetHospitalsUseCase:
@@ -131,3 +134,119 @@ class TestCollectVetHospitalsUseCase:
         self.mock_kakao_api.collect_vet_hospitals.assert_called_once_with(city="부산")
         self.mock_dong_repo.spatial_join_hospitals.assert_called_once()
         self.mock_vet_repo.save_hospitals.assert_called_once_with(self.test_hospitals)
+
+    
+    def test_execute_incremental_joins_only_changed(self, tmp_path):
+        """증분 모드에서 위치가 같은 병원은 행정동 정보를 재사용하고 변경 내역을 기록하는지 테스트"""
+        previous = VetHospital(
+            id="12345678", name="행복한동물병원", address="부산광역시 중구 중앙동 123-45",
+            latitude=35.105, longitude=129.025, dong_code="2611010100", dong_name="중앙동"
+        )
+        removed = VetHospital(
+            id="11111111", name="폐업동물병원", address="부산광역시 중구 대청동 1-1",
+            latitude=35.1, longitude=129.03, dong_code="2611010300", dong_name="대청동"
+        )
+        self.mock_vet_repo.get_hospitals.return_value = [previous, removed]
+        self.mock_dong_repo = Mock()  # spatial_join_hospitals는 ShapefileRepository 구현에만 있음
+        documents = [{"id": h.id, "place_name": h.name, "address_name": h.address,
+                      "x": str(h.longitude), "y": str(h.latitude)} for h in self.test_hospitals]
+        self.mock_kakao_api.search_keywords_incrementally.return_value = (
+            self.test_hospitals, {"부산 동물병원": (2, documents)}
+        )
+        self.mock_dong_repo.spatial_join_hospitals.return_value = self.mock_joined_gdf.iloc[[1]]
+        snapshot_path = tmp_path / "vet.snapshot.json"
+        PlaceSnapshot(tiles={"부산 동물병원": {"total_count": 1, "ids": ["12345678"]}},
+                      places={"12345678": documents[0]}).save(str(snapshot_path))
+        
+        usecase = CollectVetHospitalsUseCase(
+            vet_hospital_repository=self.mock_vet_repo,
+            dong_repository=self.mock_dong_repo,
+            kakao_api=self.mock_kakao_api,
+            snapshot_path=str(snapshot_path)
+        )
+        result = usecase.execute(city="부산", incremental=True)
+        
+        # 키워드별 전체 페이지 대신 스냅샷의 total_count를 넘겨 증분 조회하고 스냅샷 갱신
+        self.mock_kakao_api.search_direct_keyword.assert_not_called()
+        keywords, known_tiles = self.mock_kakao_api.search_keywords_incrementally.call_args[0]
+        assert len(keywords) == 5
+        assert known_tiles["부산 동물병원"][0] == 1
+        assert PlaceSnapshot.load(str(snapshot_path)).tiles["부산 동물병원"]["ids"] == ["12345678", "87654321"]
+        
+        # 추가된 병원만 공간 조인
+        joined_input = self.mock_dong_repo.spatial_join_hospitals.call_args[0][0]
+        assert list(joined_input.ids) == ["87654321"]
+        assert [(h.dong_code, h.dong_name) for h in result] == [
+            ("2611010100", "중앙동"), ("2611010200", "동광동")
+        ]
+        assert [p["id"] for p in usecase.last_diff.added] == ["87654321"]
+        assert [p["id"] for p in usecase.last_diff.removed] == ["11111111"]
+        assert usecase.last_diff.moved == []
+
+
+class TestAssignDongInfo:
+    """공간조인 결과 반영 헬퍼 테스트 클래스"""
+    
+    def test_assign_dong_info(self):
+        """병원 ID 기준 행정동 정보 할당 테스트"""
+        hospitals = [
+            VetHospital(id="1", name="가", address="부산", latitude=35.1, longitude=129.0),
+            VetHospital(id="2", name="나", address="부산", latitude=35.1, longitude=129.0),
+            VetHospital(id="3", name="다", address="부산", latitude=35.1, longitude=129.0)
+        ]
+        joined = pd.DataFrame({
+            'id': ['2', '1', '1', '3'],
+            'ADM_CD': [None, '2611010100', '2611010200', float('nan')],
+            'ADM_NM': [None, '중앙동', '동광동', float('nan')]
+        })
+        
+        assign_dong_info(hospitals, joined)
+        
+        # 같은 ID의 조인 결과가 여러 개면 첫 번째 결과 사용
+        assert hospitals[0].dong_code == "2611010100"
+        assert hospitals[0].dong_name == "중앙동"
+        
+        # 매칭되지 않은 결과(NaN 포함)는 None
+        assert hospitals[1].dong_code is None
+        assert hospitals[2].dong_code is None
+        assert hospitals[2].dong_name is None
+
+
+class TestVetHospitalBatch:
+    """동물병원 엔티티 일괄 생성/변환 테스트 클래스"""
+    
+    def test_slotted(self):
+        """__slots__ 사용으로 인스턴스 __dict__가 없는지 테스트"""
+        hospital = VetHospital(id="1", name="병원", address="부산", latitude=35.1, longitude=129.1)
+        assert not hasattr(hospital, "__dict__")
+        with pytest.raises(AttributeError):
+            hospital.unknown = 1
+    
+    def test_from_kakao_documents(self):
+        """카카오 결과 일괄 생성이 단건 생성과 같은지 테스트"""
+        documents = [
+            {"id": "1", "place_name": "병원1", "address_name": "부산 중구", "x": "129.1", "y": "35.1",
+             "phone": "051-1", "place_url": "http://place.map.kakao.com/1"},
+            {"id": "2", "place_name": "병원2", "address_name": "부산 동구", "x": "129.2", "y": "35.2"}
+        ]
+        
+        assert VetHospital.from_kakao_documents(documents) == [
+            VetHospital.from_kakao_api_result(doc) for doc in documents
+        ]
+    
+    def test_records_columns_and_dataframe_round_trip(self):
+        """to_records/to_columns/from_dataframe 왕복 변환 테스트"""
+        hospitals = [
+            VetHospital(id="1", name="병원1", address="부산", latitude=35.1, longitude=129.1,
+                        dong_code="2611010100", dong_name="중앙동"),
+            VetHospital(id="2", name="병원2", address="부산", latitude=35.2, longitude=129.2)
+        ]
+        
+        records = VetHospital.to_records(hospitals)
+        columns = VetHospital.to_columns(hospitals)
+        
+        assert records == [h.to_dict() for h in hospitals]
+        assert list(columns) == list(VetHospital.FIELDS)
+        assert columns["latitude"].dtype == np.float64
+        assert VetHospital.from_dataframe(pd.DataFrame(columns)) == hospitals
+        assert [VetHospital.from_dict(r) for r in records] == hospitals
@@ -0,0 +1,46 @@
+"""
+좌표계 변환 모듈 테스트
+"""
+import numpy as np
+import pandas as pd
+from pyproj import Transformer
+
+from src.infrastructure.coordinates import (
+    EPSG5174_X_COLUMN, EPSG5174_Y_COLUMN, get_transformer, normalize_coordinate_columns, transform_coordinates
+)
+
+
+class TestCoordinates:
+    """좌표계 변환 테스트 클래스"""
+    
+    def test_transformer_is_cached(self):
+        """같은 좌표계 쌍은 같은 Transformer를 재사용하는지 테스트"""
+        assert get_transformer() is get_transformer("epsg:5174", "epsg:4326")
+    
+    def test_transform_matches_per_point(self):
+        """일괄 변환 결과가 점 단위 변환과 같은지 테스트"""
+        xs = np.array([385000.0, 390000.5, 395123.25])
+        ys = np.array([180000.0, 185000.0, 190500.75])
+        transformer = Transformer.from_crs("epsg:5174", "epsg:4326", always_xy=True)
+        
+        lngs, lats = transform_coordinates(xs, ys)
+        
+        assert lngs.dtype == np.float64 and lats.dtype == np.float64
+        for x, y, lng, lat in zip(xs, ys, lngs, lats):
+            assert (lng, lat) == transformer.transform(x, y)
+    
+    def test_normalize_coordinate_columns(self):
+        """결측/비숫자 좌표 행을 제외하고 경위도 열을 추가하는지 테스트"""
+        df = pd.DataFrame({
+            '사업장명': ['가', '나', '다', '라'],
+            EPSG5174_X_COLUMN: ['385000.0', None, '', 390000.0],
+            EPSG5174_Y_COLUMN: [180000.0, 180000.0, 180000.0, '185000.0']
+        })
+        
+        result = normalize_coordinate_columns(df)
+        
+        assert list(result['사업장명']) == ['가', '라']
+        assert result[EPSG5174_X_COLUMN].dtype == np.float64
+        assert result['lng'].dtype == np.float64 and result['lat'].dtype == np.float64
+        assert 128.5 < result['lng'].iloc[0] < 129.5 and 34.5 < result['lat'].iloc[0] < 35.5
+        assert len(df) == 4  # 원본은 변경하지 않음
@@ -0,0 +1,38 @@
+"""
+ETL 파이프라인 실행기 테스트
+"""
+from unittest.mock import MagicMock, patch
+
+from count_facilities_by_district import load_place_diff
+from src.infrastructure.place_snapshot import PlaceDiff
+from src.interface import etl_runner
+
+
+class TestRunApiEtlPipeline:
+    """API 기반 수집 파이프라인 테스트 클래스"""
+    
+    @patch('src.interface.etl_runner.KakaoMapAPI')
+    @patch('src.interface.etl_runner.CollectVetHospitalsUseCase')
+    def test_passes_collection_options(self, mock_usecase_cls, mock_api_cls):
+        """수집 옵션이 유즈케이스 실행까지 전달되는지 테스트"""
+        mock_usecase_cls.return_value.execute.return_value = []
+        
+        etl_runner.run_api_etl_pipeline("mock_shapefile_path.shp", context=MagicMock(),
+                                        concurrent=True, incremental=True)
+        
+        mock_usecase_cls.return_value.execute.assert_called_once_with(city="부산", concurrent=True, incremental=True)
+    
+    @patch('src.interface.etl_runner.KakaoMapAPI')
+    @patch('src.interface.etl_runner.CollectVetHospitalsUseCase')
+    def test_incremental_writes_diff_file(self, mock_usecase_cls, mock_api_cls, tmp_path):
+        """증분 수집 변경 내역을 count_facilities_by_district.py --apply-diff가 읽는 형식으로 저장하는지 테스트"""
+        added = {"id": "1", "place_name": "새동물병원", "x": 129.03, "y": 35.1}
+        mock_usecase_cls.return_value.execute.return_value = []
+        mock_usecase_cls.return_value.last_diff = PlaceDiff(added=[added])
+        context = MagicMock(output_dir=str(tmp_path))
+        
+        etl_runner.run_api_etl_pipeline("mock_shapefile_path.shp", context=context, incremental=True)
+        
+        diff = load_place_diff(str(tmp_path / "vet_hospitals_diff.json"))
+        assert diff.added == [added]
+        assert diff.removed == [] and diff.moved == []
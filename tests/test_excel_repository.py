@@ -0,0 +1,168 @@
+"""
+엑셀/CSV 동물병원 레포지토리 테스트
+"""
+import pandas as pd
+import pytest
+
+from src.infrastructure.excel_repository import ExcelRepository
+
+
+class TestExcelRepository:
+    """ExcelRepository 열 단위 변환 테스트 클래스"""
+    
+    def _write_csv(self, tmp_path, rows):
+        path = tmp_path / "hospitals.csv"
+        pd.DataFrame(rows).to_csv(path, index=False, encoding="utf-8")
+        return str(path)
+    
+    def test_load_hospitals_filters_city(self, tmp_path):
+        """주소 열 또는 시도 열로 도시를 걸러내고 행 순서를 유지하는지 테스트"""
+        path = self._write_csv(tmp_path, [
+            {"사업장명": "가병원", "소재지도로명주소": "부산광역시 해운대구 1", "시도": None,
+             "위도": 35.1, "경도": 129.1, "전화번호": "051-000-0000", "관리번호": "A-101"},
+            {"사업장명": "나병원", "소재지도로명주소": "서울특별시 강남구 2", "시도": None,
+             "위도": 37.5, "경도": 127.0, "전화번호": None, "관리번호": "A-102"},
+            {"사업장명": "다병원", "소재지도로명주소": "해운대로 3", "시도": "부산",
+             "위도": "abc", "경도": 129.2, "전화번호": None, "관리번호": None},
+        ])
+        
+        hospitals = ExcelRepository(path).load_hospitals("부산")
+        
+        assert [h.name for h in hospitals] == ["가병원", "다병원"]
+        first, second = hospitals
+        assert (first.id, first.latitude, first.longitude, first.phone) == ("A-101", 35.1, 129.1, "051-000-0000")
+        assert second.latitude is None and second.longitude == 129.2
+        assert second.phone == ""
+        assert second.id == str(hash("다병원_해운대로 3"))
+    
+    def test_coalesce_skips_missing_candidates(self, tmp_path):
+        """앞 후보 열이 비어 있으면 다음 후보 열 값을 사용하고 이름 없는 행은 제외하는지 테스트"""
+        path = self._write_csv(tmp_path, [
+            {"사업장명": None, "병원명": "라병원", "주소": None, "소재지지번주소": "부산 동래구 4"},
+            {"사업장명": None, "병원명": None, "주소": "부산 남구 5", "소재지지번주소": None},
+        ])
+        
+        hospitals = ExcelRepository(path).load_hospitals("부산")
+        
+        assert len(hospitals) == 1
+        assert (hospitals[0].name, hospitals[0].address) == ("라병원", "부산 동래구 4")
+    
+    def test_streaming_matches_full_load(self, tmp_path):
+        """청크 단위 스트리밍 로드 결과가 전체 로드와 같은지 테스트"""
+        rows = [
+            {"사업장명": f"병원{i}", "소재지도로명주소": f"{'부산' if i % 3 else '서울'} 중구 {i}",
+             "위도": 35.0 + i / 100, "경도": 129.0, "관리번호": f"A-{i}"}
+            for i in range(10)
+        ]
+        path = self._write_csv(tmp_path, rows)
+        
+        full = ExcelRepository(path).load_hospitals("부산")
+        streamed = list(ExcelRepository(path).iter_hospitals("부산", chunksize=3))
+        
+        assert [h.to_dict() for h in streamed] == [h.to_dict() for h in full]
+        assert len(streamed) == 6
+    
+    def _write_xlsx(self, path, rows):
+        openpyxl = pytest.importorskip("openpyxl")
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(["사업장명", "소재지도로명주소", "위도", "경도", "관리번호"])
+        for row in rows:
+            sheet.append(row)
+        workbook.save(path)
+        return str(path)
+    
+    XLSX_ROWS = [
+        ["가병원", "부산 해운대구 1", 35.1, 129.1, 101],
+        ["나병원", "서울 강남구 2", 37.5, 127.0, 102],
+        ["다병원", "부산 동래구 3", None, 129.2],
+    ]
+    XLSX_EXPECTED = [
+        ("가병원", "101", 35.1, 129.1),
+        ("다병원", str(hash("다병원_부산 동래구 3")), None, 129.2),
+    ]
+    
+    def test_streaming_xlsx_read_only(self, tmp_path):
+        """XLSX 파일을 openpyxl 행 반복으로 청크 단위 로드하는지 테스트"""
+        path = self._write_xlsx(tmp_path / "hospitals.xlsx", self.XLSX_ROWS)
+        
+        repository = ExcelRepository(path, chunksize=1, cache_dir=None)
+        hospitals = repository.load_hospitals("부산")
+        
+        assert [(h.name, h.id, h.latitude, h.longitude) for h in hospitals] == self.XLSX_EXPECTED
+    
+    @pytest.mark.parametrize("chunksize", [None, 1])
+    def test_xlsx_conversion_cache(self, tmp_path, monkeypatch, chunksize):
+        """엑셀을 한 번만 Parquet으로 변환하고 이후에는 캐시에서 읽는지 테스트"""
+        pytest.importorskip("pyarrow")
+        from src.infrastructure import excel_repository
+        path = self._write_xlsx(tmp_path / "hospitals.xlsx", self.XLSX_ROWS)
+        cache_dir = tmp_path / "cache"
+        
+        first = ExcelRepository(path, chunksize=chunksize, cache_dir=str(cache_dir)).load_hospitals("부산")
+        cached_files = list(cache_dir.glob("hospitals_*.parquet"))
+        assert len(cached_files) == 1
+        
+        # 캐시가 있으면 엑셀 파일을 다시 파싱하지 않음
+        def fail(*args, **kwargs):
+            raise AssertionError("엑셀 파일을 다시 읽었습니다.")
+        monkeypatch.setattr(excel_repository.openpyxl, "load_workbook", fail)
+        monkeypatch.setattr(excel_repository.pd, "read_excel", fail)
+        second = ExcelRepository(path, chunksize=chunksize, cache_dir=str(cache_dir)).load_hospitals("부산")
+        
+        assert [(h.name, h.id, h.latitude, h.longitude) for h in first] == self.XLSX_EXPECTED
+        assert [h.to_dict() for h in second] == [h.to_dict() for h in first]
+    
+    def test_xlsx_conversion_cache_invalidated(self, tmp_path):
+        """원본 파일 내용이 바뀌면 새로 변환하고 이전 캐시를 지우는지 테스트"""
+        pytest.importorskip("pyarrow")
+        path = self._write_xlsx(tmp_path / "hospitals.xlsx", self.XLSX_ROWS)
+        cache_dir = tmp_path / "cache"
+        ExcelRepository(path, cache_dir=str(cache_dir)).load_hospitals("부산")
+        old_cache = list(cache_dir.glob("hospitals_*.parquet"))
+        
+        self._write_xlsx(tmp_path / "hospitals.xlsx", self.XLSX_ROWS + [["라병원", "부산 북구 4", 35.2, 129.0, 104]])
+        hospitals = ExcelRepository(path, cache_dir=str(cache_dir)).load_hospitals("부산")
+        new_cache = list(cache_dir.glob("hospitals_*.parquet"))
+        
+        assert [h.name for h in hospitals] == ["가병원", "다병원", "라병원"]
+        assert len(new_cache) == 1 and new_cache != old_cache
+    
+    def test_streaming_and_full_load_use_same_dtypes(self, tmp_path):
+        """숫자처럼 보이는 ID가 전체 로드와 청크 로드에서 같은 문자열로 변환되는지 테스트"""
+        path = self._write_csv(tmp_path, [
+            {"사업장명": "가병원", "소재지도로명주소": "부산 중구 1", "위도": 35.1, "경도": 129.0, "관리번호": "007"},
+            {"사업장명": "나병원", "소재지도로명주소": "부산 중구 2", "위도": 35.2, "경도": 129.0, "관리번호": 101},
+            {"사업장명": "다병원", "소재지도로명주소": "부산 중구 3", "위도": 35.3, "경도": 129.0, "관리번호": None},
+        ])
+        
+        full = ExcelRepository(path).load_hospitals("부산")
+        streamed = ExcelRepository(path, chunksize=2).load_hospitals("부산")
+        
+        assert [h.id for h in full][:2] == ["007", "101"]
+        assert [h.to_dict() for h in streamed] == [h.to_dict() for h in full]
+        
+        xlsx_path = self._write_xlsx(tmp_path / "hospitals.xlsx", self.XLSX_ROWS)
+        full = ExcelRepository(xlsx_path, cache_dir=None).load_hospitals("부산")
+        streamed = ExcelRepository(xlsx_path, chunksize=1, cache_dir=None).load_hospitals("부산")
+        assert [h.to_dict() for h in streamed] == [h.to_dict() for h in full]
+    
+    def test_xlsx_conversion_cache_keeps_similar_names(self, tmp_path, monkeypatch):
+        """이름이 겹치는 다른 파일(hospitals_2024.xlsx)의 변환 캐시를 지우지 않는지 테스트"""
+        pytest.importorskip("pyarrow")
+        from src.infrastructure import excel_repository
+        cache_dir = tmp_path / "cache"
+        paths = [
+            self._write_xlsx(tmp_path / "hospitals.xlsx", self.XLSX_ROWS),
+            self._write_xlsx(tmp_path / "hospitals_2024.xlsx", self.XLSX_ROWS[:1]),
+        ]
+        for path in paths:
+            ExcelRepository(path, cache_dir=str(cache_dir)).load_hospitals("부산")
+        assert len(list(cache_dir.glob("*.parquet"))) == 2
+        
+        # 두 파일을 번갈아 읽어도 다시 변환하지 않음
+        def fail(*args, **kwargs):
+            raise AssertionError("엑셀 파일을 다시 읽었습니다.")
+        monkeypatch.setattr(excel_repository.openpyxl, "load_workbook", fail)
+        for path in paths:
+            assert ExcelRepository(path, cache_dir=str(cache_dir)).load_hospitals("부산")
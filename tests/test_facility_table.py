@@ -0,0 +1,154 @@
+"""
+열 단위 시설 테이블 테스트
+"""
+import numpy as np
+import pytest
+from shapely.geometry import Point, box, mapping
+
+from count_facilities_by_district import (
+    count_all_facilities_by_district, count_facilities_by_district, locate_districts
+)
+from src.domain.entity import VetHospital
+from src.domain.facility_table import FacilityTable
+
+
+@pytest.fixture
+def geojson_data():
+    """두 행정동(A동: x 0~1, B동: x 1~2) GeoJSON"""
+    return {
+        "features": [
+            {"properties": {"ADM_CD": "2600000001", "ADM_NM": "A동"}, "geometry": mapping(box(0, 0, 1, 1))},
+            {"properties": {"ADM_CD": "2600000002", "ADM_NM": "B동"}, "geometry": mapping(box(1, 0, 2, 1))}
+        ]
+    }
+
+
+class TestFacilityTable:
+    """시설 테이블 테스트 클래스"""
+    
+    def test_from_kakao_documents(self):
+        """카카오 검색 결과로 열 배열을 만드는지 테스트"""
+        table = FacilityTable.from_kakao_documents(
+            [{"id": "1", "place_name": "카페1", "x": "129.1", "y": "35.1"},
+             {"id": "2", "place_name": "카페2", "x": "129.2", "y": "35.2"}],
+            "애견카페"
+        )
+        
+        assert len(table) == 2
+        assert table.lon.dtype == np.float64
+        assert list(table.ids) == ["1", "2"]
+        assert list(table.types) == ["애견카페", "애견카페"]
+        assert list(table.dong_codes) == [None, None]
+    
+    def test_from_hospitals_and_geodataframe(self):
+        """동물병원 엔티티 변환 및 GeoDataFrame 변환 테스트"""
+        hospitals = [
+            VetHospital(id="1", name="병원1", address="부산", latitude=35.1, longitude=129.1, dong_code="26"),
+            VetHospital(id="2", name="병원2", address="부산", latitude=35.2, longitude=129.2)
+        ]
+        
+        gdf = FacilityTable.from_hospitals(hospitals).to_geodataframe()
+        
+        assert list(gdf["id"]) == ["1", "2"]
+        assert gdf.crs.to_epsg() == 4326
+        assert gdf.geometry.iloc[1].equals(Point(129.2, 35.2))
+        assert gdf["dong_code"].iloc[0] == "26"
+    
+    def test_concat_take_and_count(self):
+        """이어 붙이기, 행 선택, 값별 개수 테스트"""
+        first = FacilityTable(ids=["1"], names=["가"], types=["공원"], lon=[0.5], lat=[0.5], dong_names=["A동"])
+        second = FacilityTable(ids=["2", "3"], names=["나", "다"], types=["공원", "애견카페"],
+                               lon=[1.5, 1.6], lat=[0.5, 0.5], dong_names=["B동", None])
+        
+        table = FacilityTable.concat([first, second])
+        
+        assert list(table.ids) == ["1", "2", "3"]
+        assert table.count_by("type") == {"공원": 2, "애견카페": 1}
+        assert table.count_by("dong_name") == {"A동": 1, "B동": 1}
+        assert list(table.take(table.lon > 1).names) == ["나", "다"]
+        assert table.to_records()[2] == {"name": "다", "x": 1.6, "y": 0.5, "type": "애견카페", "district": "경계 외"}
+    
+    def test_length_mismatch(self):
+        """열 길이가 다르면 오류를 내는지 테스트"""
+        with pytest.raises(ValueError):
+            FacilityTable(ids=["1", "2"], names=None, types=None, lon=[0.0], lat=[0.0])
+
+
+class TestLocateDistricts:
+    """행정동 일괄 위치 조회 테스트 클래스"""
+    
+    def test_locate_districts(self, geojson_data):
+        """경계 안/밖 시설의 행정동을 찾는지 테스트"""
+        table = FacilityTable(ids=None, names=["a", "b", "c"], types=None,
+                              lon=[0.5, 1.5, 5.0], lat=[0.5, 0.5, 0.5])
+        
+        located = locate_districts(geojson_data, table, geometry_source="test-locate")
+        
+        assert list(located.dong_names) == ["A동", "B동", None]
+        assert list(located.dong_codes) == ["2600000001", "2600000002", None]
+    
+    def test_count_facilities_accepts_records_and_tables(self, geojson_data):
+        """dict 목록과 시설 테이블 입력 결과가 같은지 테스트"""
+        records = [{"name": "a", "x": 0.5, "y": 0.5, "type": "공원"},
+                   {"name": "b", "x": 0.2, "y": 0.2, "type": "공원"},
+                   {"name": "c", "x": 5.0, "y": 5.0, "type": "공원"}]
+        
+        counts, with_district = count_facilities_by_district(geojson_data, records, geometry_source="test-count")
+        table_counts, located = count_facilities_by_district(
+            geojson_data, FacilityTable.from_records(records), geometry_source="test-count"
+        )
+        
+        assert counts == table_counts == {"A동": 2, "B동": 0}
+        assert [f["district"] for f in with_district] == ["A동", "A동", "경계 외"]
+        assert [r["district"] for r in located.to_records()] == ["A동", "A동", "경계 외"]
+    
+    def test_count_all_facilities_matches_per_type(self, geojson_data):
+        """모든 유형을 한 번에 집계한 결과가 유형별 집계와 같은지 테스트"""
+        hospitals = FacilityTable(ids=None, names=["h1", "h2"], types=["동물병원"] * 2,
+                                  lon=[0.5, 1.5], lat=[0.5, 0.5])
+        cafes = FacilityTable(ids=None, names=["c1"], types=["애견카페"], lon=[5.0], lat=[5.0])
+        parks = FacilityTable(ids=None, names=["p1", "p2", "p3"], types=["공원"] * 3,
+                              lon=[1.2, 1.8, 0.1], lat=[0.2, 0.8, 0.1])
+        
+        counts, located = count_all_facilities_by_district(
+            geojson_data, [hospitals, cafes, parks], geometry_source="test-count-all"
+        )
+        
+        assert list(counts.index) == ["A동", "B동"]
+        for facility_type, table in zip(["동물병원", "애견카페", "공원"], [hospitals, cafes, parks]):
+            per_type, _ = count_facilities_by_district(geojson_data, table, geometry_source="test-count-all")
+            assert counts[facility_type].to_dict() == per_type
+        expected = FacilityTable.concat([
+            count_facilities_by_district(geojson_data, table, geometry_source="test-count-all")[1]
+            for table in (hospitals, cafes, parks)
+        ])
+        assert located.to_records() == expected.to_records()
+    
+    def test_same_code_in_different_boundaries(self, geojson_data):
+        """코드가 같아도 경계가 다른 GeoJSON을 차례로 조회하면 각 경계를 사용하는지 테스트"""
+        moved = {
+            "features": [
+                {"properties": {"ADM_CD": "2600000001", "ADM_NM": "A동"}, "geometry": mapping(box(10, 0, 11, 1))}
+            ]
+        }
+        records = [{"name": "a", "x": 10.5, "y": 0.5, "type": "공원"}]
+        
+        count_facilities_by_district(geojson_data, records)
+        counts, _ = count_facilities_by_district(moved, records)
+        
+        assert counts == {"A동": 1}
+    
+    def test_same_name_without_code(self):
+        """코드 없이 이름만 같은 두 행정동을 하나의 폴리곤으로 합치지 않는지 테스트"""
+        same_names = {
+            "features": [
+                {"properties": {"ADM_NM": "송정동"}, "geometry": mapping(box(0, 0, 1, 1))},
+                {"properties": {"ADM_NM": "송정동"}, "geometry": mapping(box(5, 0, 6, 1))}
+            ]
+        }
+        table = FacilityTable(ids=None, names=["a", "b"], types=None, lon=[0.5, 5.5], lat=[0.5, 0.5])
+        
+        located = locate_districts(same_names, table)
+        
+        assert list(located.dong_names) == ["송정동", "송정동"]
+        assert list(located.dong_codes) == [0, 1]
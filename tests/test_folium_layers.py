@@ -0,0 +1,141 @@
+"""
+folium 시설 레이어 테스트
+"""
+import json
+import re
+import shutil
+import subprocess
+
+import numpy as np
+import pandas as pd
+import pytest
+
+folium = pytest.importorskip("folium")
+
+from src.infrastructure.folium_layers import create_map, facility_layer, facility_records, render_popup
+
+POPUP = '<b>{name}</b> {district}'
+
+
+def _facilities(n=50):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'name': [f'시설{i}' for i in range(n)],
+        'district': ['해운대구 우동'] * n,
+        'x': rng.uniform(129.0, 129.2, n),
+        'y': rng.uniform(35.1, 35.2, n),
+    })
+
+
+def _render(mode, df):
+    m = create_map([35.15, 129.1], 11, mode=mode, tiles=None)
+    facility_layer(df, '애견카페', 'blue', POPUP, ['name', 'district'],
+                   lat_col='y', lng_col='x', mode=mode).add_to(m)
+    return m.get_root().render()
+
+
+def _run_node(args, source):
+    """node로 JS 실행 (node가 없으면 테스트 건너뜀)"""
+    node = shutil.which("node")
+    if node is None:
+        pytest.skip("node가 설치되어 있지 않습니다.")
+    return subprocess.run([node, *args], input=source, capture_output=True, text=True, check=False)
+
+
+def _assert_valid_scripts(html):
+    """지도 HTML의 인라인 스크립트가 문법적으로 올바른 JS인지 node --check로 검사"""
+    scripts = re.findall(r"<script>(.*?)</script>", html, flags=re.S)
+    assert scripts
+    for script in scripts:
+        result = _run_node(["--check", "-"], script)
+        assert result.returncode == 0, result.stderr
+
+
+class TestFacilityRecords:
+    """좌표/속성 변환 테스트"""
+
+    def test_skips_missing_coordinates(self):
+        df = _facilities(3)
+        df.loc[1, 'x'] = np.nan
+        df.loc[2, 'district'] = np.nan
+
+        coords, properties = facility_records(df, ['name', 'district', 'phone'], lat_col='y', lng_col='x')
+
+        assert len(coords) == 2
+        assert coords[0] == [round(df.loc[0, 'y'], 6), round(df.loc[0, 'x'], 6)]
+        assert properties[1] == {'name': '시설2', 'district': None, 'phone': None}
+
+    def test_render_popup_escapes_values(self):
+        html = render_popup(POPUP, {'name': '<script>', 'district': None})
+        assert html == '<b>&lt;script&gt;</b> '
+
+
+class TestFacilityLayer:
+    """렌더링 모드별 레이어 테스트"""
+
+    def test_fast_mode_single_geojson_layer(self):
+        df = _facilities()
+
+        layer = facility_layer(df, '애견카페', 'blue', POPUP, ['name', 'district'], lat_col='y', lng_col='x')
+        html = _render('fast', df)
+
+        assert isinstance(layer, folium.GeoJson)
+        assert len(layer.data['features']) == len(df)
+        # 마커 생성 코드와 팝업 생성 코드는 레이어당 한 번만 포함되고 팝업 HTML은 미리 만들지 않음
+        assert html.count('new L.CircleMarker') == 1
+        assert html.count('bindPopup') == 1
+        assert '<b>시설0</b>' not in html
+        assert 'preferCanvas": true' in html
+        _assert_valid_scripts(html)
+
+    def test_cluster_mode_shares_properties(self):
+        df = _facilities()
+
+        html = _render('cluster', df)
+
+        assert 'L.markerClusterGroup' in html
+        assert html.count('L.circleMarker') == 1
+        assert html.count('시설49') == 1
+        _assert_valid_scripts(html)
+    
+    def test_cluster_callback_builds_lazy_popup(self):
+        """FastMarkerCluster에 넣는 callback이 마커를 만들고 클릭할 때 이스케이프된 팝업을 만드는지 테스트"""
+        df = _facilities(2)
+        df.loc[1, 'name'] = '<b>시설</b>'
+        layer = facility_layer(df, '애견카페', 'blue', POPUP, ['name', 'district'],
+                               lat_col='y', lng_col='x', mode='cluster')
+        
+        # FastMarkerCluster가 HTML에 넣는 callback 문자열(var callback = ...;)을 가짜 Leaflet에서 실행
+        script = f"""
+            var L = {{
+                LatLng: function(lat, lng) {{ this.lat = lat; this.lng = lng; }},
+                circleMarker: function(latlng, options) {{
+                    return {{latlng: latlng, options: options,
+                             bindPopup: function(content) {{ this.content = content; return this; }}}};
+                }}
+            }};
+            {layer.callback}
+            var marker = callback({json.dumps(layer.data[1])});
+            console.log(JSON.stringify([marker.latlng.lat, marker.options.color, typeof marker.content, marker.content()]));
+        """
+        result = _run_node([], script)
+        
+        assert result.returncode == 0, result.stderr
+        lat, color, content_type, popup = json.loads(result.stdout)
+        assert lat == layer.data[1][0] and color == 'blue'
+        assert content_type == 'function'
+        assert popup == '<b>&lt;b&gt;시설&lt;/b&gt;</b> 해운대구 우동'
+
+    def test_markers_mode_matches_legacy_output(self):
+        df = _facilities(5)
+
+        layer = facility_layer(df, '애견카페', 'blue', POPUP, ['name', 'district'],
+                               lat_col='y', lng_col='x', mode='markers')
+
+        markers = [child for child in layer._children.values() if isinstance(child, folium.CircleMarker)]
+        assert isinstance(layer, folium.FeatureGroup)
+        assert len(markers) == 5
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            facility_layer(_facilities(1), '공원', 'green', POPUP, ['name'], mode='svg')
@@ -0,0 +1,61 @@
+"""
+prepared geometry 캐시 테스트
+"""
+import shapely
+from shapely.geometry import Point, Polygon
+
+from src.infrastructure.geometry_cache import PreparedGeometryCache, get_geometry_cache
+
+
+class TestPreparedGeometryCache:
+    """prepared geometry 캐시 테스트 클래스"""
+    
+    def test_get_or_prepare(self):
+        """폴리곤 prepare 및 같은 내용의 폴리곤 재사용 테스트"""
+        cache = PreparedGeometryCache()
+        polygon = Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])
+        
+        prepared = cache.get_or_prepare(polygon)
+        
+        # 결과 검증
+        assert shapely.is_prepared(prepared)
+        assert prepared.contains(Point(0.5, 0.5))
+        assert polygon in cache
+        
+        # 내용이 같은 폴리곤은 캐시된 객체 재사용
+        assert cache.get_or_prepare(Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])) is prepared
+    
+    def test_different_geometry_is_not_stale(self):
+        """다른 폴리곤을 요청하면 이전에 캐시된 폴리곤을 돌려주지 않는지 테스트"""
+        cache = PreparedGeometryCache()
+        cache.get_or_prepare(Polygon([(0, 0), (1, 0), (1, 1), (0, 1)]))
+        
+        other = Polygon([(0, 0), (2, 0), (2, 2), (0, 2)])
+        prepared = cache.get_or_prepare(other)
+        
+        assert prepared.equals(other)
+        assert prepared.contains(Point(1.5, 1.5))
+        assert len(cache) == 2
+    
+    def test_prepare_many(self):
+        """여러 폴리곤 일괄 prepare 테스트"""
+        cache = PreparedGeometryCache()
+        polygons = [
+            Polygon([(0, 0), (1, 0), (1, 1), (0, 1)]),
+            Polygon([(1, 0), (2, 0), (2, 1), (1, 1)])
+        ]
+        
+        prepared = cache.prepare_many(polygons)
+        
+        # 결과 검증 (입력 순서 유지)
+        assert len(prepared) == 2
+        assert list(shapely.contains(prepared, Point(1.5, 0.5))) == [False, True]
+        assert len(cache) == 2
+        
+        cache.clear()
+        assert len(cache) == 0
+    
+    def test_get_geometry_cache_shared_by_source(self):
+        """출처별 전역 캐시 공유 테스트"""
+        assert get_geometry_cache("test_source_a") is get_geometry_cache("test_source_a")
+        assert get_geometry_cache("test_source_a") is not get_geometry_cache("test_source_b")
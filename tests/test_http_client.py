@@ -0,0 +1,117 @@
+"""
+커넥션 풀 HTTP 클라이언트 테스트
+"""
+import pytest
+import requests
+from unittest.mock import MagicMock
+
+from src.infrastructure.http_client import HttpClientStats, PooledHttpClient
+
+
+def make_response(status_code, content=b"{}", headers=None):
+    """테스트용 응답 객체 생성"""
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = content
+    response.headers = headers or {}
+    return response
+
+
+class TestPooledHttpClient:
+    """커넥션 풀 HTTP 클라이언트 테스트 클래스"""
+    
+    def setup_method(self):
+        """테스트 셋업"""
+        self.session = MagicMock(spec=requests.Session)
+        self.sleeps = []
+        self.client = PooledHttpClient(
+            max_retries=3,
+            backoff_base=0.5,
+            session=self.session,
+            sleep=self.sleeps.append
+        )
+    
+    def test_retry_on_server_error(self):
+        """429/5xx 응답 재시도 및 통계 테스트"""
+        self.session.get.side_effect = [
+            make_response(503),
+            make_response(429, headers={"Retry-After": "2"}),
+            make_response(200, content=b'{"documents": []}')
+        ]
+        
+        response = self.client.get("https://example.com", params={"query": "공원"})
+        
+        # 결과 검증
+        assert response.status_code == 200
+        assert self.session.get.call_count == 3
+        
+        # 첫 재시도는 jitter 백오프, 두 번째는 Retry-After 헤더 사용
+        assert 0 <= self.sleeps[0] <= 0.5
+        assert self.sleeps[1] == 2.0
+        
+        stats = self.client.stats.snapshot()
+        assert stats["requests"] == 3
+        assert stats["retries"] == 2
+        assert stats["failures"] == 0
+        assert stats["bytes_received"] == 2 + 2 + len(b'{"documents": []}')
+        assert sum(stats["latency_histogram"].values()) == 3
+    
+    def test_gives_up_after_max_retries(self):
+        """최대 재시도 후 마지막 응답 반환 테스트"""
+        self.session.get.return_value = make_response(500)
+        
+        response = self.client.get("https://example.com")
+        
+        assert response.status_code == 500
+        assert self.session.get.call_count == 4
+        assert self.client.stats.retries == 3
+        
+        # 백오프 상한은 재시도마다 2배씩 증가
+        for attempt, delay in enumerate(self.sleeps):
+            assert 0 <= delay <= 0.5 * (2 ** attempt)
+    
+    def test_connection_error(self):
+        """연결 오류 재시도 후 예외 전달 테스트"""
+        self.session.get.side_effect = requests.ConnectionError("connection reset")
+        
+        with pytest.raises(requests.ConnectionError):
+            self.client.get("https://example.com")
+        
+        assert self.session.get.call_count == 4
+        assert self.client.stats.failures == 4
+    
+    def test_no_retry_on_client_error(self):
+        """4xx 응답은 재시도하지 않는지 테스트"""
+        self.session.get.return_value = make_response(401)
+        
+        response = self.client.get("https://example.com")
+        
+        assert response.status_code == 401
+        assert self.session.get.call_count == 1
+        assert self.sleeps == []
+    
+    def test_retries_acquire_rate_limiter_token(self):
+        """재시도 요청도 속도 제한기에서 토큰을 얻는지 테스트"""
+        self.session.get.side_effect = [make_response(503), make_response(503), make_response(200)]
+        rate_limiter = MagicMock()
+        
+        self.client.get("https://example.com", rate_limiter=rate_limiter)
+        
+        assert rate_limiter.acquire.call_count == self.session.get.call_count == 3
+
+
+class TestHttpClientStats:
+    """HTTP 호출 통계 테스트 클래스"""
+    
+    def test_latency_histogram(self):
+        """지연 시간 히스토그램 구간 테스트"""
+        stats = HttpClientStats()
+        stats.record_response(0.01, 100)
+        stats.record_response(0.3, 100)
+        stats.record_response(10.0, 100)
+        
+        histogram = stats.snapshot()["latency_histogram"]
+        assert histogram["<=0.05s"] == 1
+        assert histogram["<=0.5s"] == 1
+        assert histogram[">5.0s"] == 1
+        assert "요청 3회" in stats.summary()
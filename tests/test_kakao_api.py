@@ -4,9 +4,16 @@
 import pytest
 import json
 import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
 from unittest.mock import patch, MagicMock
 
+import requests
+
+from src.infrastructure.http_client import PooledHttpClient
 from src.infrastructure.kakao_api import KakaoMapAPI
+from src.infrastructure.rate_limiter import TokenBucketRateLimiter
 from src.domain.entity import VetHospital
 
 
@@ -66,7 +73,7 @@ class TestKakaoMapAPI:
         api = KakaoMapAPI(api_key="param_api_key")
         assert api.api_key == "param_api_key"
     
-    @patch('src.infrastructure.kakao_api.requests.get')
+    @patch('src.infrastructure.http_client.requests.Session.get')
     def test_search_keyword(self, mock_get, mock_kakao_response):
         """키워드 검색 기능 테스트"""
         # 목업 응답 설정
@@ -87,7 +94,7 @@ class TestKakaoMapAPI:
         assert len(result["documents"]) == 2
         assert result["documents"][0]["place_name"] == "행복한동물병원"
         
-        # requests.get 호출 검증
+        # 세션 get 호출 검증
         mock_get.assert_called_once()
         args, kwargs = mock_get.call_args
         assert args[0] == "https://dapi.kakao.com/v2/local/search/keyword.json"
@@ -117,3 +124,197 @@ class TestKakaoMapAPI:
         mock_search.assert_called()
         args, kwargs = mock_search.call_args_list[0]
         assert kwargs["keyword"] == "부산 동물병원"
+
+
+class _StubKakaoHandler(BaseHTTPRequestHandler):
+    """키워드 검색 API를 흉내 내는 로컬 스텁 핸들러 (검색어마다 2페이지, 페이지당 2건)"""
+    
+    request_count = 0
+    lock = threading.Lock()
+    
+    def do_GET(self):
+        with self.lock:
+            type(self).request_count += 1
+        params = parse_qs(urlparse(self.path).query)
+        query = params["query"][0]
+        page = int(params["page"][0])
+        # 검색어가 달라도 같은 장소가 나오도록 ID는 페이지 번호 기준으로 생성
+        documents = [
+            {
+                "id": f"place-{page}-{i}",
+                "place_name": f"{query} {page}-{i}",
+                "address_name": "부산광역시 중구",
+                "x": "129.03",
+                "y": "35.10",
+                "phone": "",
+                "place_url": ""
+            }
+            for i in range(2)
+        ]
+        if query.startswith("장애"):
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if query.startswith("고유"):
+            documents.append({**documents[0], "id": f"unique-{query}-{page}"})
+        total_count = 6 if query.startswith("고유") else 4
+        body = json.dumps({"meta": {"is_end": page >= 2, "total_count": total_count},
+                           "documents": documents}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_kakao_server():
+    """로컬 스텁 HTTP 서버"""
+    _StubKakaoHandler.request_count = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubKakaoHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v2/local/search/keyword.json"
+    server.shutdown()
+    server.server_close()
+
+
+class TestKakaoMapAPIConcurrent:
+    """카카오맵 API 동시 수집 테스트 클래스"""
+    
+    def test_search_keywords_concurrently(self, stub_kakao_server):
+        """스텁 서버 대상 동시 수집 및 중복 제거 테스트"""
+        api = KakaoMapAPI(api_key="test_api_key", base_url=stub_kakao_server, requests_per_second=1000)
+        keywords = ["부산 동물병원", "고유 키워드", "부산 동물클리닉"]
+        
+        hospitals = api.search_keywords_concurrently(keywords, max_workers=3)
+        
+        # 결과 검증 (공통 장소 4개 + 고유 키워드 전용 장소 2개)
+        ids = [h.id for h in hospitals]
+        assert len(ids) == len(set(ids)) == 6
+        assert ids[:4] == ["place-1-0", "place-1-1", "place-2-0", "place-2-1"]
+        assert _StubKakaoHandler.request_count == 6
+    
+    def test_collect_vet_hospitals_concurrent(self, stub_kakao_server):
+        """동별+키워드별 동시 수집 테스트"""
+        api = KakaoMapAPI(api_key="test_api_key", base_url=stub_kakao_server, requests_per_second=1000)
+        
+        hospitals = api.collect_vet_hospitals(
+            dong_names=["중앙동", "동광동"],
+            keywords=["동물병원", "동물클리닉"],
+            concurrent=True,
+            max_workers=4
+        )
+        
+        assert len(hospitals) == 4
+        assert _StubKakaoHandler.request_count == 8
+
+
+class TestKakaoMapAPIRateLimit:
+    """카카오맵 API 공유 속도 제한 테스트 클래스"""
+    
+    def test_sequential_search_uses_rate_limiter(self, stub_kakao_server):
+        """순차 검색이 고정 대기 대신 요청마다 공유 속도 제한기의 토큰을 얻는지 테스트"""
+        api = KakaoMapAPI(api_key="test_api_key", base_url=stub_kakao_server, requests_per_second=1000)
+        api.rate_limiter = MagicMock(wraps=api.rate_limiter)
+        
+        with patch("time.sleep") as mock_sleep:
+            hospitals = api.search_direct_keyword("부산 동물병원")
+        
+        assert len(hospitals) == 4
+        assert api.rate_limiter.acquire.call_count == _StubKakaoHandler.request_count == 2
+        mock_sleep.assert_not_called()
+
+
+class TestKakaoMapAPIErrors:
+    """재시도 후에도 실패한 요청의 오류 전달 테스트 클래스"""
+    
+    def _api(self, base_url):
+        client = PooledHttpClient(max_retries=1, sleep=lambda seconds: None)
+        return KakaoMapAPI(api_key="test_api_key", base_url=base_url, requests_per_second=1000, http_client=client)
+    
+    def test_search_direct_keyword_raises_on_persistent_5xx(self, stub_kakao_server):
+        """5xx가 계속되면 빈 결과 대신 HTTPError를 전달하는지 테스트"""
+        api = self._api(stub_kakao_server)
+        
+        with pytest.raises(requests.HTTPError):
+            api.search_direct_keyword("장애 키워드")
+        assert _StubKakaoHandler.request_count == 2
+    
+    def test_concurrent_search_raises_on_persistent_5xx(self, stub_kakao_server):
+        """동시 수집 중 한 검색어가 계속 실패하면 일부 결과만 반환하지 않고 오류를 전달하는지 테스트"""
+        api = self._api(stub_kakao_server)
+        
+        with pytest.raises(requests.HTTPError):
+            api.search_keywords_concurrently(["부산 동물병원", "장애 키워드"], max_workers=2)
+    
+    def test_collect_vet_hospitals_raises_on_persistent_5xx(self, stub_kakao_server):
+        """동별 수집 중 5xx가 계속되면 오류를 전달하는지 테스트"""
+        api = self._api(stub_kakao_server)
+        
+        with pytest.raises(requests.HTTPError):
+            api.collect_vet_hospitals(dong_names=["장애"], keywords=["동물병원"])
+
+
+class TestKakaoMapAPIIncremental:
+    """카카오맵 API 증분 수집 테스트 클래스"""
+    
+    def test_unchanged_keywords_probe_first_page_only(self, stub_kakao_server):
+        """total_count가 이전과 같은 키워드는 첫 페이지만 조회하고 이전 결과를 재사용하는지 테스트"""
+        api = KakaoMapAPI(api_key="test_api_key", base_url=stub_kakao_server, requests_per_second=1000)
+        keywords = ["부산 동물병원", "고유 키워드"]
+        
+        first, tiles = api.search_keywords_incrementally(keywords)
+        assert _StubKakaoHandler.request_count == 4
+        assert tiles["부산 동물병원"][0] == 4
+        
+        _StubKakaoHandler.request_count = 0
+        second, _ = api.search_keywords_incrementally(keywords, tiles)
+        
+        assert _StubKakaoHandler.request_count == 2
+        assert [h.id for h in second] == [h.id for h in first]
+    
+    def test_changed_keyword_fetches_all_pages(self, stub_kakao_server):
+        """total_count가 달라진 키워드는 모든 페이지를 다시 조회하는지 테스트"""
+        api = KakaoMapAPI(api_key="test_api_key", base_url=stub_kakao_server, requests_per_second=1000)
+        stale = {"부산 동물병원": (3, [{"id": "closed", "place_name": "폐업", "address_name": "",
+                                      "x": "129.0", "y": "35.1"}])}
+        
+        hospitals, tiles = api.search_keywords_incrementally(["부산 동물병원"], stale)
+        
+        assert _StubKakaoHandler.request_count == 2
+        assert tiles["부산 동물병원"][0] == 4
+        assert [h.id for h in hospitals] == ["place-1-0", "place-1-1", "place-2-0", "place-2-1"]
+
+
+class TestTokenBucketRateLimiter:
+    """토큰 버킷 속도 제한 테스트 클래스"""
+    
+    def test_acquire_waits_for_refill(self):
+        """토큰 소진 시 충전 속도만큼 대기하는지 테스트"""
+        now = [0.0]
+        sleeps = []
+        
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+        
+        limiter = TokenBucketRateLimiter(2, burst=2, clock=lambda: now[0], sleep=fake_sleep)
+        
+        # 버킷 용량만큼은 대기 없이 통과
+        assert limiter.acquire() == 0
+        assert limiter.acquire() == 0
+        
+        # 이후에는 초당 2회 속도로 제한
+        assert limiter.acquire() == pytest.approx(0.5)
+        assert limiter.acquire() == pytest.approx(0.5)
+        assert sum(sleeps) == pytest.approx(1.0)
+    
+    def test_invalid_rate(self):
+        """잘못된 속도 설정 예외 테스트"""
+        with pytest.raises(ValueError):
+            TokenBucketRateLimiter(0)
@@ -0,0 +1,47 @@
+"""
+ETL 파이프라인 컨텍스트 테스트
+"""
+import geopandas as gpd
+from shapely.geometry import Polygon
+from unittest.mock import patch
+
+from src.interface.pipeline_context import PipelineContext
+
+
+class TestPipelineContext:
+    """ETL 파이프라인 컨텍스트 테스트 클래스"""
+    
+    @patch('geopandas.read_file')
+    def test_create_loads_shapefile_once(self, mock_read_file, tmp_path):
+        """행정동 데이터 1회 로드 및 레포지토리 공유 테스트"""
+        mock_read_file.return_value = gpd.GeoDataFrame({
+            'ADM_CD': ['2611010100'],
+            'ADM_NM': ['중앙동'],
+            'geometry': [Polygon([(129.02, 35.10), (129.03, 35.10), (129.03, 35.11), (129.02, 35.11)])]
+        }, crs="EPSG:4326")
+        
+        context = PipelineContext.create("mock_shapefile_path.shp", data_dir=str(tmp_path))
+        
+        # 결과 검증
+        mock_read_file.assert_called_once_with("mock_shapefile_path.shp")
+        assert [dong.code for dong in context.dongs] == ['2611010100']
+        assert context.dong_repository.get_all_dongs() is context.dongs
+        assert context.vet_hospital_repository.data_dir == str(tmp_path)
+        assert "load" in context.stage_timings
+    
+    def test_stage_timing(self):
+        """단계별 실행 시간 누적 테스트"""
+        context = PipelineContext(
+            shapefile_path="mock_shapefile_path.shp",
+            dong_repository=None,
+            vet_hospital_repository=None,
+            dongs=[]
+        )
+        
+        with context.stage("collect"):
+            pass
+        with context.stage("collect"):
+            pass
+        
+        assert list(context.stage_timings) == ["collect"]
+        assert context.stage_timings["collect"] >= 0
@@ -0,0 +1,91 @@
+"""
+장소 스냅샷 및 증분 갱신 테스트
+"""
+import csv
+import json
+
+from count_facilities_by_district import apply_place_diff
+from src.infrastructure.place_snapshot import PlaceDiff, PlaceSnapshot, apply_diff_to_counts, diff_places
+
+
+def place(place_id, x, y):
+    return {"id": place_id, "place_name": f"장소{place_id}", "x": str(x), "y": str(y)}
+
+
+def locate(x, y):
+    """x < 1이면 A동, 아니면 B동 (y < 0이면 경계 밖)"""
+    if y < 0:
+        return None
+    return "A동" if x < 1 else "B동"
+
+
+class TestPlaceSnapshot:
+    """장소 스냅샷 테스트 클래스"""
+    
+    def test_diff_places(self):
+        """추가/삭제/이동 판별 테스트"""
+        previous = {"1": place("1", 0.5, 0.5), "2": place("2", 0.5, 0.5), "3": place("3", 0.5, 0.5)}
+        current = {"1": place("1", 0.5, 0.5), "2": place("2", 1.5, 0.5), "4": place("4", 1.5, 0.5)}
+        
+        diff = diff_places(previous, current)
+        
+        assert [p["id"] for p in diff.added] == ["4"]
+        assert [p["id"] for p in diff.removed] == ["3"]
+        assert [(b["id"], a["x"]) for b, a in diff.moved] == [("2", "1.5")]
+        assert diff_places(current, current).is_empty()
+    
+    def test_apply_diff_to_counts(self):
+        """변경된 행정동만 개수가 갱신되는지 테스트"""
+        diff = PlaceDiff(
+            added=[place("4", 1.5, 0.5), place("5", 1.5, -1)],
+            removed=[place("3", 0.5, 0.5)],
+            moved=[(place("2", 0.5, 0.5), place("2", 1.5, 0.5)), (place("6", 0.2, 0.2), place("6", 0.3, 0.3))]
+        )
+        counts = {"A동": 3, "B동": 1, "C동": 7}
+        
+        deltas = apply_diff_to_counts(counts, diff, locate)
+        
+        assert deltas == {"A동": -2, "B동": 2}
+        assert counts == {"A동": 1, "B동": 3, "C동": 7}
+    
+    def test_save_load_and_update(self, tmp_path):
+        """스냅샷 저장/로드 및 갱신 시 변경 내역 테스트"""
+        path = str(tmp_path / "snapshots" / "places.snapshot.json")
+        snapshot = PlaceSnapshot()
+        tile = [place("1", 0.5, 0.5), place("2", 1.5, 0.5)]
+        assert len(snapshot.update(tile, {"tile": (2, tile)}).added) == 2
+        snapshot.save(path)
+        
+        loaded = PlaceSnapshot.load(path)
+        assert loaded.known_tiles() == {"tile": (2, tile)}
+        
+        diff = loaded.update([tile[0]], {"tile": (1, [tile[0]])})
+        assert [p["id"] for p in diff.removed] == ["2"]
+        assert PlaceSnapshot.load(str(tmp_path / "missing.json")).places == {}
+    
+    def test_apply_place_diff_updates_outputs(self, tmp_path):
+        """집계 CSV/JSON/JS 파일에서 변경된 행정동만 갱신되는지 테스트"""
+        counts_csv = tmp_path / "counts.csv"
+        with open(counts_csv, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=["행정동", "동물병원", "애견카페", "공원", "총합"])
+            writer.writeheader()
+            writer.writerow({"행정동": "A동", "동물병원": 2, "애견카페": 1, "공원": 0, "총합": 3})
+            writer.writerow({"행정동": "B동", "동물병원": 1, "애견카페": 0, "공원": 0, "총합": 1})
+        district_json = tmp_path / "district_data.json"
+        district_json.write_text(json.dumps([
+            {"district": "A동", "동물병원": 2, "애견카페": 1, "공원": 0},
+            {"district": "B동", "동물병원": 1, "애견카페": 0, "공원": 0}
+        ], ensure_ascii=False), encoding="utf-8")
+        district_js = tmp_path / "district_data.js"
+        
+        diff = PlaceDiff(added=[place("9", 1.5, 0.5), place("10", 1.6, 0.5), place("11", 1.7, 0.5)])
+        deltas = apply_place_diff(diff, "애견카페", locate, str(counts_csv), str(district_json), str(district_js))
+        
+        assert deltas == {"B동": 3}
+        with open(counts_csv, encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert [(r["행정동"], r["애견카페"], r["총합"]) for r in rows] == [("B동", "3", "4"), ("A동", "1", "3")]
+        assert json.loads(district_json.read_text(encoding="utf-8"))[0] == {
+            "district": "B동", "동물병원": 1, "애견카페": 3, "공원": 0
+        }
+        assert "{ district: 'B동', hospital: 1, cafe: 3, park: 0 }" in district_js.read_text(encoding="utf-8")
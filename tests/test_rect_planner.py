@@ -0,0 +1,148 @@
+"""
+쿼드트리 영역 검색 계획기 테스트
+"""
+import random
+import threading
+
+import pytest
+
+from shapely.geometry import box
+
+from src.infrastructure.rect_planner import QuadtreeRectPlanner, split_rect
+
+
+class FakeRectSearch:
+    """영역 안의 가짜 장소를 페이지 단위로 돌려주는 카카오 영역 검색 흉내"""
+    
+    def __init__(self, places):
+        self.places = places
+        self.requests = []
+        self.lock = threading.Lock()
+    
+    def __call__(self, keyword, rect, page):
+        with self.lock:
+            self.requests.append((rect, page))
+        start_x, start_y, end_x, end_y = rect
+        inside = [p for p in self.places if start_x <= p["x"] < end_x and start_y <= p["y"] < end_y]
+        pageable = inside[:45]
+        documents = pageable[(page - 1) * 15:page * 15]
+        return {
+            "meta": {"total_count": len(inside), "is_end": page * 15 >= len(pageable)},
+            "documents": documents
+        }
+
+
+def make_places(n, seed=0):
+    """부산 영역 안에 가짜 장소 생성 (일부 지역에 밀집)"""
+    rng = random.Random(seed)
+    places = []
+    for i in range(n):
+        if i % 2:
+            x, y = rng.uniform(129.0, 129.05), rng.uniform(35.1, 35.15)
+        else:
+            x, y = rng.uniform(128.8, 129.3), rng.uniform(34.9, 35.4)
+        places.append({"id": str(i), "x": x, "y": y})
+    return places
+
+
+ROOT = (128.8, 34.9, 129.3, 35.4)
+
+
+class TestQuadtreeRectPlanner:
+    """쿼드트리 계획기 테스트 클래스"""
+    
+    def test_split_rect(self):
+        """영역 4등분 테스트"""
+        assert split_rect((0, 0, 2, 2)) == [(0, 0, 1, 1), (1, 0, 2, 1), (0, 1, 1, 2), (1, 1, 2, 2)]
+    
+    def test_search_collects_all_places(self, tmp_path):
+        """분할 검색으로 모든 장소를 수집하는지 테스트"""
+        places = make_places(400)
+        fetch = FakeRectSearch(places)
+        planner = QuadtreeRectPlanner(fetch, layout_path=str(tmp_path / "layouts.json"), max_workers=4)
+        
+        documents = planner.search("공원", ROOT)
+        
+        assert {d["id"] for d in documents} == {p["id"] for p in places}
+        assert planner.request_count == len(fetch.requests)
+    
+    def test_reuses_stored_layout(self, tmp_path):
+        """두 번째 검색은 저장된 분할 영역부터 시작해 요청 수가 줄어드는지 테스트"""
+        places = make_places(400)
+        layout_path = str(tmp_path / "layouts.json")
+        
+        first = FakeRectSearch(places)
+        QuadtreeRectPlanner(first, layout_path=layout_path).search("공원", ROOT)
+        
+        second = FakeRectSearch(places)
+        documents = QuadtreeRectPlanner(second, layout_path=layout_path).search("공원", ROOT)
+        
+        assert {d["id"] for d in documents} == {p["id"] for p in places}
+        assert len(second.requests) < len(first.requests)
+        # 분할이 필요한 영역(결과 45개 초과)은 다시 조회하지 않음
+        assert all(page > 1 or rect != ROOT for rect, page in second.requests)
+        
+        # 다른 키워드는 별도 분할 영역 사용
+        third = FakeRectSearch(places)
+        QuadtreeRectPlanner(third, layout_path=layout_path).search("애견카페", ROOT)
+        assert len(third.requests) == len(first.requests)
+    
+    def test_skips_tiles_outside_boundary(self, tmp_path):
+        """경계 밖 영역은 조회하지 않는지 테스트"""
+        places = make_places(400)
+        boundary = box(128.8, 34.9, 129.05, 35.15)
+        fetch = FakeRectSearch(places)
+        planner = QuadtreeRectPlanner(fetch, layout_path=None, boundary=boundary)
+        
+        documents = planner.search("공원", ROOT)
+        
+        assert all(box(*rect).intersects(boundary) for rect, _ in fetch.requests)
+        expected = {p["id"] for p in places if p["x"] < 129.05 and p["y"] < 35.15}
+        assert expected <= {d["id"] for d in documents}
+    
+    def test_reuses_known_tiles_with_same_total_count(self, tmp_path):
+        """이전 갱신과 total_count가 같은 영역은 첫 페이지만 조회하는지 테스트"""
+        places = make_places(400)
+        layout_path = str(tmp_path / "layouts.json")
+        
+        first = QuadtreeRectPlanner(FakeRectSearch(places), layout_path=layout_path)
+        first.search("공원", ROOT)
+        known_tiles = dict(first.last_tiles)
+        
+        fetch = FakeRectSearch(places)
+        planner = QuadtreeRectPlanner(fetch, layout_path=layout_path)
+        documents = planner.search("공원", ROOT, known_tiles=known_tiles)
+        
+        assert {d["id"] for d in documents} == {p["id"] for p in places}
+        assert all(page == 1 for _, page in fetch.requests)
+        assert planner.reused_tiles > 0
+        
+        # 장소가 추가된 영역은 다시 모든 페이지 조회
+        new_place = {"id": "new", "x": 129.01, "y": 35.11}
+        fetch = FakeRectSearch(places + [new_place])
+        planner = QuadtreeRectPlanner(fetch, layout_path=layout_path)
+        documents = planner.search("공원", ROOT, known_tiles=known_tiles)
+        
+        assert "new" in {d["id"] for d in documents}
+    
+    def test_failed_request_keeps_stored_layout(self, tmp_path):
+        """조회 실패 영역을 결과 0개 leaf로 저장하지 않고 오류를 전달하는지 테스트"""
+        places = make_places(400)
+        layout_path = tmp_path / "layouts.json"
+        QuadtreeRectPlanner(FakeRectSearch(places), layout_path=str(layout_path)).search("공원", ROOT)
+        saved_layout = layout_path.read_text(encoding="utf-8")
+        
+        fetch = FakeRectSearch(places)
+        failing_rect = QuadtreeRectPlanner(fetch, layout_path=str(layout_path)).load_layout("공원", ROOT)[0]
+        
+        def flaky_fetch(keyword, rect, page):
+            if rect == failing_rect:
+                raise ConnectionError("일시적 오류")
+            return fetch(keyword, rect, page)
+        
+        planner = QuadtreeRectPlanner(flaky_fetch, layout_path=str(layout_path))
+        with pytest.raises(ConnectionError):
+            planner.search("공원", ROOT)
+        
+        # 저장된 분할 영역은 그대로 남아 다음 실행에서 실패한 영역을 다시 조회
+        assert layout_path.read_text(encoding="utf-8") == saved_layout
@@ -0,0 +1,71 @@
+"""
+카카오 API 응답 캐시 테스트
+"""
+from src.infrastructure.response_cache import ResponseCache
+
+
+class TestResponseCache:
+    """응답 캐시 테스트 클래스"""
+    
+    def setup_method(self):
+        """테스트 셋업"""
+        self.now = [1000.0]
+        self.response = {
+            "meta": {"total_count": 1, "is_end": True},
+            "documents": [{"id": "25922622", "place_name": "명지근린공원"}]
+        }
+    
+    def make_cache(self, path, **kwargs):
+        """가짜 시계를 사용하는 캐시 생성"""
+        return ResponseCache(str(path), clock=lambda: self.now[0], **kwargs)
+    
+    def test_set_and_get(self, tmp_path):
+        """응답 저장 및 조회 테스트 (파일에 영구 저장)"""
+        key = ResponseCache.make_key("공원", (128.8, 34.9, 129.3, 35.4), 1)
+        cache = self.make_cache(tmp_path / "cache.sqlite")
+        cache.set(key, self.response)
+        cache.close()
+        
+        # 새 연결에서도 조회 가능
+        cache = self.make_cache(tmp_path / "cache.sqlite")
+        assert cache.get(key) == self.response
+        assert cache.get(ResponseCache.make_key("공원", (128.8, 34.9, 129.3, 35.4), 2)) is None
+        assert len(cache) == 1
+    
+    def test_make_key(self):
+        """검색 조건별 캐시 키 테스트"""
+        key = ResponseCache.make_key("공원", (128.8, 34.9, 129.3, 35.4), 1)
+        assert key == ResponseCache.make_key("공원", [128.80000000001, 34.9, 129.3, 35.4], 1)
+        assert key != ResponseCache.make_key("애견카페", (128.8, 34.9, 129.3, 35.4), 1)
+        assert key != ResponseCache.make_key("공원", (128.8, 34.9, 129.05, 35.15), 1)
+    
+    def test_ttl_expiry(self, tmp_path):
+        """TTL 만료 테스트"""
+        cache = self.make_cache(tmp_path / "cache.sqlite", ttl_seconds=60)
+        cache.set("key", self.response)
+        
+        self.now[0] += 59
+        assert cache.get("key") == self.response
+        
+        self.now[0] += 2
+        assert cache.get("key") is None
+        assert len(cache) == 0
+    
+    def test_size_based_eviction(self):
+        """용량 초과 시 오래 사용하지 않은 항목부터 삭제되는지 테스트"""
+        cache = self.make_cache(":memory:", ttl_seconds=None)
+        cache.set("a", self.response)
+        entry_size = cache.total_bytes()
+        cache.max_bytes = entry_size * 2
+        
+        self.now[0] += 1
+        cache.set("b", self.response)
+        self.now[0] += 1
+        cache.get("a")  # a를 최근 사용으로 갱신
+        self.now[0] += 1
+        cache.set("c", self.response)
+        
+        assert cache.get("a") == self.response
+        assert cache.get("b") is None
+        assert cache.get("c") == self.response
+        assert cache.total_bytes() <= cache.max_bytes
@@ -0,0 +1,48 @@
+"""
+카카오맵 영역 검색 테스트
+"""
+import pytest
+import requests
+from unittest.mock import MagicMock
+
+from search_kakao_places_rect import KAKAO_KEYWORD_URL, fetch_rect_page
+from src.infrastructure.http_client import PooledHttpClient
+
+
+def make_response(status_code, payload=None):
+    """테스트용 응답 객체 생성"""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b"{}" if payload is None else payload
+    return response
+
+
+class TestFetchRectPage:
+    """영역 검색 페이지 조회 테스트 클래스"""
+    
+    def setup_method(self):
+        """테스트 셋업"""
+        self.session = MagicMock(spec=requests.Session)
+        self.client = PooledHttpClient(max_retries=2, timeout=3.0, session=self.session, sleep=lambda seconds: None)
+    
+    def test_uses_pooled_client_with_timeout(self):
+        """풀 HTTP 클라이언트로 타임아웃을 지정해 조회하는지 테스트"""
+        self.session.get.return_value = make_response(200, b'{"documents": [], "meta": {"is_end": true}}')
+        
+        result, from_network = fetch_rect_page("공원", (129.0, 35.0, 129.1, 35.1), 1, "test_api_key",
+                                               use_cache=False, http_client=self.client)
+        
+        assert from_network and result["meta"]["is_end"]
+        args, kwargs = self.session.get.call_args
+        assert args[0] == KAKAO_KEYWORD_URL
+        assert kwargs["timeout"] == 3.0
+        assert kwargs["params"]["rect"] == "129.0,35.0,129.1,35.1"
+    
+    def test_retries_then_raises_on_persistent_5xx(self):
+        """5xx 응답을 재시도한 뒤에도 실패하면 오류를 전달하는지 테스트"""
+        self.session.get.return_value = make_response(503)
+        
+        with pytest.raises(requests.HTTPError):
+            fetch_rect_page("공원", (129.0, 35.0, 129.1, 35.1), 1, "test_api_key",
+                            use_cache=False, http_client=self.client)
+        assert self.session.get.call_count == 3
@@ -1,6 +1,7 @@
 """
 행정동 shapefile 레포지토리 테스트
 """
+import os
 import pytest
 import geopandas as gpd
 import pandas as pd
@@ -176,3 +177,95 @@ class TestShapefileRepository:
         assert counts["2611010100"] == 1
         assert counts["2611010200"] == 1
         assert counts["2611010300"] == 1
+    
+    @patch('geopandas.read_file')
+    def test_get_dongs_by_points(self, mock_read_file, mock_busan_gdf):
+        """여러 위경도 좌표 일괄 행정동 조회 테스트"""
+        # 목업 설정
+        mock_read_file.return_value = mock_busan_gdf
+        
+        # 레포지토리 초기화 및 행정동 로드
+        repo = ShapefileRepository()
+        repo.load_dongs("mock_shapefile_path.shp")
+        
+        # 경계 밖 좌표를 포함한 일괄 조회
+        codes, names = repo.get_dongs_by_points(
+            [35.105, 35.105, 35.200, 35.105],
+            [129.025, 129.045, 129.200, 129.035]
+        )
+        
+        # 결과 검증 (입력 순서 유지, 경계 밖은 None)
+        assert list(codes) == ["2611010100", "2611010300", None, "2611010200"]
+        assert list(names) == ["중앙동", "대청동", None, "동광동"]
+    
+    def test_get_dongs_by_points_without_load(self):
+        """행정동 미로드 상태 일괄 조회 예외 테스트"""
+        repo = ShapefileRepository()
+        with pytest.raises(ValueError):
+            repo.get_dongs_by_points([35.105], [129.025])
+    
+    def test_load_dongs_uses_boundary_cache(self, tmp_path, mock_busan_gdf):
+        """행정동 경계 GeoParquet 캐시 테스트"""
+        pytest.importorskip("pyarrow")
+        
+        # 부산 외 지역이 섞인 테스트용 shapefile 생성
+        national_gdf = pd.concat([
+            mock_busan_gdf,
+            gpd.GeoDataFrame({
+                'ADM_CD': ['1111051500'],
+                'ADM_NM': ['청운효자동'],
+                'geometry': [Polygon([(126.9, 37.5), (127.0, 37.5), (127.0, 37.6), (126.9, 37.6)])]
+            }, crs="EPSG:4326")
+        ], ignore_index=True)
+        shapefile_path = str(tmp_path / "dongs.shp")
+        national_gdf.to_file(shapefile_path)
+        cache_dir = tmp_path / "cache"
+        
+        # 첫 로드: shapefile을 읽고 캐시 생성
+        repo = ShapefileRepository(cache_dir=str(cache_dir))
+        with patch('geopandas.read_file', wraps=gpd.read_file) as mock_read_file:
+            dongs = repo.load_dongs(shapefile_path)
+            assert mock_read_file.call_count == 1
+        assert len(dongs) == 3
+        assert len(list(cache_dir.glob("*.parquet"))) == 1
+        
+        # 두 번째 로드: shapefile 파싱 없이 캐시에서 로드
+        repo = ShapefileRepository(cache_dir=str(cache_dir))
+        with patch('geopandas.read_file', wraps=gpd.read_file) as mock_read_file:
+            dongs = repo.load_dongs(shapefile_path)
+            mock_read_file.assert_not_called()
+        assert [dong.code for dong in dongs] == ['2611010100', '2611010200', '2611010300']
+        assert repo.get_dong_by_point(latitude=35.105, longitude=129.035).name == "동광동"
+        
+        # 다른 지역 접두어는 별도 캐시 사용
+        repo = ShapefileRepository(cache_dir=str(cache_dir), region_prefix="11")
+        dongs = repo.load_dongs(shapefile_path)
+        assert [dong.code for dong in dongs] == ['1111051500']
+    
+    def test_boundary_cache_cleanup_keeps_other_sources(self, tmp_path, mock_busan_gdf):
+        """이름이 같은 다른 경로의 shapefile 캐시는 지우지 않고, 같은 shapefile의 이전 버전만 정리"""
+        pytest.importorskip("pyarrow")
+        
+        first_path = tmp_path / "a" / "dongs.shp"
+        second_path = tmp_path / "b" / "dongs.shp"
+        for path in (first_path, second_path):
+            path.parent.mkdir()
+            mock_busan_gdf.to_file(str(path))
+        cache_dir = tmp_path / "cache"
+        
+        ShapefileRepository(cache_dir=str(cache_dir)).load_dongs(str(first_path))
+        ShapefileRepository(cache_dir=str(cache_dir)).load_dongs(str(second_path))
+        cache_files = sorted(path.name for path in cache_dir.glob("*.parquet"))
+        assert len(cache_files) == 2
+        
+        # 두 번째 shapefile만 변경하면 그 shapefile의 이전 캐시만 교체됨
+        dbf_path = second_path.with_suffix(".dbf")
+        stat = os.stat(dbf_path)
+        os.utime(dbf_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        repo = ShapefileRepository(cache_dir=str(cache_dir))
+        repo.load_dongs(str(second_path))
+        new_files = sorted(path.name for path in cache_dir.glob("*.parquet"))
+        assert len(new_files) == 2
+        assert os.path.exists(repo._get_cache_path(str(first_path)))
+        assert os.path.exists(repo._get_cache_path(str(second_path)))
+        assert new_files != cache_files
@@ -0,0 +1,88 @@
+"""
+행정동별 공원 수 갱신 테스트
+"""
+import json
+
+import pandas as pd
+from shapely.geometry import box, mapping
+
+from src.domain.facility_table import FacilityTable
+from update_district_parks import count_parks_by_district, find_district_code_field, main, update_park_counts
+
+
+class TestUpdateDistrictParks:
+    """공원 행정동 매핑 및 공원 수 갱신 테스트 클래스"""
+    
+    def test_update_park_counts(self):
+        """공원 수만 교체하고 집계에 없는 행정동은 0으로 두는지 테스트"""
+        district_data = [
+            {"district": "A동", "동물병원": 3, "애견카페": 1, "공원": 9},
+            {"district": "B동", "동물병원": 1, "애견카페": 0, "공원": 2},
+        ]
+        
+        updated = update_park_counts(district_data, {"A동": 4})
+        
+        assert updated == [
+            {"district": "A동", "동물병원": 3, "애견카페": 1, "공원": 4},
+            {"district": "B동", "동물병원": 1, "애견카페": 0, "공원": 0},
+        ]
+        assert district_data[0]["공원"] == 9
+    
+    def test_main_writes_updated_outputs(self, tmp_path):
+        """공원 좌표를 행정동에 매핑해 JS/CSV 결과를 저장하는지 테스트"""
+        geojson_file = tmp_path / "emd.geojson"
+        geojson_file.write_text(json.dumps({
+            "type": "FeatureCollection",
+            "features": [
+                {"type": "Feature", "properties": {"ADM_CD": "1", "ADM_NM": "A동"},
+                 "geometry": mapping(box(129.0, 35.0, 129.1, 35.1))},
+                {"type": "Feature", "properties": {"ADM_CD": "2", "ADM_NM": "B동"},
+                 "geometry": mapping(box(129.1, 35.0, 129.2, 35.1))},
+            ]
+        }), encoding="utf-8")
+        facilities_csv = tmp_path / "facilities.csv"
+        pd.DataFrame([
+            {"name": "공원1", "x": 129.05, "y": 35.05, "type": "공원", "district": "A동"},
+            {"name": "공원2", "x": 129.15, "y": 35.05, "type": "공원", "district": "B동"},
+            {"name": "공원3", "x": 129.16, "y": 35.06, "type": "공원", "district": "B동"},
+            {"name": "병원1", "x": 129.05, "y": 35.05, "type": "동물병원", "district": "A동"},
+            {"name": "범위밖", "x": 127.0, "y": 37.5, "type": "공원", "district": "경계 외"},
+        ]).to_csv(facilities_csv, index=False)
+        district_json = tmp_path / "district_data.json"
+        district_json.write_text(json.dumps([
+            {"district": "B동", "동물병원": 2, "애견카페": 1, "공원": 0},
+            {"district": "A동", "동물병원": 1, "애견카페": 0, "공원": 0},
+        ], ensure_ascii=False), encoding="utf-8")
+        output_js = tmp_path / "updated.js"
+        output_csv = tmp_path / "updated.csv"
+        
+        updated = main(str(facilities_csv), str(geojson_file), str(district_json), str(output_js), str(output_csv))
+        
+        assert [(row["district"], row["공원"]) for row in updated] == [("B동", 2), ("A동", 1)]
+        assert output_js.read_text(encoding="utf-8").splitlines()[2] == \
+            "    { district: 'B동', hospital: 2, cafe: 1, park: 2 },"
+        assert pd.read_csv(output_csv).to_dict("records") == [
+            {"district": "B동", "hospital": 2, "cafe": 1, "park": 2},
+            {"district": "A동", "hospital": 1, "cafe": 0, "park": 1},
+        ]
+    
+    def test_same_name_districts_are_located_separately(self):
+        """이름이 같은 두 행정동의 공원을 각 행정동 코드로 구분해 매핑하는지 테스트"""
+        geojson_data = {
+            "features": [
+                {"properties": {"EMD_CD": "26350105", "EMD_KOR_NM": "송정동"},
+                 "geometry": mapping(box(129.1, 35.1, 129.2, 35.2))},
+                {"properties": {"EMD_CD": "26440102", "EMD_KOR_NM": "송정동"},
+                 "geometry": mapping(box(128.8, 35.0, 128.9, 35.1))},
+            ]
+        }
+        parks = FacilityTable(ids=None, names=["해운대 공원", "강서 공원"], types=None,
+                              lon=[129.15, 128.85], lat=[35.15, 35.05])
+        code_field = find_district_code_field(geojson_data)
+        
+        counts, located = count_parks_by_district(geojson_data, parks, "EMD_KOR_NM",
+                                                  "test-same-name", code_field)
+        
+        assert code_field == "EMD_CD"
+        assert list(located.dong_codes) == ["26350105", "26440102"]
+        assert counts.to_dict() == {"송정동": 2}
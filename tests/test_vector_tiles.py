@@ -0,0 +1,128 @@
+"""
+행정동/시설 벡터 타일 내보내기 테스트
+"""
+import gzip
+import json
+import sqlite3
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pytest
+from shapely.geometry import box
+
+from src.infrastructure.vector_tiles import (
+    DONG_LAYER, FACILITY_LAYER, build_tiles, export_vector_tiles, facilities_to_mercator,
+    thin_points, tile_bounds, tile_indices
+)
+
+
+def json_encoder(layers, bounds):
+    """테스트용 인코더: 레이어별 피처 속성과 타일 범위를 JSON으로 기록"""
+    return json.dumps({
+        "bounds": bounds,
+        "layers": {name: [feature["properties"] for feature in features] for name, features in layers.items()}
+    }, ensure_ascii=False).encode("utf-8")
+
+
+@pytest.fixture
+def dongs_gdf():
+    return gpd.GeoDataFrame(
+        {"ADM_CD": ["1", "2"], "ADM_NM": ["A동", "B동"]},
+        geometry=[box(129.0, 35.0, 129.1, 35.1), box(129.1, 35.0, 129.2, 35.1)],
+        crs="EPSG:4326"
+    )
+
+
+@pytest.fixture
+def facilities_df():
+    return pd.DataFrame([
+        {"name": "병원1", "x": 129.05, "y": 35.05, "type": "동물병원", "district": "A동"},
+        {"name": "병원2", "x": 129.0501, "y": 35.0501, "type": "동물병원", "district": "A동"},
+        {"name": "공원1", "x": 129.0501, "y": 35.0501, "type": "공원", "district": "A동"},
+        {"name": "카페1", "x": 129.15, "y": 35.05, "type": "애견카페", "district": None},
+        {"name": "좌표없음", "x": None, "y": 35.0, "type": "공원", "district": "B동"},
+    ])
+
+
+class TestVectorTiles:
+    """벡터 타일 내보내기 테스트 클래스"""
+    
+    def test_tile_math(self):
+        """타일 범위와 좌표 -> 타일 인덱스 변환이 서로 맞는지 테스트"""
+        minx, miny, maxx, maxy = tile_bounds(10, 874, 403)
+        xs, ys = tile_indices(np.array([(minx + maxx) / 2]), np.array([(miny + maxy) / 2]), 10)
+        
+        assert (xs[0], ys[0]) == (874, 403)
+        assert tile_bounds(0, 0, 0) == pytest.approx((-20037508.34, -20037508.34, 20037508.34, 20037508.34))
+    
+    def test_thin_points_by_group(self):
+        """같은 격자 칸의 점은 그룹별로 하나만 남기는지 테스트"""
+        kept = thin_points(np.array([1.0, 2.0, 3.0, 150.0]), np.array([1.0, 2.0, 3.0, 1.0]), 100.0,
+                           groups=np.array([0, 0, 1, 0]))
+        
+        assert kept.tolist() == [0, 2, 3]
+    
+    def test_build_tiles_drops_and_clips(self, dongs_gdf, facilities_df):
+        """낮은 줌에서는 겹치는 시설을 줄이고, 최대 줌에서는 모든 시설을 타일에 넣는지 테스트"""
+        tiles = list(build_tiles(dongs_gdf, facilities_to_mercator(facilities_df),
+                                 minzoom=8, maxzoom=14, encoder=json_encoder))
+        by_zoom = {}
+        for z, x, y, data in tiles:
+            by_zoom.setdefault(z, []).append(json.loads(data))
+        
+        def names(zoom, layer):
+            return sorted(p.get("name") or p.get("ADM_NM")
+                          for tile in by_zoom[zoom] for p in tile["layers"].get(layer, []))
+        
+        assert sorted(by_zoom) == list(range(8, 15))
+        assert names(8, FACILITY_LAYER) == ["공원1", "병원1", "카페1"]
+        assert names(14, FACILITY_LAYER) == ["공원1", "병원1", "병원2", "카페1"]
+        assert {"A동", "B동"} <= set(names(14, DONG_LAYER))
+        assert len(by_zoom[14]) > len(by_zoom[8])
+    
+    def test_export_mbtiles(self, dongs_gdf, facilities_df, tmp_path):
+        """MBTiles에 gzip 압축 타일과 TMS y 좌표, 메타데이터를 저장하는지 테스트"""
+        path = tmp_path / "tiles.mbtiles"
+        
+        count = export_vector_tiles(dongs_gdf, facilities_df, str(path), minzoom=9, maxzoom=10, encoder=json_encoder)
+        
+        conn = sqlite3.connect(path)
+        metadata = dict(conn.execute("SELECT name, value FROM metadata"))
+        rows = conn.execute("SELECT zoom_level, tile_column, tile_row, tile_data FROM tiles").fetchall()
+        conn.close()
+        assert count == len(rows) > 0
+        assert metadata["format"] == "pbf" and metadata["minzoom"] == "9"
+        assert [layer["id"] for layer in json.loads(metadata["json"])["vector_layers"]] == [DONG_LAYER, FACILITY_LAYER]
+        for z, x, tms_y, data in rows:
+            tile = json.loads(gzip.decompress(data))
+            assert tuple(tile["bounds"]) == pytest.approx(tile_bounds(z, x, (2 ** z - 1) - tms_y))
+    
+    def test_export_directory(self, dongs_gdf, facilities_df, tmp_path):
+        """z/x/y.pbf 디렉토리 피라미드로 저장하는지 테스트"""
+        count = export_vector_tiles(dongs_gdf, facilities_df, str(tmp_path / "tiles"),
+                                    minzoom=8, maxzoom=8, encoder=json_encoder)
+        
+        files = list((tmp_path / "tiles" / "8").glob("*/*.pbf"))
+        assert count == len(files) > 0
+        assert (tmp_path / "tiles" / "metadata.json").exists()
+    
+    def test_outlying_facility_does_not_widen_tile_range(self, dongs_gdf, facilities_df, monkeypatch):
+        """좌표가 (0, 0)인 시설이 있어도 행정동 범위와 그 시설의 타일만 훑는지 테스트"""
+        from src.infrastructure import vector_tiles
+        visited = []
+        original_tile_bounds = vector_tiles.tile_bounds
+        monkeypatch.setattr(vector_tiles, "tile_bounds",
+                            lambda z, x, y: visited.append((z, x, y)) or original_tile_bounds(z, x, y))
+        outlier = pd.DataFrame([{"name": "경계외", "x": 0.0, "y": 0.0, "type": "공원", "district": "경계 외"}])
+        base = list(build_tiles(dongs_gdf, facilities_to_mercator(facilities_df),
+                                minzoom=12, maxzoom=12, encoder=json_encoder))
+        base_visited = len(visited)
+        visited.clear()
+        
+        tiles = list(build_tiles(dongs_gdf, facilities_to_mercator(pd.concat([facilities_df, outlier])),
+                                 minzoom=12, maxzoom=12, encoder=json_encoder))
+        
+        assert len(visited) == base_visited + 1
+        assert len(tiles) == len(base) + 1
+        assert (12, 2048, 2048) in {(z, x, y) for z, x, y, _ in tiles}
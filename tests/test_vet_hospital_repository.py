@@ -0,0 +1,110 @@
+"""
+파일 기반 동물병원 레포지토리 테스트
+"""
+import json
+import os
+
+import geopandas as gpd
+import pandas as pd
+import pytest
+
+from src.domain.entity import VetHospital
+from src.infrastructure.vet_hospital_repository import FileVetHospitalRepository
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+@pytest.fixture
+def hospitals():
+    """테스트용 동물병원 목록"""
+    return [
+        VetHospital(id="1", name="행복한동물병원", address="부산광역시 중구", latitude=35.105, longitude=129.025,
+                    phone="051-123-4567", dong_code="2611010100", dong_name="중앙동"),
+        VetHospital(id="2", name="사랑동물병원", address="부산광역시 동구", latitude=35.12, longitude=129.04)
+    ]
+
+
+class TestFileVetHospitalRepository:
+    """파일 기반 동물병원 레포지토리 테스트 클래스"""
+    
+    def test_save_default_formats(self, tmp_path, hospitals):
+        """기본 형식(JSON, CSV, GeoJSON) 저장 및 다시 읽기 테스트"""
+        repo = FileVetHospitalRepository(data_dir=str(tmp_path))
+        repo.save_hospitals(hospitals)
+        
+        with open(tmp_path / "vet_hospitals.json", encoding="utf-8") as f:
+            assert json.load(f) == VetHospital.to_records(hospitals)
+        assert list(pd.read_csv(tmp_path / "vet_hospitals.csv")["name"]) == ["행복한동물병원", "사랑동물병원"]
+        assert len(gpd.read_file(tmp_path / "vet_hospitals.geojson")) == 2
+        assert os.path.exists(tmp_path / "vet_hospitals.parquet") == (pyarrow is not None)
+        
+        reloaded = FileVetHospitalRepository(data_dir=str(tmp_path))
+        assert reloaded.get_hospitals() == hospitals
+        assert reloaded.get_hospitals_count_by_dong() == {"2611010100": 1}
+    
+    def test_save_selected_formats(self, tmp_path, hospitals):
+        """선택한 형식만 저장 (GeoParquet 포함) 테스트"""
+        pytest.importorskip("pyarrow")
+        repo = FileVetHospitalRepository(data_dir=str(tmp_path), formats=("csv",))
+        repo.save_hospitals(hospitals, formats=["json", "geoparquet"])
+        
+        assert sorted(os.listdir(tmp_path)) == ["vet_hospitals.json", "vet_hospitals.parquet"]
+        gdf = gpd.read_parquet(tmp_path / "vet_hospitals.parquet")
+        assert list(gdf["id"]) == ["1", "2"]
+        assert gdf.geometry.iloc[0].x == pytest.approx(129.025)
+    
+    def test_unknown_format(self, tmp_path, hospitals):
+        """지원하지 않는 형식 오류 테스트"""
+        with pytest.raises(ValueError):
+            FileVetHospitalRepository(data_dir=str(tmp_path), formats=("xlsx",))
+        with pytest.raises(ValueError):
+            FileVetHospitalRepository(data_dir=str(tmp_path)).save_hospitals(hospitals, formats=["shp"])
+    
+    def test_custom_writer_error_is_reported(self, tmp_path, hospitals):
+        """동시 저장 중 한 형식이 실패하면 다른 형식은 저장하고 오류를 알리는지 테스트"""
+        def broken_writer(frame, path):
+            raise OSError("disk full")
+        
+        repo = FileVetHospitalRepository(data_dir=str(tmp_path), formats=("csv", "broken"), writers={
+            "csv": ("vet_hospitals.csv", lambda frame, path: frame.to_csv(path, index=False)),
+            "broken": ("broken.bin", broken_writer)
+        })
+        with pytest.raises(RuntimeError, match="broken"):
+            repo.save_hospitals(hospitals)
+        assert os.path.exists(tmp_path / "vet_hospitals.csv")
+    
+    def test_dong_index_and_memoized_counts(self, tmp_path, hospitals):
+        """행정동 인덱스 조회와 저장 시 집계 결과 무효화 테스트"""
+        repo = FileVetHospitalRepository(data_dir=str(tmp_path), formats=("json",))
+        repo.save_hospitals(hospitals)
+        
+        assert repo.get_hospitals_by_dong("2611010100") == [hospitals[0]]
+        assert repo.get_hospitals_by_dong("없는코드") == []
+        counts = repo.get_hospitals_count_by_dong()
+        assert counts == {"2611010100": 1}
+        counts["2611010100"] = 100  # 반환값을 바꿔도 내부 집계는 그대로
+        assert repo.get_hospitals_count_by_dong() == {"2611010100": 1}
+        
+        moved = VetHospital(id="3", name="새동물병원", address="부산광역시 동구", latitude=35.13,
+                            longitude=129.05, dong_code="2617051000", dong_name="초량1동")
+        repo.save_hospitals(hospitals + [moved])
+        assert repo.get_hospitals_count_by_dong() == {"2611010100": 1, "2617051000": 1}
+        assert repo.get_hospitals_by_dong("2617051000") == [moved]
+    
+    def test_lazy_columnar_load(self, tmp_path, hospitals):
+        """GeoParquet에서 개수는 열만 읽고, 병원 목록은 배치 단위로 읽는지 테스트"""
+        pytest.importorskip("pyarrow")
+        FileVetHospitalRepository(data_dir=str(tmp_path), formats=("geoparquet",)).save_hospitals(hospitals)
+        
+        repo = FileVetHospitalRepository(data_dir=str(tmp_path))
+        assert repo.get_hospitals_count_by_dong() == {"2611010100": 1}
+        assert not repo.hospitals  # 개수 집계만으로는 병원 객체를 만들지 않음
+        assert list(repo.iter_hospitals(batch_size=1)) == hospitals
+        assert repo.get_hospitals_by_dong("2611010100") == [hospitals[0]]
+        
+        # JSON이 더 최신이면 JSON을 사용
+        FileVetHospitalRepository(data_dir=str(tmp_path), formats=("json",)).save_hospitals(hospitals[:1])
+        assert FileVetHospitalRepository(data_dir=str(tmp_path)).get_hospitals() == hospitals[:1]
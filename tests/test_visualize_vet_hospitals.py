@@ -0,0 +1,76 @@
+"""
+동물병원 시각화 유즈케이스 테스트
+"""
+import os
+from unittest.mock import Mock
+
+import geopandas as gpd
+import pytest
+from shapely.geometry import box
+
+from src.domain.entity import AdministrativeDong, VetHospital
+from src.infrastructure.vet_hospital_repository import InMemoryVetHospitalRepository
+from src.usecase.visualize_vet_hospitals import VisualizeVetHospitalsUseCase
+
+
+@pytest.fixture
+def usecase(tmp_path):
+    """두 행정동과 동물병원 세 곳으로 구성한 시각화 유즈케이스"""
+    dongs_gdf = gpd.GeoDataFrame(
+        {"ADM_CD": ["2600000001", "2600000002"], "ADM_NM": ["A동", "B동"]},
+        geometry=[box(129.0, 35.0, 129.1, 35.1), box(129.1, 35.0, 129.2, 35.1)],
+        crs="EPSG:4326"
+    )
+    dong_repository = Mock()
+    dong_repository.get_dongs_geodataframe.return_value = dongs_gdf
+    dong_repository.get_all_dongs.return_value = [
+        AdministrativeDong(code=code, name=name, geometry=geometry)
+        for code, name, geometry in zip(dongs_gdf["ADM_CD"], dongs_gdf["ADM_NM"], dongs_gdf.geometry)
+    ]
+    
+    vet_hospital_repository = InMemoryVetHospitalRepository()
+    vet_hospital_repository.save_hospitals([
+        VetHospital(id="1", name="병원1", address="부산", latitude=35.05, longitude=129.05,
+                    dong_code="2600000001", dong_name="A동"),
+        VetHospital(id="2", name="병원2", address="부산", latitude=35.05, longitude=129.15,
+                    dong_code="2600000002", dong_name="B동"),
+        VetHospital(id="3", name="병원3", address="부산", latitude=35.06, longitude=129.16,
+                    dong_code="2600000002", dong_name="B동"),
+    ])
+    return VisualizeVetHospitalsUseCase(vet_hospital_repository, dong_repository, output_dir=str(tmp_path))
+
+
+class TestVisualizeVetHospitalsUseCase:
+    """시각화 유즈케이스 테스트 클래스"""
+    
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_create_all_visualizations(self, usecase, tmp_path, parallel):
+        """순차/병렬 렌더링 모두 같은 파일 목록을 만드는지 테스트"""
+        output_files = usecase.create_all_visualizations(parallel=parallel, max_workers=2)
+        
+        assert [os.path.basename(path) for path in output_files] == [
+            "vet_hospitals_choropleth.png",
+            "vet_hospitals_points.png",
+            "top_dongs_bar_chart.png",
+            "top_dongs_bar_chart.svg",
+        ]
+        for path in output_files:
+            assert os.path.getsize(path) > 0
+        # 레포지토리의 행정동 GeoDataFrame은 변경하지 않음
+        assert "vet_count" not in usecase.dong_repository.get_dongs_geodataframe().columns
+    
+    def test_bar_chart_rendered_once(self, usecase, tmp_path, monkeypatch):
+        """막대 그래프를 한 번만 그려 PNG와 SVG로 저장하는지 테스트"""
+        import matplotlib.pyplot as plt
+        created = []
+        original_subplots = plt.subplots
+        
+        def counting_subplots(*args, **kwargs):
+            created.append(kwargs.get("figsize"))
+            return original_subplots(*args, **kwargs)
+        monkeypatch.setattr(plt, "subplots", counting_subplots)
+        
+        usecase.create_top_dongs_bar_chart(save_path=str(tmp_path / "bar.png"))
+        
+        assert len(created) == 1
+        assert (tmp_path / "bar.png").exists() and (tmp_path / "bar.svg").exists()
@@ -1,174 +1,156 @@
-import pandas as pd
+"""
+행정동별 공원 수 갱신
+- 필터링된 시설 CSV의 공원 좌표를 STRtree + prepared 폴리곤으로 한 번에 행정동에 매핑
+- 기존 행정동별 시설 데이터는 output/district_data.json(구조화된 원본)에서 읽어 공원 수만 교체
+"""
 import json
-import folium
-from shapely.geometry import Point, Polygon
-import geopandas as gpd
 import os
 
-# 필터링된 시설 데이터 읽기
-df = pd.read_csv('output/facilities_with_district_filtered.csv')
-
-# 부산 행정구역 경계 GeoJSON 파일이 있는지 확인
-if not os.path.exists('data/busan_emd_wgs84.geojson'):
-    print("부산 행정구역 경계 파일이 없습니다. 먼저 행정구역 경계 파일을 준비해주세요.")
-    exit(1)
-
-# 부산 행정구역 경계 데이터 로드
-busan_districts = gpd.read_file('data/busan_emd_wgs84.geojson')
-# 행정동 이름 필드 확인
-print(f"GeoJSON 파일 컬럼: {busan_districts.columns}")
-
-# 공원 데이터만 필터링
-parks_df = df[df['type'] == '공원'].copy()
-
-# 부산 지역으로 필터링
-busan_lat_min, busan_lat_max = 34.8, 35.4
-busan_lon_min, busan_lon_max = 128.7, 129.4
-
-parks_df = parks_df[
-    (parks_df['y'] >= busan_lat_min) & 
-    (parks_df['y'] <= busan_lat_max) & 
-    (parks_df['x'] >= busan_lon_min) & 
-    (parks_df['x'] <= busan_lon_max)
-]
-
-print(f"부산 좌표 범위내 공원 수: {len(parks_df)}개")
-
-# 좌표로 행정동 매핑 함수
-def get_district(point, busan_districts):
-    for idx, district in busan_districts.iterrows():
-        polygon = district['geometry']
-        if polygon.contains(point):
-            # 행정동 이름 필드가 EMD_NM, EMD_KOR_NM, ADM_NM 등 다양할 수 있으므로 확인
-            for field in ['EMD_KOR_NM', 'EMD_NM', 'adm_nm', 'ADM_NM', 'name']:
-                if field in district:
-                    return district[field]
-    return "미확인"
-
-# 공원 좌표를 행정동에 매핑
-result = []
-parks_with_districts = []
-
-# 행정동 이름 필드 찾기
-emd_field = None
-for field in ['EMD_KOR_NM', 'EMD_NM', 'adm_nm', 'ADM_NM', 'name']:
-    if field in busan_districts.columns:
-        emd_field = field
-        print(f"행정동 이름 필드: {emd_field}")
-        break
-
-if not emd_field:
-    print("행정동 이름 필드를 찾을 수 없습니다.")
-    exit(1)
-
-# 기존 district_data.js 파일 불러오기
-with open('output/district_data.js', 'r', encoding='utf-8') as f:
-    content = f.read()
-    
-# 필요한 부분만 추출
-import re
-district_data_str = re.search(r'const districtData = \[([\s\S]*?)\];', content).group(1)
-district_data_lines = [line.strip() for line in district_data_str.split('\n') if line.strip()]
-
-# JavaScript 형식을 Python 딕셔너리로 변환
-district_data = []
-for line in district_data_lines:
-    # 쉼표 제거
-    if line.endswith(','):
-        line = line[:-1]
-    
-    # 정규식으로 데이터 추출
-    match = re.match(r'\{ district: \'(.*?)\', hospital: (\d+), cafe: (\d+), park: (\d+) \}', line)
-    if match:
-        district, hospital, cafe, park = match.groups()
-        district_data.append({
-            'district': district,
-            'hospital': int(hospital),
-            'cafe': int(cafe),
-            'park': int(park)
-        })
-
-# 행정동 이름 목록
-district_names = [d['district'] for d in district_data]
-print(f"기존 데이터의 행정동 수: {len(district_names)}개")
-
-# 공원 좌표를 Shapely Point 객체로 변환하여 행정동 찾기
-for idx, park in parks_df.iterrows():
-    point = Point(park['x'], park['y'])
-    for _, district in busan_districts.iterrows():
-        if district['geometry'].contains(point):
-            # 행정동 이름 필드 찾기
-            district_name = None
-            for field in ['EMD_KOR_NM', 'EMD_NM', 'adm_nm', 'ADM_NM', 'name']:
-                if field in district and district[field]:
-                    district_name = district[field]
-                    break
-            
-            if not district_name:
-                continue
-                
-            parks_with_districts.append({
-                'name': park['name'],
-                'x': park['x'],
-                'y': park['y'],
-                'district': district_name
-            })
-            # 이미 결과에 있는 행정동인지 확인
-            found = False
-            for r in result:
-                if r['district'] == district_name:
-                    r['count'] += 1
-                    found = True
-                    break
-            if not found:
-                result.append({'district': district_name, 'count': 1})
-            break
-
-print(f"행정동별로 분류된 공원 수: {len(parks_with_districts)}개")
-print(f"공원이 있는 행정동 수: {len(result)}개")
-
-# 결과를 행정동별로 정렬
-result.sort(key=lambda x: x['count'], reverse=True)
-
-# 행정동별 공원 수 출력
-print("\n행정동별 공원 수 (상위 10개):")
-for i, item in enumerate(sorted(result, key=lambda x: x['count'], reverse=True)[:10]):
-    print(f"{i+1}. {item['district']}: {item['count']}개")
-
-# 기존 district_data에 공원 정보 업데이트
-updated_district_data = []
-for d in district_data:
-    district_name = d['district']
-    park_count = 0
-    
-    # 결과 데이터에서 해당 행정동의 공원 수 찾기
-    for r in result:
-        if r['district'] == district_name:
-            park_count = r['count']
-            break
-    
-    updated_district_data.append({
-        'district': district_name,
-        'hospital': d['hospital'],
-        'cafe': d['cafe'],
-        'park': park_count
-    })
-
-# JavaScript 파일로 저장
-js_array = []
-for row in updated_district_data:
-    js_array.append(f"    {{ district: '{row['district']}', hospital: {row['hospital']}, cafe: {row['cafe']}, park: {row['park']} }}")
-
-with open('output/updated_district_data.js', 'w', encoding='utf-8') as f:
-    f.write("// 행정동별 시설 데이터 (필터링된 데이터 기준, 공원 데이터 정확히 매핑)\n")
-    f.write("const districtData = [\n")
-    f.write(",\n".join(js_array))
-    f.write("\n];")
-
-print(f"\n업데이트된 districtData가 output/updated_district_data.js 파일에 저장되었습니다.")
-
-# CSV 파일로도 저장
-df_result = pd.DataFrame(updated_district_data)
-df_result.to_csv('output/district_facility_counts_updated.csv', index=False)
-
-print(f"업데이트된 데이터가 output/district_facility_counts_updated.csv 파일에도 저장되었습니다.")
+import pandas as pd
+
+from count_facilities_by_district import load_geojson, locate_districts, write_district_data_js
+from src.domain.facility_table import FacilityTable
+
+# 행정동 이름 필드 후보 (경계 데이터마다 다름, 앞에 있을수록 우선)
+DISTRICT_NAME_FIELDS = ['EMD_KOR_NM', 'EMD_NM', 'adm_nm', 'ADM_NM', 'name']
+
+# 행정동 코드 필드 후보 (이름이 같은 행정동을 구분하는 고유 키)
+DISTRICT_CODE_FIELDS = ['EMD_CD', 'adm_cd', 'ADM_CD', 'adm_cd2', 'code']
+
+# 부산 좌표 범위 (경도 최소, 위도 최소, 경도 최대, 위도 최대)
+BUSAN_BOUNDS = (128.7, 34.8, 129.4, 35.4)
+
+
+def find_district_name_field(geojson_data):
+    """GeoJSON 속성에서 행정동 이름 필드 찾기 (없으면 None)"""
+    fields = set()
+    for feature in geojson_data['features']:
+        fields.update(feature['properties'])
+    return next((field for field in DISTRICT_NAME_FIELDS if field in fields), None)
+
+
+def find_district_code_field(geojson_data):
+    """GeoJSON 속성에서 모든 행정동에 있는 코드 필드 찾기 (없으면 None)"""
+    features = geojson_data['features']
+    return next((field for field in DISTRICT_CODE_FIELDS
+                 if features and all(feature['properties'].get(field) is not None for feature in features)), None)
+
+
+def load_parks(facilities_csv='output/facilities_with_district_filtered.csv', bounds=BUSAN_BOUNDS):
+    """
+    시설 CSV에서 좌표 범위 안의 공원만 시설 테이블로 로드
+
+    Args:
+        facilities_csv: name, x, y, type 열을 포함한 시설 CSV
+        bounds: (경도 최소, 위도 최소, 경도 최대, 위도 최대)
+
+    Returns:
+        공원 시설 테이블 (CSV 순서)
+    """
+    df = pd.read_csv(facilities_csv)
+    min_x, min_y, max_x, max_y = bounds
+    parks_df = df[
+        (df['type'] == '공원') &
+        df['x'].between(min_x, max_x) &
+        df['y'].between(min_y, max_y)
+    ]
+    return FacilityTable.from_dataframe(parks_df, '공원', lon_col='x', lat_col='y', name_col='name')
+
+
+def count_parks_by_district(geojson_data, parks, district_name_field,
+                            geometry_source=None, district_code_field=None):
+    """
+    공원이 속한 행정동을 일괄 조회해 행정동별 공원 수 계산
+
+    Args:
+        geojson_data: 행정동 경계 GeoJSON 데이터
+        parks: 공원 시설 테이블
+        district_name_field: GeoJSON에서 행정동 이름이 저장된 필드명
+        geometry_source: prepared 폴리곤 캐시를 공유할 경계 데이터 출처 (없으면 기본 캐시)
+        district_code_field: 행정동별 고유 코드 필드명 (없으면 GeoJSON 순서 인덱스로 구분)
+
+    Returns:
+        (행정동별 공원 수 Series (많은 순), 행정동이 확인된 공원 테이블)
+    """
+    # 이름이 같은 행정동(예: 해운대구/강서구 송정동)을 하나로 합치지 않도록 행정동마다 고유한 키로 조회
+    located = locate_districts(geojson_data, parks, district_name_field, geometry_source,
+                               district_code_field=district_code_field)
+    names = pd.Series(located.dong_names, dtype=object)
+    located = located.take((names.notna() & (names != '')).to_numpy())
+    counts = pd.Series(located.dong_names, dtype=object).value_counts()
+    return counts, located
+
+
+def load_district_data(district_json='output/district_data.json'):
+    """generate_district_data.py가 저장한 행정동별 시설 데이터 로드"""
+    with open(district_json, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def update_park_counts(district_data, park_counts):
+    """
+    행정동별 시설 데이터의 공원 수만 새 집계로 교체 (순서 유지, 집계에 없는 행정동은 0)
+
+    Args:
+        district_data: district, 동물병원, 애견카페, 공원 필드를 가진 dict 목록
+        park_counts: 행정동 이름 -> 공원 수 (dict 또는 Series)
+
+    Returns:
+        공원 수가 갱신된 새 dict 목록
+    """
+    park_counts = dict(park_counts)
+    return [{**row, '공원': int(park_counts.get(row['district'], 0))} for row in district_data]
+
+
+def main(facilities_csv='output/facilities_with_district_filtered.csv',
+         geojson_file='data/busan_emd_wgs84.geojson',
+         district_json='output/district_data.json',
+         output_js='output/updated_district_data.js',
+         output_csv='output/district_facility_counts_updated.csv'):
+    # 부산 행정구역 경계 GeoJSON 파일이 있는지 확인
+    if not os.path.exists(geojson_file):
+        print("부산 행정구역 경계 파일이 없습니다. 먼저 행정구역 경계 파일을 준비해주세요.")
+        return None
+
+    geojson_data = load_geojson(geojson_file)
+    district_name_field = find_district_name_field(geojson_data)
+    if not district_name_field:
+        print("행정동 이름 필드를 찾을 수 없습니다.")
+        return None
+    district_code_field = find_district_code_field(geojson_data)
+    print(f"행정동 이름 필드: {district_name_field}, 코드 필드: {district_code_field or '없음 (순서 인덱스 사용)'}")
+
+    parks = load_parks(facilities_csv)
+    print(f"부산 좌표 범위내 공원 수: {len(parks)}개")
+
+    park_counts, located = count_parks_by_district(geojson_data, parks, district_name_field, geojson_file,
+                                                    district_code_field)
+    print(f"행정동별로 분류된 공원 수: {len(located)}개")
+    print(f"공원이 있는 행정동 수: {len(park_counts)}개")
+
+    # 행정동별 공원 수 출력
+    print("\n행정동별 공원 수 (상위 10개):")
+    for i, (district, count) in enumerate(park_counts.head(10).items()):
+        print(f"{i+1}. {district}: {count}개")
+
+    # 기존 행정동별 시설 데이터에 공원 정보 업데이트
+    district_data = load_district_data(district_json)
+    print(f"기존 데이터의 행정동 수: {len(district_data)}개")
+    updated_district_data = update_park_counts(district_data, park_counts)
+
+    # JavaScript 파일로 저장
+    write_district_data_js(updated_district_data, output_js,
+                           comment='행정동별 시설 데이터 (필터링된 데이터 기준, 공원 데이터 정확히 매핑)')
+    print(f"\n업데이트된 districtData가 {output_js} 파일에 저장되었습니다.")
+
+    # CSV 파일로도 저장
+    df_result = pd.DataFrame(updated_district_data, columns=['district', '동물병원', '애견카페', '공원'])
+    df_result.columns = ['district', 'hospital', 'cafe', 'park']
+    df_result.to_csv(output_csv, index=False)
+    print(f"업데이트된 데이터가 {output_csv} 파일에도 저장되었습니다.")
+
+    return updated_district_data
+
+
+if __name__ == "__main__":
+    main()
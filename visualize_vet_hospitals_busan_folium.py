@@ -2,32 +2,31 @@
 부산 동물병원 위치를 folium으로 지도에 빨간 점으로 시각화 (웹 브라우저에서 확인)
 - 입력: data/vet_hospitals_busan.csv
 - 출력: output/vet_hospitals_busan_map.html
+- 렌더링 모드 (--render): fast(기본, 시설 유형별 GeoJSON 레이어 + canvas), cluster(FastMarkerCluster), markers(시설별 마커)
 """
+import argparse
 import os
 import pandas as pd
 import folium
 import re
 import json
+
+from src.infrastructure.boundaries import prepare_boundaries, select_boundary
+from src.infrastructure.coordinates import normalize_coordinate_columns
+from src.infrastructure.folium_layers import RENDER_MODES, create_map, facility_layer
+
+parser = argparse.ArgumentParser(description="부산 동물병원/애견카페/공원 folium 지도 생성")
+parser.add_argument("--render", choices=RENDER_MODES, default='fast',
+                    help="시설 마커 렌더링 모드 (fast: GeoJSON+canvas, cluster: 마커 클러스터, markers: 시설별 마커)")
+args = parser.parse_args()
+render_mode = args.render
+
 # 1. 데이터 로드
 csv_path = "data/vet_hospitals_busan.csv"
 df = pd.read_csv(csv_path)
 
-# 2. 좌표 결측치 및 이상치 제거
-x_col = '좌표정보x(epsg5174)'
-y_col = '좌표정보y(epsg5174)'
-df = df[df[x_col].notnull() & df[y_col].notnull()]
-df = df[(df[x_col] != '') & (df[y_col] != '')]
-
-# 3. 좌표를 float로 변환 (문자열일 수 있음)
-df[x_col] = df[x_col].astype(float)
-df[y_col] = df[y_col].astype(float)
-
-# 4. UTM-K(EPSG:5174) → WGS84(경위도) 변환 함수
-from pyproj import Transformer
-transformer = Transformer.from_crs("epsg:5174", "epsg:4326", always_xy=True)
-def to_latlng(x, y):
-    lng, lat = transformer.transform(x, y)
-    return lat, lng
+# 2~4. 좌표 결측치/이상치 제거 및 UTM-K(EPSG:5174) → WGS84(경위도) 열 단위 일괄 변환
+df = normalize_coordinate_columns(df)
 
 # 부산시 경계 좌표 (WGS84)
 busan_lat_min = 34.8
@@ -116,8 +115,6 @@ def filter_park_only(places, strict_category=False):
     
     return filtered
 
-df['lat'], df['lng'] = zip(*df.apply(lambda row: to_latlng(row[x_col], row[y_col]), axis=1))
-
 # 5. 부산 지역 좌표 범위로 동물병원 데이터 필터링
 print(f"동물병원 데이터 좌표 변환 후: {len(df)}개")
 original_vet_count = len(df)
@@ -137,13 +134,17 @@ print(f"부산 좌표 범위 및 유효한 좌표로 필터링된 동물병원 
 map_center = [35.1796, 129.0756]
 # 부산 대략적 영역: 북서(34.85, 128.8), 남동(35.35, 129.3)
 busan_bounds = [[34.85, 128.8], [35.35, 129.3]]
-m = folium.Map(location=map_center, zoom_start=11, tiles='cartodbpositron', max_bounds=True)
+zoom_start = 11
+m = create_map(map_center, zoom_start, mode=render_mode, tiles='cartodbpositron', max_bounds=True)
 m.fit_bounds(busan_bounds)
 
 # 6. 부산시 행정동(emd) geojson overlay (로컬 파일 사용)
 # 원래 파일은 EPSG:5186 좌표계였고, transform_geojson_crs.py 로 변환한 WGS84 파일 사용
-import json
-with open('data/busan_emd_wgs84.geojson', encoding='utf-8') as f:
+# 원본 해상도 대신 줌 레벨에 맞게 공유 경계를 단순화한 경량 파일을 사용 (원본이 바뀌면 다시 생성)
+boundary_files = prepare_boundaries('data/busan_emd_wgs84.geojson')
+boundary_path = select_boundary(boundary_files, zoom_start + 2)  # 처음 화면보다 두 단계 확대까지 선명하게
+print(f"행정동 경계 파일: {boundary_path}")
+with open(boundary_path, encoding='utf-8') as f:
     busan_emd_data = json.load(f)
 
 # 행정동 경계를 FeatureGroup으로 묶음 (토글 가능하게)
@@ -213,25 +214,20 @@ name_group.add_to(m)
 
 # 중복 코드 제거 - 이미 name_group에 이름이 추가되었음
 
-# 8. 병원 위치 빨간 점으로 표시 (팝업 가로) - 레이어 컨트롤용 FeatureGroup 사용
-# 동물병원 레이어를 위한 FeatureGroup 생성
-hospital_group = folium.FeatureGroup(name='동물병원', show=True)
+# 8. 병원 위치 빨간 점으로 표시 (팝업 가로) - 레이어 컨트롤에서 켜고 끌 수 있는 레이어 하나로 추가
+# 팝업 템플릿의 {필드}는 시설 속성 값으로 채워짐 (fast/cluster 모드는 마커를 클릭할 때 생성)
+HOSPITAL_POPUP = '<span style="white-space:nowrap">{사업장명}</span>'
+FACILITY_POPUP = '''
+            <div style="width:200px">
+                <h4 style="margin-bottom:5px">{name}</h4>
+                <div style="font-size:0.9em; color:#666;">📍 {district} 소재</div>
+            </div>
+        '''
 
-for _, row in df.iterrows():
-    name = row.get('사업장명', '')
-    popup_html = f'<span style="white-space:nowrap">{name}</span>'
-    folium.CircleMarker(
-        location=[row['lat'], row['lng']],
-        radius=4,
-        color='red',
-        fill=True,
-        fill_color='red',
-        fill_opacity=0.7,
-        popup=folium.Popup(popup_html, max_width=200)
-    ).add_to(hospital_group)
-    
-# FeatureGroup을 지도에 추가
-hospital_group.add_to(m)
+facility_layer(
+    df, '동물병원', 'red', HOSPITAL_POPUP, ['사업장명'],
+    radius=4, popup_max_width=200, show=True, mode=render_mode
+).add_to(m)
 
 # 9. 통합 데이터(CSV)에서 모든 시설 정보 불러오기
 # 필터링이 적용된 시설 데이터 로드 (단일 파일에서 모든 시설 정보 로드)
@@ -304,70 +300,18 @@ try:
     print(f'- 공원: {len(parks_df)}개')
     print(f'- 총 시설: {len(dog_cafes_df) + len(parks_df) + len(animal_hospitals_df)}개')
     
-    # 애견카페 마커들을 FeatureGroup으로 묶음
-    dog_cafe_group = folium.FeatureGroup(name='애견카페', show=False)
-    
-    # 카페 마커 추가
-    for _, cafe in dog_cafes_df.iterrows():
-        name = cafe.get('name', '')
-        x = float(cafe.get('x', 0))  # 경도
-        y = float(cafe.get('y', 0))  # 위도
-        district = cafe.get('district', '')
-        
-        # 팝업 내용 구성
-        popup_html = f'''
-            <div style="width:200px">
-                <h4 style="margin-bottom:5px">{name}</h4>
-                <div style="font-size:0.9em; color:#666;">📍 {district} 소재</div>
-            </div>
-        '''
-        
-        # 파란색 원형 마커 추가
-        folium.CircleMarker(
-            location=[y, x],
-            radius=5,
-            color='blue',
-            fill=True,
-            fill_color='blue',
-            fill_opacity=0.7,
-            popup=folium.Popup(popup_html, max_width=250)
-        ).add_to(dog_cafe_group)
-    
-    # 애견카페 그룹을 지도에 추가
-    dog_cafe_group.add_to(m)
+    # 애견카페는 파란색 원형 마커 레이어로 추가 (x: 경도, y: 위도)
+    facility_layer(
+        dog_cafes_df, '애견카페', 'blue', FACILITY_POPUP, ['name', 'district'],
+        lat_col='y', lng_col='x', show=False, mode=render_mode
+    ).add_to(m)
     print(f'애견카페 {len(dog_cafes_df)}개를 지도에 추가했습니다.')
     
-    # 공원 마커들을 FeatureGroup으로 묶음
-    park_group = folium.FeatureGroup(name='공원', show=False)
-    
-    # 공원 마커 추가
-    for _, park in parks_df.iterrows():
-        name = park.get('name', '')
-        x = float(park.get('x', 0))  # 경도
-        y = float(park.get('y', 0))  # 위도
-        district = park.get('district', '')
-        
-        # 팝업 내용 구성
-        popup_html = f'''
-            <div style="width:200px">
-                <h4 style="margin-bottom:5px">{name}</h4>
-                <div style="font-size:0.9em; color:#666;">📍 {district} 소재</div>
-            </div>
-        '''
-        
-        # 초록색 원형 마커 추가
-        folium.CircleMarker(
-            location=[y, x],
-            radius=5,
-            color='green',
-            fill=True,
-            fill_color='green',
-            fill_opacity=0.7,
-            popup=folium.Popup(popup_html, max_width=250)
-        ).add_to(park_group)
-    
-    # 공원 그룹을 지도에 추가
-    park_group.add_to(m)
+    # 공원은 초록색 원형 마커 레이어로 추가
+    facility_layer(
+        parks_df, '공원', 'green', FACILITY_POPUP, ['name', 'district'],
+        lat_col='y', lng_col='x', show=False, mode=render_mode
+    ).add_to(m)
     print(f'공원 {len(parks_df)}개를 지도에 추가했습니다.')
     
 except Exception as e: